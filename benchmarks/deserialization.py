@@ -0,0 +1,94 @@
+"""Benchmark the deserialization of evaluation entries.
+
+Builds `EvaluationEntry` objects from payloads shaped like the ones returned by
+`GET /evaluations/{run_id}/results` and reports the throughput. Nested payloads
+of the entries are parsed lazily, use `--access-nested` to include their parsing.
+
+Usage:
+    python benchmarks/deserialization.py [--entries 100000] [--repeat 3] [--access-nested]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from giskard_hub.data.evaluation import EvaluationEntry
+
+
+def make_payload(index: int) -> dict:
+    return {
+        "id": f"entry_{index}",
+        "evaluation_id": "run_1",
+        "created_at": "2025-06-17T12:46:52.424Z",
+        "updated_at": "2025-06-17T12:47:03.118Z",
+        "status": "finished",
+        "chat_test_case": {
+            "id": f"ctc_{index}",
+            "created_at": "2025-06-10T08:00:00.000Z",
+            "updated_at": "2025-06-10T08:00:00.000Z",
+            "messages": [
+                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "user", "content": f"Question number {index}?"},
+            ],
+            "demo_output": {
+                "role": "assistant",
+                "content": "A demo answer.",
+                "metadata": {"source": "demo"},
+            },
+            "tags": ["benchmark", "synthetic"],
+            "checks": [
+                {
+                    "identifier": "correctness",
+                    "enabled": True,
+                    "assertions": [{"type": "correctness", "reference": "An answer."}],
+                }
+            ],
+        },
+        "output": {
+            "response": {"role": "assistant", "content": f"Answer number {index}."},
+            "metadata": {"latency_ms": 120},
+        },
+        "results": [
+            {"name": "correctness", "status": "finished", "passed": True},
+        ],
+        "failure_category": {
+            "category": {
+                "identifier": "hallucination",
+                "title": "Hallucination",
+                "description": "The answer contains made-up facts.",
+            },
+            "status": "finished",
+            "error": None,
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--access-nested", action="store_true")
+    args = parser.parse_args()
+
+    payloads = [make_payload(i) for i in range(args.entries)]
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            entry = EvaluationEntry.from_dict(payload)
+            if args.access_nested:
+                _ = entry.chat_test_case, entry.model_output, entry.failure_category
+        best = min(best, time.perf_counter() - start)
+
+    print(
+        f"{args.entries} entries in {best:.3f}s "
+        f"({args.entries / best:,.0f} entries/s, {best / args.entries * 1e6:.1f} us/entry)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
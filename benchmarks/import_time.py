@@ -0,0 +1,97 @@
+"""Benchmark the import time of the giskard_hub package.
+
+Each statement is run in fresh interpreters, so that nothing is cached in
+`sys.modules`. The median wall time is reported together with the heavy
+dependencies that were loaded.
+
+Usage:
+    python benchmarks/import_time.py [--runs 10] [--max-ms 150]
+
+With `--max-ms`, the script exits with an error if the median import time of
+`import giskard_hub` exceeds the given budget, so it can be used in CI to catch
+regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import giskard_hub",
+    "from giskard_hub import Dataset",
+    "from giskard_hub import HubClient",
+]
+
+HEAVY_MODULES = ["httpx", "rich", "dateutil"]
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "heavy": [m for m in {heavy!r} if m in sys.modules],
+    "modules": len(sys.modules),
+}}))
+"""
+
+
+def measure(statement: str, runs: int) -> dict:
+    results = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _PROBE.format(statement=statement, heavy=HEAVY_MODULES),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(output))
+
+    return {
+        "ms": statistics.median(r["ms"] for r in results),
+        "heavy": results[-1]["heavy"],
+        "modules": results[-1]["modules"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Fail if `import giskard_hub` takes longer than this (median).",
+    )
+    args = parser.parse_args()
+
+    # Warm up the bytecode cache so the first run is not an outlier
+    subprocess.run([sys.executable, "-c", STATEMENTS[-1]], check=True)
+
+    print(f"{'statement':<40} {'median (ms)':>12} {'modules':>8}  heavy deps")
+    measurements = {}
+    for statement in STATEMENTS:
+        result = measurements[statement] = measure(statement, args.runs)
+        print(
+            f"{statement:<40} {result['ms']:>12.1f} {result['modules']:>8}  "
+            f"{', '.join(result['heavy']) or '-'}"
+        )
+
+    if args.max_ms is not None and measurements[STATEMENTS[0]]["ms"] > args.max_ms:
+        print(f"\n`{STATEMENTS[0]}` exceeds the budget of {args.max_ms} ms")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Measure the memory used by the data classes of high-volume payloads.
+
+Reports the size of single instances (including their `__dict__`, if any), the
+memory allocated to deserialize evaluation entries, excluding the payloads, and
+the memory retained by entries decoded from a JSON response, with and without
+string interning.
+
+Usage:
+    python benchmarks/memory.py [--entries 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+
+from deserialization import make_payload
+
+from giskard_hub._intern import intern_strings
+from giskard_hub.data.chat import ChatMessage, ChatMessageWithMetadata
+from giskard_hub.data.chat_test_case import ChatTestCase
+from giskard_hub.data.evaluation import EvaluationEntry
+from giskard_hub.data.model import ModelOutput
+from giskard_hub.data.scan import ProbeAttempt, ReviewStatus, Severity
+from giskard_hub.data.task import TaskProgress, TaskStatus
+
+
+def instance_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=20_000)
+    args = parser.parse_args()
+
+    message = ChatMessage(role="user", content="Hello")
+    instances = [
+        message,
+        ChatMessageWithMetadata(role="assistant", content="Hi", metadata={}),
+        ModelOutput(message=message),
+        TaskProgress(status=TaskStatus.FINISHED, current=1, total=1),
+        ChatTestCase(messages=[message]),
+        EvaluationEntry(run_id="run_1", chat_test_case=ChatTestCase()),
+        ProbeAttempt(
+            probe_result_id="probe_1",
+            messages=[],
+            metadata={},
+            severity=Severity.SAFE,
+            review_status=ReviewStatus.PENDING,
+            reason="",
+        ),
+    ]
+
+    print(f"{'class':<28} {'bytes/instance':>15}")
+    for instance in instances:
+        print(f"{type(instance).__name__:<28} {instance_size(instance):>15}")
+
+    payloads = [make_payload(i) for i in range(args.entries)]
+    gc.collect()
+    tracemalloc.start()
+    entries = [EvaluationEntry.from_dict(payload) for payload in payloads]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"\n{len(entries)} evaluation entries: {allocated / 1e6:.1f} MB "
+        f"({allocated / len(entries):,.0f} bytes/entry)"
+    )
+    del entries
+
+    body = json.dumps({"items": payloads})
+    del payloads
+    for intern in (False, True):
+        retained = decoded_entries_size(body, intern=intern)
+        print(
+            f"Decoded from JSON, {'with' if intern else 'without'} interning: "
+            f"{retained / 1e6:.1f} MB ({retained / args.entries:,.0f} bytes/entry)"
+        )
+    return 0
+
+
+def decoded_entries_size(body: str, *, intern: bool) -> int:
+    """Return the memory retained by the entries decoded from a JSON body."""
+    gc.collect()
+    tracemalloc.start()
+    data = json.loads(body)
+    if intern:
+        intern_strings(data)
+    entries = [EvaluationEntry.from_dict(item) for item in data["items"]]
+    del data
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entries
+    return retained
+
+
+if __name__ == "__main__":
+    sys.exit(main())
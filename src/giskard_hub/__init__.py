@@ -1,9 +1,37 @@
 from __future__ import annotations
 
-from .client import HubClient
+from typing import TYPE_CHECKING
 
-# Import data module's __all__ to avoid duplication
-from .data import *
+from ._lazy import lazy_attributes
 from .data import __all__ as _data_all
 
-__all__ = ["HubClient"] + _data_all
+if TYPE_CHECKING:
+    from ._bulk import BulkResult
+    from ._connection import ConnectionOptions
+    from ._retry import RetryPolicy
+    from .client import AsyncHubClient, HubClient
+    from .data import *
+    from .resources._dataset_import import DatasetImportResult
+
+# Attributes are imported on first access, so that `import giskard_hub` stays
+# cheap and only the modules actually used are loaded
+_ATTRIBUTES = {
+    "HubClient": ".client",
+    "AsyncHubClient": ".client",
+    "RetryPolicy": "._retry",
+    "ConnectionOptions": "._connection",
+    "BulkResult": "._bulk",
+    "DatasetImportResult": ".resources._dataset_import",
+    **{name: ".data" for name in _data_all},
+}
+
+__all__ = [
+    "HubClient",
+    "AsyncHubClient",
+    "RetryPolicy",
+    "ConnectionOptions",
+    "BulkResult",
+    "DatasetImportResult",
+] + _data_all
+
+__getattr__, __dir__ = lazy_attributes(__name__, _ATTRIBUTES)
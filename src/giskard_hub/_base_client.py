@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from typing import Optional, Tuple
 
 import httpx
 
+from ._connection import ConnectionOptions
+from ._identity_map import IdentityMap
+from ._intern import intern_strings as intern_response_strings
+from ._json import JSONCodec, JSONCodecName, resolve_json_codec
+from ._retry import RetryPolicy, RetryStats
 from .errors import (
     HubAPIError,
     HubAuthenticationError,
@@ -13,21 +20,127 @@ from .errors import (
     HubValidationError,
 )
 
-_default_http_client_kwargs = {
-    "follow_redirects": True,
-    "timeout": httpx.Timeout(30.0),
-}
 
-
-class SyncClient:
-    _http: httpx.Client
-
-    def __init__(self, *, http_client: Optional[httpx.Client] = None):
-        self._http = http_client or httpx.Client(**_default_http_client_kwargs)
+def _make_http_client(client_cls, http_client, connection_options):
+    if http_client is None:
+        options = connection_options or ConnectionOptions()
+        return client_cls(**options.to_httpx_kwargs())
+
+    if connection_options is not None:
+        raise ValueError(
+            "`connection_options` cannot be used with a custom `http_client`, "
+            "configure the HTTP client directly instead."
+        )
+    return http_client
+
+
+class BaseClient:
+    """Transport-agnostic logic shared by the sync and async clients."""
+
+    _retry_policy: RetryPolicy = RetryPolicy()
+    _retry_stats: RetryStats
+    # None means the standard library, through httpx
+    _json_codec: Optional[JSONCodec] = None
+    _intern_strings: bool = False
+    _identity_map: Optional[IdentityMap] = None
+    # Whether resources return the decoded JSON instead of entities by default
+    raw_responses: bool = False
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """The retry policy applied to the requests."""
+        return self._retry_policy
+
+    @property
+    def identity_map(self) -> Optional[IdentityMap]:
+        """The map sharing the entities received by this client, if enabled."""
+        return self._identity_map
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Counters about the retries performed by this client."""
+        return self._retry_stats
+
+    def _retry_delay(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        attempt: int,
+        *,
+        error: Optional[Exception] = None,
+        response: Optional[httpx.Response] = None,
+        can_retry: bool = True,
+    ) -> Optional[float]:
+        """Return the delay before the next attempt, or None to stop retrying."""
+        policy = self._retry_policy
+        if error is not None:
+            delay = policy.retry_delay_for_error(method, error, attempt)
+            reason = type(error).__name__
+            retryable = isinstance(error, httpx.TransportError)
+        else:
+            delay = policy.retry_delay_for_response(method, response, attempt)
+            reason = str(response.status_code)
+            retryable = response.status_code in policy.retry_status_codes
+
+        if delay is not None and can_retry:
+            self.retry_stats.record_retry(reason, first=attempt == 1)
+            return delay
+
+        if retryable and attempt > 1:
+            self.retry_stats.record_exhausted()
+        return None
 
     def _headers(self):
         return {}
 
+    def _request_headers(self, kwargs) -> dict:
+        # For multipart uploads, don't override Content-Type header
+        headers = self._headers()
+        if "files" in kwargs:
+            # Remove Content-Type header for multipart uploads to let httpx set the boundary
+            headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
+        elif self._encode_json_body(kwargs):
+            headers = {"Content-Type": "application/json", **headers}
+        return headers
+
+    def _encode_json_body(self, kwargs) -> bool:
+        """Encode the `json` body with the fast JSON codec, if any.
+
+        Returns whether `kwargs` was updated with the encoded `content`.
+        """
+        codec = self._json_codec
+        if codec is None or kwargs.get("json") is None:
+            return False
+
+        try:
+            content = codec.encode(kwargs["json"])
+        except Exception:  # pylint: disable=broad-exception-caught
+            # httpx encodes it with the standard library, giving the usual error
+            return False
+
+        del kwargs["json"]
+        kwargs["content"] = content
+        return True
+
+    def _decode_json(self, res: httpx.Response):
+        data = self._decode_json_body(res)
+        if self._intern_strings:
+            # Share a single object per distinct role, tag, id... between the
+            # items of large result sets
+            data = intern_response_strings(data)
+        return data
+
+    def _decode_json_body(self, res: httpx.Response):
+        codec = self._json_codec
+        if codec is not None:
+            try:
+                return codec.decode(res.content)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Values the codec rejects (e.g. NaN literals or a non UTF-8
+                # charset) are decoded, or reported, by the standard library
+                pass
+
+        return res.json()
+
     def _extract_error_message(self, response: httpx.Response, default_msg: str) -> str:
         """Extract error message from response, falling back to default_msg if not found"""
         try:
@@ -52,26 +165,7 @@ class SyncClient:
 
         return error_message, fields_str
 
-    def _request(self, method: str, path: str, *, cast_to=None, **kwargs):
-        # For multipart uploads, don't override Content-Type header
-        headers = self._headers()
-        if "files" in kwargs:
-            # Remove Content-Type header for multipart uploads to let httpx set the boundary
-            headers = {k: v for k, v in headers.items() if k.lower() != "content-type"}
-
-        try:
-            res = self._http.request(
-                method=method,
-                url=path,
-                headers=headers,
-                **kwargs,
-            )
-        except Exception as e:
-            raise HubAPIError(
-                f"Unexpected error while making HTTP request: {str(e)}",
-                response_text=str(e),
-            ) from e
-
+    def _process_response(self, res: httpx.Response, *, cast_to=None):
         # Handle authentication errors
         if res.status_code == 401:
             raise HubAuthenticationError(
@@ -116,7 +210,7 @@ class SyncClient:
 
         # Parse response JSON
         try:
-            data = res.json()
+            data = self._decode_json(res)
         except json.JSONDecodeError as e:
             raise HubJSONDecodeError(
                 f"Failed to decode API response as JSON: {str(e)}",
@@ -136,6 +230,73 @@ class SyncClient:
 
         return data
 
+    def _cast_data_to(self, cast_to, data):
+        if isinstance(data, list):
+            return [cast_to.from_dict(d, _client=self) for d in data]
+
+        return cast_to.from_dict(data, _client=self)
+
+
+class SyncClient(BaseClient):
+    _http: httpx.Client
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        http_client: Optional[httpx.Client] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        json_codec: JSONCodecName = "auto",
+        intern_strings: bool = False,
+        identity_map_size: int = 0,
+        raw_responses: bool = False,
+    ):
+        self._http = _make_http_client(httpx.Client, http_client, connection_options)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._retry_stats = RetryStats()
+        self._json_codec = resolve_json_codec(json_codec)
+        self._intern_strings = intern_strings
+        if identity_map_size:
+            self._identity_map = IdentityMap(identity_map_size)
+        self.raw_responses = raw_responses
+
+    def _prepare(self):
+        """Hook called before every request, e.g. to validate the connection."""
+
+    def _request(self, method: str, path: str, *, cast_to=None, **kwargs):
+        self._prepare()
+
+        headers = self._request_headers(kwargs)
+        # Uploaded files are consumed by the first attempt and cannot be replayed
+        can_retry = "files" not in kwargs
+
+        attempt = 1
+        while True:
+            try:
+                res = self._http.request(
+                    method=method,
+                    url=path,
+                    headers=headers,
+                    **kwargs,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                delay = self._retry_delay(method, attempt, error=e, can_retry=can_retry)
+                if delay is None:
+                    raise HubAPIError(
+                        f"Unexpected error while making HTTP request: {str(e)}",
+                        response_text=str(e),
+                    ) from e
+            else:
+                delay = self._retry_delay(
+                    method, attempt, response=res, can_retry=can_retry
+                )
+                if delay is None:
+                    return self._process_response(res, cast_to=cast_to)
+                res.close()
+
+            time.sleep(delay)
+            attempt += 1
+
     def get(self, path: str, **kwargs):
         return self._request("GET", path, **kwargs)
 
@@ -161,8 +322,89 @@ class SyncClient:
     def __del__(self):
         self.close()
 
-    def _cast_data_to(self, cast_to, data):
-        if isinstance(data, list):
-            return [cast_to.from_dict(d, _client=self) for d in data]
 
-        return cast_to.from_dict(data, _client=self)
+class AsyncClient(BaseClient):
+    _http: httpx.AsyncClient
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        http_client: Optional[httpx.AsyncClient] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        json_codec: JSONCodecName = "auto",
+        intern_strings: bool = False,
+        identity_map_size: int = 0,
+        raw_responses: bool = False,
+    ):
+        self._http = _make_http_client(
+            httpx.AsyncClient, http_client, connection_options
+        )
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._retry_stats = RetryStats()
+        self._json_codec = resolve_json_codec(json_codec)
+        self._intern_strings = intern_strings
+        if identity_map_size:
+            self._identity_map = IdentityMap(identity_map_size)
+        self.raw_responses = raw_responses
+
+    async def _prepare(self):
+        """Hook awaited before every request, e.g. to validate the connection."""
+
+    async def _request(self, method: str, path: str, *, cast_to=None, **kwargs):
+        await self._prepare()
+
+        headers = self._request_headers(kwargs)
+        # Uploaded files are consumed by the first attempt and cannot be replayed
+        can_retry = "files" not in kwargs
+
+        attempt = 1
+        while True:
+            try:
+                res = await self._http.request(
+                    method=method,
+                    url=path,
+                    headers=headers,
+                    **kwargs,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                delay = self._retry_delay(method, attempt, error=e, can_retry=can_retry)
+                if delay is None:
+                    raise HubAPIError(
+                        f"Unexpected error while making HTTP request: {str(e)}",
+                        response_text=str(e),
+                    ) from e
+            else:
+                delay = self._retry_delay(
+                    method, attempt, response=res, can_retry=can_retry
+                )
+                if delay is None:
+                    return self._process_response(res, cast_to=cast_to)
+                await res.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, path: str, **kwargs):
+        return await self._request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs):
+        return await self._request("POST", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs):
+        return await self._request("PATCH", path, **kwargs)
+
+    async def put(self, path: str, **kwargs):
+        return await self._request("PUT", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs):
+        return await self._request("DELETE", path, **kwargs)
+
+    async def close(self):
+        await self._http.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+I = TypeVar("I")
+R = TypeVar("R")
+
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[I, R]):
+    """Outcome of one item of a bulk operation.
+
+    Attributes
+    ----------
+    item : Any
+        The item given to the bulk operation.
+    result : Any, optional
+        The result of the request made for the item, None if it failed.
+    error : Exception, optional
+        The error raised for the item, None if it succeeded: usually a
+        `HubAPIError` raised by the Hub, or a `ValueError` for an invalid item.
+    """
+
+    item: I
+    result: Optional[R] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request made for the item succeeded."""
+        return self.error is None
+
+
+def validate_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+
+
+def chunked(items: Iterable[I], size: int) -> Iterator[List[I]]:
+    """Split the items in lists of at most `size` items."""
+    if size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _call(fn: Callable[[I], R], item: I) -> BulkResult[I, R]:
+    try:
+        return BulkResult(item, result=fn(item))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return BulkResult(item, error=e)
+
+
+def run_bulk(
+    fn: Callable[[I], R], items: Iterable[I], *, concurrency: int
+) -> List[BulkResult[I, R]]:
+    """Call `fn` on each item, with at most `concurrency` calls in flight.
+
+    The items are consumed as the calls complete, so that large iterables are
+    never materialized as a whole: a new call starts as soon as any call in
+    flight completes. Errors raised for an item are reported in its result
+    instead of aborting the other calls.
+
+    Parameters
+    ----------
+    fn : Callable
+        The function making the request for one item.
+    items : Iterable
+        The items to process.
+    concurrency : int
+        Maximum number of calls in flight.
+
+    Returns
+    -------
+    List[BulkResult]
+        The outcome of each item, in the order of the items.
+    """
+    validate_concurrency(concurrency)
+    if concurrency == 1:
+        return [_call(fn, item) for item in items]
+
+    # Results by index of their item, filled in as the calls complete
+    results: List[Any] = []
+    pending: Dict[Future, int] = {}
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="giskard-hub-bulk"
+    ) as pool:
+        for index, item in enumerate(items):
+            if len(pending) >= concurrency:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+            results.append(None)
+            pending[pool.submit(_call, fn, item)] = index
+        for future in wait(pending).done:
+            results[pending[future]] = future.result()
+    return results
+
+
+async def arun_bulk(
+    fn: Callable[[I], Awaitable[R]], items: Iterable[I], *, concurrency: int
+) -> List[BulkResult[I, R]]:
+    """Async version of `run_bulk`, running the calls concurrently in tasks."""
+    validate_concurrency(concurrency)
+
+    async def call(item: I) -> BulkResult[I, R]:
+        try:
+            return BulkResult(item, result=await fn(item))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return BulkResult(item, error=e)
+
+    results: List[Any] = []
+    pending: Dict[asyncio.Future, int] = {}
+    try:
+        for index, item in enumerate(items):
+            if len(pending) >= concurrency:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    results[pending.pop(task)] = task.result()
+            results.append(None)
+            pending[asyncio.ensure_future(call(item))] = index
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            for task in done:
+                results[pending.pop(task)] = task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+    return results
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import importlib.util
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+
+@dataclass(frozen=True)
+class ConnectionOptions:  # pylint: disable=too-many-instance-attributes
+    """Connection pool and timeout options of the underlying HTTP client.
+
+    The defaults allow up to 100 concurrent connections and keep idle ones
+    open for 30 seconds, so that bursts of requests (e.g. concurrent local
+    evaluations or bulk uploads) reuse existing connections instead of paying
+    a new TLS handshake.
+
+    Attributes
+    ----------
+    max_connections : int, optional
+        Maximum number of concurrent connections. None means no limit.
+    max_keepalive_connections : int, optional
+        Maximum number of idle connections kept open in the pool.
+    keepalive_expiry : float, optional
+        Time in seconds after which an idle connection is closed.
+    connect_timeout : float, optional
+        Timeout in seconds to establish a connection.
+    read_timeout : float, optional
+        Timeout in seconds to receive a chunk of the response.
+    write_timeout : float, optional
+        Timeout in seconds to send a chunk of the request.
+    pool_timeout : float, optional
+        Timeout in seconds to acquire a connection from the pool.
+    http2 : bool
+        Whether to enable HTTP/2, multiplexing concurrent requests over a
+        single connection. Requires the `http2` extra
+        (`pip install "giskard-hub[http2]"`).
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 20
+    keepalive_expiry: Optional[float] = 30.0
+    connect_timeout: Optional[float] = 30.0
+    read_timeout: Optional[float] = 30.0
+    write_timeout: Optional[float] = 30.0
+    pool_timeout: Optional[float] = 30.0
+    http2: bool = False
+
+    def __post_init__(self):
+        if self.max_connections is not None and self.max_connections < 1:
+            raise ValueError("max_connections must be at least 1.")
+        if (
+            self.max_keepalive_connections is not None
+            and self.max_keepalive_connections < 0
+        ):
+            raise ValueError("max_keepalive_connections must not be negative.")
+
+    def to_httpx_kwargs(self) -> Dict[str, Any]:
+        """Return the keyword arguments to build an `httpx` client."""
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 support requires the `h2` package. "
+                'Install it with `pip install "giskard-hub[http2]"`.'
+            )
+
+        return {
+            "follow_redirects": True,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.write_timeout,
+                pool=self.pool_timeout,
+            ),
+            "http2": self.http2,
+        }
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
-from typing import Callable, List
+import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, List, Optional, TypeVar
 
 from .data.chat import ChatMessage
-from .data.model import ModelOutput
+from .data.model import ExecutionError, ModelOutput
+
+T = TypeVar("T")
+
+# A local evaluation is aborted once the model failed on this many entries in a row
+MAX_CONSECUTIVE_MODEL_FAILURES = 5
 
 
 class LocalModel:
+    """Base class for local models.
+
+    Subclasses implement `__call__`, either as a regular method or as a
+    coroutine (`async def __call__`) for models relying on async clients.
+    """
+
     def __init__(self, *, name: str, description: str):
         self.name = name
         self.description = description
@@ -16,9 +31,19 @@ class LocalModel:
             "This method needs to be implemented by the subclass."
         )
 
+    @property
+    def is_async(self) -> bool:
+        """Whether calling the model returns a coroutine."""
+        return inspect.iscoroutinefunction(self.__call__)
+
     @staticmethod
     def from_callable(callable_fn: Callable) -> "LocalModel":
-        return CallableLocalModel(
+        model_cls = (
+            AsyncCallableLocalModel
+            if _is_coroutine_callable(callable_fn)
+            else CallableLocalModel
+        )
+        return model_cls(
             name=callable_fn.__name__,
             description=callable_fn.__doc__ or "",
             callable_fn=_validate_callable(callable_fn),
@@ -38,11 +63,28 @@ class CallableLocalModel(LocalModel):
 
     def __call__(self, messages: List[ChatMessage], **kwargs) -> ModelOutput:
         output = self._callable(messages, **kwargs)
+        return _to_model_output(output)
+
+
+class AsyncCallableLocalModel(CallableLocalModel):
+    async def __call__(  # pylint: disable=invalid-overridden-method
+        self, messages: List[ChatMessage], **kwargs
+    ) -> ModelOutput:
+        output = await self._callable(messages, **kwargs)
+        return _to_model_output(output)
+
 
-        if isinstance(output, ModelOutput):
-            return output
+def _to_model_output(output) -> ModelOutput:
+    if isinstance(output, ModelOutput):
+        return output
 
-        return ModelOutput(message=ChatMessage(role="assistant", content=str(output)))
+    return ModelOutput(message=ChatMessage(role="assistant", content=str(output)))
+
+
+def _is_coroutine_callable(callable_fn: Callable) -> bool:
+    return inspect.iscoroutinefunction(callable_fn) or inspect.iscoroutinefunction(
+        getattr(callable_fn, "__call__", None)
+    )
 
 
 def _validate_callable(callable_fn: Callable) -> Callable:
@@ -50,3 +92,102 @@ def _validate_callable(callable_fn: Callable) -> Callable:
         raise ValueError("The callable needs to have a name.")
 
     return callable_fn
+
+
+def _errored_output(error: Exception) -> ModelOutput:
+    return ModelOutput(
+        error=ExecutionError(message=str(error), details={"type": type(error).__name__})
+    )
+
+
+class ModelFailures:
+    """Track the consecutive failures of a local model during an evaluation.
+
+    An error of the model is isolated to its entry, which is submitted as
+    errored. A broken or misconfigured model fails on every entry though: once
+    it failed on `max_consecutive` entries in a row, the evaluation is aborted
+    with its last error.
+    """
+
+    def __init__(self, max_consecutive: int = MAX_CONSECUTIVE_MODEL_FAILURES):
+        self.max_consecutive = max_consecutive
+        self.consecutive = 0
+        self.error: Optional[Exception] = None
+        self._lock = threading.Lock()
+
+    @property
+    def aborted(self) -> bool:
+        return self.error is not None
+
+    def record(self, error: Optional[Exception] = None) -> bool:
+        """Record the outcome of a model call, returning whether to abort."""
+        with self._lock:
+            if error is None:
+                self.consecutive = 0
+            else:
+                self.consecutive += 1
+                if self.error is None and self.consecutive >= self.max_consecutive:
+                    self.error = error
+            return self.aborted
+
+    def raise_if_aborted(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+
+def run_local_model(
+    model: LocalModel, messages: List[ChatMessage], failures: ModelFailures
+) -> Optional[ModelOutput]:
+    """Call the local model, turning its exceptions into an errored `ModelOutput`.
+
+    Returns None, without calling the model, once the evaluation is aborted
+    because of too many consecutive failures (see `ModelFailures`).
+    """
+    if failures.aborted:
+        return None
+
+    try:
+        output = model(messages)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return None if failures.record(e) else _errored_output(e)
+
+    failures.record()
+    return output
+
+
+async def arun_local_model(
+    model: LocalModel, messages: List[ChatMessage], failures: ModelFailures
+) -> Optional[ModelOutput]:
+    """Async version of `run_local_model`.
+
+    Async models are awaited on the running event loop, synchronous ones are
+    run in a worker thread.
+    """
+    if not model.is_async:
+        return await asyncio.to_thread(run_local_model, model, messages, failures)
+
+    if failures.aborted:
+        return None
+
+    try:
+        output = await model(messages)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return None if failures.record(e) else _errored_output(e)
+
+    failures.record()
+    return output
+
+
+def run_coroutine_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    If an event loop is already running in the current thread (e.g. in a
+    Jupyter notebook), the coroutine is run on a new loop in a separate thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
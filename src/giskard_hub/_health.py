@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Time of the last successful health check of each Hub, shared by all clients
+# of the process
+_checked_at: Dict[str, float] = {}
+_lock = threading.Lock()
+
+
+def health_cache_key(hub_url: str, auto_add_api_suffix: bool) -> str:
+    # Without the suffix the health data is validated more strictly, so a check
+    # done with the suffix does not stand for one done without it
+    return f"{hub_url}|{'api' if auto_add_api_suffix else 'strict'}"
+
+
+def _read_cache_file(path: Path) -> Dict[str, float]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    return {k: v for k, v in data.items() if isinstance(v, (int, float))}
+
+
+def _write_cache_file(path: Path, key: str, checked_at: float) -> None:
+    data = _read_cache_file(path)
+    data[key] = checked_at
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent processes never read
+        # a partially written cache
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The disk cache is best effort
+        pass
+
+
+def is_health_cached(
+    key: str, ttl: float, cache_file: Optional[str | Path] = None
+) -> bool:
+    """Return whether the Hub had a successful health check less than `ttl` seconds ago."""
+    if ttl <= 0:
+        return False
+
+    now = time.time()
+    with _lock:
+        checked_at = _checked_at.get(key)
+    if checked_at is not None and now - checked_at < ttl:
+        return True
+
+    if cache_file is None:
+        return False
+
+    checked_at = _read_cache_file(Path(cache_file)).get(key)
+    if checked_at is None or now - checked_at >= ttl:
+        return False
+
+    with _lock:
+        _checked_at[key] = max(_checked_at.get(key, 0.0), checked_at)
+    return True
+
+
+def record_health(key: str, cache_file: Optional[str | Path] = None) -> None:
+    """Record a successful health check of the Hub."""
+    now = time.time()
+    with _lock:
+        _checked_at[key] = now
+
+    if cache_file is not None:
+        _write_cache_file(Path(cache_file), key, now)
+
+
+def clear_health_cache() -> None:
+    """Forget the health checks recorded in memory."""
+    with _lock:
+        _checked_at.clear()
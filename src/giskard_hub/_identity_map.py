@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple, Type, TypeVar
+
+if TYPE_CHECKING:
+    from .data._entity import Entity
+
+E = TypeVar("E", bound="Entity")
+
+
+class IdentityMap:
+    """Map of the entities received by a client, keyed by type and id.
+
+    Entities received several times (e.g. the model of each evaluation run of
+    a project) resolve to a single instance, updated with the latest data
+    received. The least recently received entities are evicted once the map
+    holds `maxsize` entities.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entities kept in the map.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        self.maxsize = maxsize
+        self._entities: OrderedDict[Tuple[type, str], "Entity"] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, entity: E, names: Optional[Iterable[str]] = None) -> E:
+        """Return the instance representing the entity.
+
+        If an entity of the same type and id is already in the map, it is
+        updated with the data of `entity` and returned. Otherwise, `entity` is
+        added to the map and returned. Entities without id are returned as is.
+
+        If `names` is given, only the fields with these names are updated, so
+        that partial payloads (e.g. the summary of a model nested in an
+        evaluation) do not erase the fields of an entity received in full.
+        """
+        if entity.id is None:
+            return entity
+
+        key = (type(entity), entity.id)
+        with self._lock:
+            existing = self._entities.get(key)
+            if existing is None:
+                self._entities[key] = entity
+                if len(self._entities) > self.maxsize:
+                    self._entities.popitem(last=False)
+                return entity
+
+            self._entities.move_to_end(key)
+            if existing is not entity:
+                existing._hydrate(entity, names)  # pylint: disable=protected-access
+            return existing
+
+    def get(self, entity_cls: Type[E], entity_id: str) -> Optional[E]:
+        """Return the entity of the given type and id, if it is in the map."""
+        with self._lock:
+            return self._entities.get((entity_cls, entity_id))
+
+    def clear(self) -> None:
+        """Remove all the entities from the map."""
+        with self._lock:
+            self._entities.clear()
+
+    def __len__(self) -> int:
+        return len(self._entities)
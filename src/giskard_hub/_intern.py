@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from sys import intern
+from typing import Any, FrozenSet
+
+# Keys whose values take few distinct values across the items of large result
+# sets (entries, test cases, attempts), e.g. message roles, tags, check
+# identifiers and the ids of the parent objects
+INTERNED_KEYS: FrozenSet[str] = frozenset(
+    {
+        "role",
+        "tags",
+        "identifier",
+        "type",
+        "status",
+        "state",
+        "severity",
+        "review_status",
+        "run_id",
+        "probe_result_id",
+        "dataset_id",
+        "project_id",
+        "model_id",
+        "evaluation_id",
+        "scan_id",
+        "knowledge_base_id",
+        "topic_id",
+    }
+)
+
+# Longer values are unlikely to be repeated, and are left as is
+MAX_INTERNED_LENGTH = 128
+
+
+def intern_strings(data: Any, keys: FrozenSet[str] = INTERNED_KEYS) -> Any:
+    """Intern, in place, the strings found under the given keys of decoded JSON.
+
+    Items of large result sets then share a single string object per distinct
+    value (e.g. `"user"` or a run id) instead of holding one copy each.
+
+    Parameters
+    ----------
+    data : Any
+        The decoded JSON data, updated in place.
+    keys : FrozenSet[str], optional
+        The keys whose string values, or lists of strings, are interned.
+
+    Returns
+    -------
+    Any
+        The same data.
+    """
+    stack = [data]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node = pop()
+        if node.__class__ is list:
+            for item in node:
+                if item.__class__ is dict or item.__class__ is list:
+                    push(item)
+            continue
+
+        if node.__class__ is not dict:
+            continue
+
+        for key, value in node.items():
+            cls = value.__class__
+            if cls is str:
+                if key in keys and len(value) <= MAX_INTERNED_LENGTH:
+                    node[key] = intern(value)
+            elif cls is dict:
+                push(value)
+            elif cls is list:
+                if key in keys:
+                    value[:] = [_maybe_intern(item) for item in value]
+                push(value)
+
+    return data
+
+
+def _maybe_intern(value: Any) -> Any:
+    if value.__class__ is str and len(value) <= MAX_INTERNED_LENGTH:
+        return intern(value)
+    return value
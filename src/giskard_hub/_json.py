@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Literal, Optional
+
+JSONCodecName = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+# Range of the integers encoded and decoded as such by the fast codecs
+_MIN_INT = -(2**63)
+_MAX_INT = 2**64 - 1
+
+# Maximum nesting of the values encoded by the fast codecs (as orjson)
+_MAX_DEPTH = 254
+
+# Maps the digits to b"0" and the other bytes to b" ", to look for long numbers
+_DIGITS_TABLE = bytes(
+    ord("0") if ord("0") <= i <= ord("9") else ord(" ") for i in range(256)
+)
+
+# Numbers with this many digits may not fit in 64 bits
+_LONG_NUMBER = b"0" * 19
+
+
+def is_plain_json(obj: Any) -> bool:
+    """Whether the fast codecs encode `obj` exactly as the standard library.
+
+    Only dicts with string keys, lists, tuples, strings, booleans, None,
+    finite floats and 64-bit integers are accepted: the fast codecs encode
+    other values (e.g. NaN, datetimes or subclasses) differently, or reject
+    them. Request bodies are small, so that walking them is cheap.
+    """
+    stack = [(obj, 0)]
+    while stack:
+        value, depth = stack.pop()
+        cls = value.__class__
+        if cls is str or cls is bool or value is None:
+            continue
+        if cls is int:
+            if not _MIN_INT <= value <= _MAX_INT:
+                return False
+        elif cls is float:
+            if not math.isfinite(value):
+                return False
+        elif depth >= _MAX_DEPTH:
+            # Also stops on circular references, reported by the standard library
+            return False
+        elif cls is dict:
+            for key, item in value.items():
+                if key.__class__ is not str:
+                    return False
+                stack.append((item, depth + 1))
+        elif cls is list or cls is tuple:
+            stack.extend((item, depth + 1) for item in value)
+        else:
+            return False
+    return True
+
+
+def has_long_numbers(content: bytes) -> bool:
+    """Whether the JSON `content` may hold integers that do not fit in 64 bits."""
+    return _LONG_NUMBER in content.translate(_DIGITS_TABLE)
+
+
+class JSONCodec(ABC):
+    """Fast JSON codec used in place of the standard library.
+
+    The codecs raise `ValueError` for the values they would not encode or
+    decode exactly as the standard library, and the client then falls back to
+    the standard library, so that results and errors stay the same.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode(self, obj: Any) -> bytes:
+        """Encode a request body to compact UTF-8 JSON."""
+
+    @abstractmethod
+    def decode(self, content: bytes) -> Any:
+        """Decode a response body."""
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec based on orjson.
+
+    Unlike the standard library, orjson encodes NaN and infinity as `null`
+    and decodes integers that do not fit in 64 bits as floats: such values are
+    left to the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        orjson = self._orjson = importlib.import_module("orjson")
+        # Let the standard library handle the values it would not encode itself
+        # (or would encode differently), so that the fallback raises the same errors
+        self._option = (
+            orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        )
+
+    def encode(self, obj: Any) -> bytes:
+        if not is_plain_json(obj):
+            raise ValueError("The value is left to the standard library.")
+        return self._orjson.dumps(obj, option=self._option)
+
+    def decode(self, content: bytes) -> Any:
+        if has_long_numbers(content):
+            raise ValueError("The content is left to the standard library.")
+        return self._orjson.loads(content)
+
+
+class MsgspecCodec(JSONCodec):
+    """JSON codec based on msgspec.
+
+    Unlike the standard library, msgspec encodes NaN and infinity as `null`,
+    and natively encodes values such as datetimes, dataclasses and enums: such
+    values are left to the standard library.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        msgspec = importlib.import_module("msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> bytes:
+        if not is_plain_json(obj):
+            raise ValueError("The value is left to the standard library.")
+        return self._encoder.encode(obj)
+
+    def decode(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+
+_CODECS = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+
+def resolve_json_codec(name: JSONCodecName = "auto") -> Optional[JSONCodec]:
+    """Return the JSON codec with the given name.
+
+    Parameters
+    ----------
+    name : str
+        `"orjson"` or `"msgspec"` to use the corresponding library, `"stdlib"`
+        for the standard library, or `"auto"` to use the first of orjson and
+        msgspec that is installed, and the standard library otherwise.
+
+    Returns
+    -------
+    Optional[JSONCodec]
+        The codec, or None for the standard library.
+    """
+    if name == "stdlib":
+        return None
+
+    if name == "auto":
+        for codec_name, codec_cls in _CODECS.items():
+            if importlib.util.find_spec(codec_name) is not None:
+                return codec_cls()
+        return None
+
+    codec_cls = _CODECS.get(name)
+    if codec_cls is None:
+        raise ValueError(
+            f"Unknown JSON codec {name!r}, expected one of: auto, stdlib, "
+            + ", ".join(_CODECS)
+        )
+
+    if importlib.util.find_spec(name) is None:
+        raise ImportError(
+            f"The {name!r} JSON codec requires the `{name}` package. "
+            f'Install it with `pip install "giskard-hub[{name}]"`.'
+        )
+
+    return codec_cls()
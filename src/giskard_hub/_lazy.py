@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Return the `__getattr__` and `__dir__` functions of a lazy package.
+
+    Each attribute is imported from its module on first access and then stored
+    in the package namespace, so the lookup only happens once.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, i.e. its `__name__`.
+    attributes : Dict[str, str]
+        Mapping of the attribute names to the (relative) module defining them.
+
+    Returns
+    -------
+    Tuple[Callable[[str], object], Callable[[], List[str]]]
+        The module-level `__getattr__` and `__dir__` functions.
+    """
+
+    def __getattr__(name: str):
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
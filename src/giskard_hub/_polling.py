@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Optional, Tuple
+
+
+class AdaptivePoller:
+    """Schedule the polls of a running task from its progress.
+
+    Polling starts every `min_interval` seconds and backs off exponentially
+    while the progress does not change. Once the `current`/`total` progress
+    advances, the completion rate observed since the first poll predicts the
+    remaining time, and the next poll is scheduled around the estimated finish
+    time. Short tasks are thus noticed quickly, while long ones are not polled
+    needlessly.
+
+    Parameters
+    ----------
+    min_interval : float
+        Minimum delay in seconds between two polls.
+    max_interval : float
+        Maximum delay in seconds between two polls.
+    backoff_factor : float
+        Factor applied to the delay after each poll without progress.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+    ):
+        if min_interval <= 0:
+            raise ValueError("min_interval must be positive.")
+        if max_interval < min_interval:
+            raise ValueError("max_interval must be at least min_interval.")
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must be at least 1.")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+
+        self._interval = min_interval
+        # Time and progress of the first poll with a progress, and last progress
+        self._first: Optional[Tuple[float, float]] = None
+        self._last_current: Optional[float] = None
+
+    def next_delay(self, progress: Any, now: Optional[float] = None) -> float:
+        """Return the delay in seconds before the next poll.
+
+        Parameters
+        ----------
+        progress : TaskProgress, optional
+            The progress of the task returned by the last poll.
+        now : float, optional
+            The time of the last poll, as given by `time.perf_counter`.
+
+        Returns
+        -------
+        float
+            The delay before the next poll.
+        """
+        now = time.perf_counter() if now is None else now
+
+        backoff_delay = self._interval
+        self._interval = min(self.max_interval, self._interval * self.backoff_factor)
+
+        current = getattr(progress, "current", None)
+        total = getattr(progress, "total", None)
+        if not isinstance(current, (int, float)) or not isinstance(total, (int, float)):
+            return backoff_delay
+
+        if self._first is None or current < self._first[1]:
+            # First progress seen (or the task restarted): no rate known yet
+            self._first = (now, current)
+            self._last_current = current
+            return backoff_delay
+
+        advanced = current > self._last_current
+        self._last_current = current
+        first_time, first_current = self._first
+        if not advanced or now <= first_time:
+            return backoff_delay
+
+        rate = (current - first_current) / (now - first_time)
+        remaining = max(total - current, 0) / rate
+        delay = min(max(remaining, self.min_interval), self.max_interval)
+
+        # If the task is not done by then, back off from the predicted delay
+        self._interval = min(self.max_interval, delay * self.backoff_factor)
+        return delay
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+
+import httpx
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+# These errors are raised before the request is sent, so retrying them is safe
+# whatever the HTTP method is.
+_CONNECTION_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:  # pylint: disable=too-many-instance-attributes
+    """Retry policy applied to the requests made by the client.
+
+    Failed requests are retried with an exponential backoff: the n-th retry
+    waits `min(backoff_max, backoff_base * 2 ** (n - 1))` seconds, reduced by a
+    random factor of up to `jitter` to avoid synchronized retries.
+
+    Attributes
+    ----------
+    max_attempts : int
+        Maximum number of attempts per request, including the first one. Use 1
+        to disable retries.
+    backoff_base : float
+        Delay in seconds before the first retry.
+    backoff_max : float
+        Maximum delay in seconds between two attempts.
+    jitter : float
+        Fraction (between 0 and 1) of the delay that is randomized.
+    retry_status_codes : FrozenSet[int]
+        Response status codes that trigger a retry.
+    retry_methods : FrozenSet[str]
+        HTTP methods that are retried on transient errors. By default only
+        idempotent methods are retried. Connection errors, raised before the
+        request is sent, are retried for all methods.
+    respect_retry_after : bool
+        Whether to wait for the delay given by the `Retry-After` header of
+        429 and 503 responses instead of the backoff delay.
+    max_retry_after : float
+        Maximum `Retry-After` delay in seconds. The request is not retried if
+        the server asks to wait longer.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: float = 0.5
+    retry_status_codes: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    retry_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1.")
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Return the delay to wait before retrying after the given attempt."""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def retry_delay_for_error(
+        self, method: str, error: Exception, attempt: int
+    ) -> Optional[float]:
+        """Return the delay before retrying a request that raised, or None."""
+        if attempt >= self.max_attempts:
+            return None
+
+        if isinstance(error, _CONNECTION_ERRORS) or (
+            isinstance(error, httpx.TransportError)
+            and method.upper() in self.retry_methods
+        ):
+            return self.backoff_delay(attempt)
+
+        return None
+
+    def retry_delay_for_response(
+        self, method: str, response: httpx.Response, attempt: int
+    ) -> Optional[float]:
+        """Return the delay before retrying a request given its response, or None."""
+        if attempt >= self.max_attempts:
+            return None
+
+        if (
+            response.status_code not in self.retry_status_codes
+            or method.upper() not in self.retry_methods
+        ):
+            return None
+
+        if self.respect_retry_after and response.status_code in (
+            RETRY_AFTER_STATUS_CODES
+        ):
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+
+        return self.backoff_delay(attempt)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a `Retry-After` header, given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryStats:
+    """Counters about the retries performed by a client, for monitoring.
+
+    Attributes
+    ----------
+    retries : int
+        Total number of retried attempts.
+    retried_requests : int
+        Number of requests that needed at least one retry.
+    exhausted : int
+        Number of requests that still failed after the last retry.
+    reasons : Dict[str, int]
+        Number of retries per reason (status code or exception name).
+    """
+
+    retries: int = 0
+    retried_requests: int = 0
+    exhausted: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def record_retry(self, reason: str, *, first: bool) -> None:
+        with self._lock:
+            self.retries += 1
+            if first:
+                self.retried_requests += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def reset(self) -> None:
+        """Reset all the counters."""
+        with self._lock:
+            self.retries = 0
+            self.retried_requests = 0
+            self.exhausted = 0
+            self.reasons = {}
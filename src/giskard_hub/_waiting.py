@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ._polling import AdaptivePoller
+
+if TYPE_CHECKING:
+    from .client import HubClient
+    from .data._entity import EntityWithTaskProgress
+
+# Resources whose `list(project_id, raw=...)` returns the entities of a project,
+# refreshing several of them with a single request
+_LISTABLE_RESOURCES = frozenset({"evaluations", "scans"})
+
+# Minimum number of pending entities of a project refreshed with a list request
+LIST_REFRESH_MIN_PENDING = 8
+
+# Maximum number of entities listed per pending entity for a list request to be
+# cheaper than retrieving the pending entities one by one
+LIST_REFRESH_MAX_RATIO = 4
+
+
+def _use_list(num_pending: int, project_size: Optional[int]) -> bool:
+    # The size of a project is only known once it was listed: a project is
+    # listed once, then only while it is small enough for its pending entities
+    if num_pending < LIST_REFRESH_MIN_PENDING:
+        return False
+    return project_size is None or project_size <= num_pending * LIST_REFRESH_MAX_RATIO
+
+
+def _refresh_all(
+    client: "HubClient",
+    pending: List["EntityWithTaskProgress"],
+    project_sizes: Dict[Tuple[str, str], int],
+):
+    groups: Dict[Tuple[str, Optional[str]], List["EntityWithTaskProgress"]] = (
+        defaultdict(list)
+    )
+    for entity in pending:
+        project_id = getattr(entity, "project_id", None)
+        if entity.resource in _LISTABLE_RESOURCES and project_id:
+            groups[(entity.resource, project_id)].append(entity)
+        else:
+            groups[(entity.resource, None)].append(entity)
+
+    for (resource, project_id), entities in groups.items():
+        if project_id is None or not _use_list(
+            len(entities), project_sizes.get((resource, project_id))
+        ):
+            for entity in entities:
+                entity.refresh()
+            continue
+
+        items = getattr(client, resource).list(project_id, raw=True)
+        project_sizes[(resource, project_id)] = len(items)
+        by_id = {item.get("id"): item for item in items}
+        for entity in entities:
+            data = by_id.get(entity.id)
+            if data is None:
+                entity.refresh()
+            else:
+                # pylint: disable-next=protected-access
+                entity._hydrate(type(entity).from_dict(data, _client=client))
+
+
+def as_completed(
+    client: "HubClient",
+    entities: Iterable["EntityWithTaskProgress"],
+    *,
+    timeout: float = 600,
+    poll_interval: Optional[float] = None,
+) -> Iterator["EntityWithTaskProgress"]:
+    """Yield the entities as they complete, see `HubClient.as_completed`."""
+    entities = list(entities)
+    end_time = time.perf_counter() + timeout
+    # Each entity is polled on its own schedule, and the earliest poll wins
+    pollers = (
+        None
+        if poll_interval is not None
+        else {id(entity): AdaptivePoller() for entity in entities}
+    )
+
+    project_sizes: Dict[Tuple[str, str], int] = {}
+    pending = [entity for entity in entities if entity.is_running()]
+    yield from (entity for entity in entities if not entity.is_running())
+
+    if pending:
+        _refresh_all(client, pending, project_sizes)
+
+    while True:
+        still_pending = []
+        for entity in pending:
+            if entity.is_running():
+                still_pending.append(entity)
+            else:
+                yield entity
+        pending = still_pending
+
+        if not pending:
+            return
+
+        now = time.perf_counter()
+        if now >= end_time:
+            ids = ", ".join(f"'{entity.id}'" for entity in pending)
+            raise TimeoutError(f"Entities with ids {ids} did not finish in time.")
+
+        if pollers is None:
+            delay = poll_interval
+        else:
+            delay = min(
+                pollers[id(entity)].next_delay(entity.progress, now)
+                for entity in pending
+            )
+        time.sleep(max(0.0, min(delay, end_time - now)))
+        _refresh_all(client, pending, project_sizes)
@@ -1,28 +1,168 @@
 from __future__ import annotations
 
+import asyncio
+import importlib
 import os
-from typing import Callable, List, Optional
-
-from ._base_client import SyncClient
-from ._evaluation import LocalModel
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from ._base_client import AsyncClient, SyncClient
+from ._evaluation import (
+    LocalModel,
+    ModelFailures,
+    arun_local_model,
+    run_coroutine_sync,
+    run_local_model,
+)
+from ._health import health_cache_key, is_health_cached, record_health
+from ._waiting import as_completed
 from .data._base import NOT_GIVEN
 from .data._entity import entity_to_id
 from .data.chat import ChatMessage
 from .data.dataset import Dataset
+from .data.evaluation import EvaluationEntry, EvaluationRun
 from .data.model import Model, ModelOutput
-from .errors import HubConnectionError
-from .resources.chat_test_cases import ChatTestCasesResource
-from .resources.checks import ChecksResource
-from .resources.datasets import DatasetsResource
-from .resources.evaluations import EvaluationsResource
-from .resources.knowledge_bases import KnowledgeBasesResource
-from .resources.models import ModelsResource
-from .resources.projects import ProjectsResource
-from .resources.scans import ScansResource
-from .resources.scheduled_evaluations import ScheduledEvaluationsResource
-
-
-# pylint: disable=too-many-instance-attributes
+from .errors import HubAPIError, HubConnectionError
+
+if TYPE_CHECKING:
+    from .data._entity import EntityWithTaskProgress
+    from .resources.chat_test_cases import (
+        AsyncChatTestCasesResource,
+        ChatTestCasesResource,
+    )
+    from .resources.checks import AsyncChecksResource, ChecksResource
+    from .resources.datasets import AsyncDatasetsResource, DatasetsResource
+    from .resources.evaluations import AsyncEvaluationsResource, EvaluationsResource
+    from .resources.knowledge_bases import (
+        AsyncKnowledgeBasesResource,
+        KnowledgeBasesResource,
+    )
+    from .resources.models import AsyncModelsResource, ModelsResource
+    from .resources.projects import AsyncProjectsResource, ProjectsResource
+    from .resources.scans import AsyncScansResource, ScansResource
+    from .resources.scheduled_evaluations import (
+        AsyncScheduledEvaluationsResource,
+        ScheduledEvaluationsResource,
+    )
+
+R = TypeVar("R")
+E = TypeVar("E", bound="EntityWithTaskProgress")
+
+
+class _LazyResource(Generic[R]):
+    """Client resource created, and its module imported, on first access."""
+
+    def __init__(self, class_name: str):
+        self._class_name = class_name
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        # Resources are defined in the module named like the client attribute
+        self._name = name
+
+    def __get__(self, instance, owner=None) -> R:
+        if instance is None:
+            return self  # type: ignore
+
+        module = importlib.import_module(f".resources.{self._name}", __package__)
+        resource = getattr(module, self._class_name)(instance)
+        # Cache the resource on the instance, bypassing this descriptor next time
+        instance.__dict__[self._name] = resource
+        return resource
+
+
+def _resolve_hub_url(hub_url: Optional[str], auto_add_api_suffix: bool) -> str:
+    if hub_url is None:
+        hub_url = os.getenv("GSK_HUB_URL")
+    if hub_url is None:
+        raise ValueError(
+            "Missing Giskard Hub URL. Please provide it as an argument or set the env variable `GSK_HUB_URL`"
+        )
+    hub_url = hub_url.rstrip("/")
+    if not hub_url.endswith("/_api") and auto_add_api_suffix:
+        hub_url += "/_api"
+
+    return hub_url
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    if api_key is None:
+        api_key = os.getenv("GSK_API_KEY")
+
+    if api_key is None:
+        raise ValueError(
+            "Missing Giskard Hub API key. Please provide it as an argument or with the env variable `GSK_API_KEY`"
+        )
+
+    return api_key
+
+
+def _validate_health_data(data: dict, hub_url: str, auto_add_api_suffix: bool) -> None:
+    # Check if the health endpoint returns the expected format
+    if "status" not in data or data.get("status") != "ok":
+        raise HubConnectionError(
+            f"The health check failed at {hub_url}. Expected status 'ok', got: {data.get('status', 'unknown')}"
+        )
+
+    # Validate that services exists and does not contain any frontend service
+    if not auto_add_api_suffix:
+        services = data.get("services")
+        if not isinstance(services, dict):
+            raise HubConnectionError(
+                f"Invalid response format at {hub_url}. "
+                f"Expected 'services' to be an object, got: {type(services).__name__}"
+            )
+
+        # Check for frontend services that should not exist in backend API
+        found_frontend_services = [
+            service for service in services.keys() if service.lower() == "frontend"
+        ]
+
+        if found_frontend_services:
+            raise HubConnectionError(
+                "Invalid URL: You provided a frontend URL while setting auto_add_api_suffix=False."
+                "Please either enable auto_add_api_suffix=True or provide a proper backend API URL."
+            )
+
+
+def _submission_errors(
+    entries: List[EvaluationEntry], errors: List[Optional[HubAPIError]]
+) -> Dict[str, HubAPIError]:
+    """Return the errors raised when submitting the entries, by entry ID."""
+    submission_errors = {
+        entry.id: error for entry, error in zip(entries, errors) if error is not None
+    }
+    if submission_errors:
+        warnings.warn(
+            f"Failed to submit {len(submission_errors)} local evaluation result(s) to "
+            "the Hub, the corresponding entries were left unanswered. First error: "
+            f"{next(iter(submission_errors.values()))}",
+            UserWarning,
+        )
+    return submission_errors
+
+
+def _with_submission_errors(
+    eval_run: EvaluationRun, submission_errors: Dict[str, HubAPIError]
+) -> EvaluationRun:
+    # pylint: disable=protected-access
+    eval_run._submission_errors = submission_errors
+    return eval_run
+
+
 class HubClient(SyncClient):
     """Client class to handle interaction with the hub.
 
@@ -56,21 +196,33 @@ class HubClient(SyncClient):
         Resource to interact with scans and probes.
     """
 
-    chat_test_cases: ChatTestCasesResource
-    checks: ChecksResource
-    datasets: DatasetsResource
-    evaluations: EvaluationsResource
-    knowledge_bases: KnowledgeBasesResource
-    models: ModelsResource
-    projects: ProjectsResource
-    scheduled_evaluations: ScheduledEvaluationsResource
-    scans: ScansResource
-
-    def __init__(
+    chat_test_cases: _LazyResource[ChatTestCasesResource] = _LazyResource(
+        "ChatTestCasesResource"
+    )
+    checks: _LazyResource[ChecksResource] = _LazyResource("ChecksResource")
+    datasets: _LazyResource[DatasetsResource] = _LazyResource("DatasetsResource")
+    evaluations: _LazyResource[EvaluationsResource] = _LazyResource(
+        "EvaluationsResource"
+    )
+    knowledge_bases: _LazyResource[KnowledgeBasesResource] = _LazyResource(
+        "KnowledgeBasesResource"
+    )
+    models: _LazyResource[ModelsResource] = _LazyResource("ModelsResource")
+    projects: _LazyResource[ProjectsResource] = _LazyResource("ProjectsResource")
+    scheduled_evaluations: _LazyResource[ScheduledEvaluationsResource] = _LazyResource(
+        "ScheduledEvaluationsResource"
+    )
+    scans: _LazyResource[ScansResource] = _LazyResource("ScansResource")
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         hub_url: Optional[str] = None,
         api_key: Optional[str] = None,
         auto_add_api_suffix: Optional[bool] = True,
+        *,
+        lazy: bool = False,
+        health_check_ttl: float = 0.0,
+        health_check_cache_file: Optional[str | Path] = None,
         **kwargs,
     ) -> None:
         """Initialize the client.
@@ -85,6 +237,44 @@ class HubClient(SyncClient):
             will be read from the `GSK_API_KEY` env variable.
         auto_add_api_suffix : bool, optional
             If True, automatically adds the `_api` suffix to the `hub_url` if not already present.
+        lazy : bool, optional
+            If True, the connection to the Hub is validated on the first request
+            instead of when the client is created. By default False.
+        health_check_ttl : float, optional
+            Number of seconds during which a successful health check of the Hub
+            is reused by the clients of this process, so that creating clients
+            repeatedly does not check the connection each time. By default 0,
+            the connection is always checked.
+        health_check_cache_file : str | Path, optional
+            Path of a file where successful health checks are also stored, to
+            share them with other processes for `health_check_ttl` seconds.
+        **kwargs
+            Additional options for the underlying HTTP client:
+
+            - `http_client` (`httpx.Client`): custom HTTP client to use.
+            - `retry_policy` (`RetryPolicy`): how failed requests are retried.
+              By default, idempotent requests failing with a transient error are
+              retried up to 3 times with an exponential backoff.
+            - `connection_options` (`ConnectionOptions`): connection pool size,
+              keep-alive, per-phase timeouts and HTTP/2. Cannot be combined
+              with `http_client`.
+            - `json_codec` (`str`): JSON library used for request and response
+              bodies, `"orjson"`, `"msgspec"` or `"stdlib"`. By default, orjson
+              or msgspec is used if installed.
+            - `intern_strings` (`bool`): whether to intern the low-cardinality
+              strings of responses (roles, tags, check identifiers, parent
+              ids...), so that large result sets share one object per distinct
+              value. Disabled by default, since it walks every response in
+              Python: it saves memory when holding large result sets, at the
+              cost of a slower decoding.
+            - `identity_map_size` (`int`): if set, entities received several
+              times (e.g. the model of each evaluation run) resolve to a single
+              instance, updated with the latest data received. Up to this
+              number of entities are tracked, the least recently received
+              being evicted first. Disabled by default.
+            - `raw_responses` (`bool`): whether the `list` and `retrieve`
+              methods of the resources return the decoded JSON instead of
+              entities by default. Each call can override it with `raw`.
 
         Raises
         ------
@@ -92,35 +282,62 @@ class HubClient(SyncClient):
             If the `hub_url` or `api_key` are not provided and the environment
             variables are not set.
         HubConnectionError
-            If calling `/openapi.json` fails or the response doesn't include an OpenAPI specification.
+            If the health check of the Hub fails. With `lazy=True`, this is
+            raised by the first request instead.
         """
-        if hub_url is None:
-            hub_url = os.getenv("GSK_HUB_URL")
-        if hub_url is None:
-            raise ValueError(
-                "Missing Giskard Hub URL. Please provide it as an argument or set the env variable `GSK_HUB_URL`"
-            )
-        hub_url = hub_url.rstrip("/")
-        if not hub_url.endswith("/_api") and auto_add_api_suffix:
-            hub_url += "/_api"
-
-        if api_key is None:
-            api_key = os.getenv("GSK_API_KEY")
-
-        if api_key is None:
-            raise ValueError(
-                "Missing Giskard Hub API key. Please provide it as an argument or with the env variable `GSK_API_KEY`"
-            )
-
-        self._hub_url = hub_url
-        self._api_key = api_key
+        self._hub_url = _resolve_hub_url(hub_url, auto_add_api_suffix)
+        self._api_key = _resolve_api_key(api_key)
+        self._auto_add_api_suffix = auto_add_api_suffix
+        self._health_check_ttl = health_check_ttl
+        self._health_check_cache_file = health_check_cache_file
+        self._connection_checked = False
+        self._connection_lock = threading.Lock()
 
         super().__init__(**kwargs)
 
         # Set base url on the client
         self._http.base_url = self._hub_url
 
-        # Check if the connection is valid
+        if not lazy:
+            self._ensure_connection()
+
+    def _headers(self):
+        return {
+            "X-API-Key": self._api_key,
+            "Content-Type": "application/json",
+        }
+
+    def _prepare(self):
+        if not self._connection_checked:
+            self._ensure_connection()
+
+    def _ensure_connection(self):
+        with self._connection_lock:
+            if self._connection_checked:
+                return
+
+            key = health_cache_key(self._hub_url, self._auto_add_api_suffix)
+            if is_health_cached(
+                key, self._health_check_ttl, self._health_check_cache_file
+            ):
+                self._connection_checked = True
+                return
+
+            self.check_connection()
+            if self._health_check_ttl > 0:
+                record_health(key, self._health_check_cache_file)
+
+    def check_connection(self) -> None:
+        """Validate the connection to the Hub.
+
+        This is done when the client is created, or before the first request
+        with `lazy=True`, but can be called explicitly at any time.
+
+        Raises
+        ------
+        HubConnectionError
+            If the health check fails.
+        """
         try:
             resp = self._http.get("/_health")
             resp.raise_for_status()
@@ -130,56 +347,97 @@ class HubClient(SyncClient):
                 f"Failed to connect to Giskard Hub at {self._hub_url}"
             ) from e
 
-        # Check if the health endpoint returns the expected format
-        if "status" not in data or data.get("status") != "ok":
-            raise HubConnectionError(
-                f"The health check failed at {self._hub_url}. Expected status 'ok', got: {data.get('status', 'unknown')}"
-            )
+        _validate_health_data(data, self._hub_url, self._auto_add_api_suffix)
+        self._connection_checked = True
 
-        # Validate that services exists and does not contain any frontend service
-        if not auto_add_api_suffix:
-            services = data.get("services")
-            if not isinstance(services, dict):
-                raise HubConnectionError(
-                    f"Invalid response format at {self._hub_url}. "
-                    f"Expected 'services' to be an object, got: {type(services).__name__}"
-                )
+    def as_completed(
+        self,
+        entities: Iterable[E],
+        *,
+        timeout: float = 600,
+        poll_interval: Optional[float] = None,
+    ) -> Iterator[E]:
+        """Wait for several evaluations, scans... yielding each as it completes.
+
+        All the pending entities are refreshed on a single schedule, polling
+        adaptively by default as in `wait_for_completion`: the next poll is
+        scheduled from the progress of the entity expected to change first.
+        Evaluations and scans of the same project are refreshed together with a
+        single list request when many of them are pending, as long as the
+        project does not hold many more of them.
+
+        Parameters
+        ----------
+        entities : Iterable[EntityWithTaskProgress]
+            The entities to wait for, e.g. `EvaluationRun` or `ScanResult`.
+        timeout : float, optional
+            The timeout in seconds, by default 600.
+        poll_interval : float, optional
+            Fixed polling interval in seconds. By default, polling is adaptive.
+
+        Yields
+        ------
+        EntityWithTaskProgress
+            The entities, updated, as they stop running. Entities that failed
+            are yielded as well: check their status with `is_finished` or
+            `is_errored`.
 
-            # Check for frontend services that should not exist in backend API
-            found_frontend_services = [
-                service for service in services.keys() if service.lower() == "frontend"
-            ]
+        Raises
+        ------
+        TimeoutError
+            If some entities are still running after `timeout` seconds.
+        """
+        return as_completed(
+            self, entities, timeout=timeout, poll_interval=poll_interval
+        )
 
-            if found_frontend_services:
-                raise HubConnectionError(
-                    "Invalid URL: You provided a frontend URL while setting auto_add_api_suffix=False."
-                    "Please either enable auto_add_api_suffix=True or provide a proper backend API URL."
-                )
+    def wait_all(
+        self,
+        entities: Iterable[E],
+        *,
+        timeout: float = 600,
+        poll_interval: Optional[float] = None,
+    ) -> List[E]:
+        """Wait for several evaluations, scans... to complete.
 
-        # Define the resources
-        self.chat_test_cases = ChatTestCasesResource(self)
-        self.checks = ChecksResource(self)
-        self.datasets = DatasetsResource(self)
-        self.evaluations = EvaluationsResource(self)
-        self.knowledge_bases = KnowledgeBasesResource(self)
-        self.models = ModelsResource(self)
-        self.projects = ProjectsResource(self)
-        self.scheduled_evaluations = ScheduledEvaluationsResource(self)
-        self.scans = ScansResource(self)
+        The entities are refreshed on a single schedule, see `as_completed`.
 
-    def _headers(self):
-        return {
-            "X-API-Key": self._api_key,
-            "Content-Type": "application/json",
-        }
+        Parameters
+        ----------
+        entities : Iterable[EntityWithTaskProgress]
+            The entities to wait for, e.g. `EvaluationRun` or `ScanResult`.
+        timeout : float, optional
+            The timeout in seconds, by default 600.
+        poll_interval : float, optional
+            Fixed polling interval in seconds. By default, polling is adaptive.
+
+        Returns
+        -------
+        List[EntityWithTaskProgress]
+            The updated entities, in the given order. Unlike
+            `wait_for_completion`, entities that failed do not raise: check
+            their status with `is_finished` or `is_errored`.
 
-    def evaluate(
+        Raises
+        ------
+        TimeoutError
+            If some entities are still running after `timeout` seconds.
+        """
+        entities = list(entities)
+        for _ in self.as_completed(
+            entities, timeout=timeout, poll_interval=poll_interval
+        ):
+            pass
+        return entities
+
+    def evaluate(  # pylint: disable=too-many-arguments
         self,
         *,
         dataset: str | Dataset,
         model: Model | str | Callable[[List[ChatMessage]], ModelOutput | str],
         name: str = NOT_GIVEN,
         tags: List[str] = NOT_GIVEN,
+        concurrency: int = 1,
     ):
         """Method to run an evaluation, either locally or remotely.
 
@@ -188,22 +446,34 @@ class HubClient(SyncClient):
         dataset : str | Dataset
             ID of the dataset that will be used for the evaluation, or the dataset entity itself.
             List of tags to filter the chat test cases that will be evaluated.
-        model : str | Model | Callable[[List[ChatMessage]], ModelOutput | str]
-            ID of the model to evaluate, or a model entity, or a local model function.
+        model : str | Model | LocalModel | Callable[[List[ChatMessage]], ModelOutput | str]
+            ID of the model to evaluate, or a model entity, or a local model.
             A local model function is a function that takes a list of messages and returns a `ModelOutput` or a string.
+            It can also be a coroutine function (`async def`) or a `LocalModel` with an async `__call__`.
         name : str, optional
             The name of the evaluation run. If not provided, a random name will be automatically generated.
         tags: List[str], optional
             List of tags to filter the chat test cases that will be evaluated.
+        concurrency : int, optional
+            Only used for local models. Maximum number of entries evaluated in
+            parallel, defaults to 1 (sequential). Synchronous models run in a
+            pool of worker threads, async models run concurrently on a single
+            event loop. Errors are isolated per entry: if the model raises, the
+            entry is submitted as errored and the other entries are still
+            evaluated. If the model fails on 5 entries in a row, the evaluation
+            is aborted with its last error.
 
         Returns
         -------
         EvaluationRun
-            The evaluation run entity.
+            The evaluation run entity. For local models, the errors raised when
+            submitting the outputs to the Hub are in its `submission_errors`.
         """
         is_local = False
 
-        if isinstance(model, Callable):
+        if isinstance(model, LocalModel):
+            is_local = True
+        elif isinstance(model, Callable):
             is_local = True
             model = LocalModel.from_callable(model)
 
@@ -215,6 +485,7 @@ class HubClient(SyncClient):
                 tags=tags,
                 model=model,
                 name=name,
+                concurrency=concurrency,
             )
 
         return self.evaluations.create(
@@ -224,9 +495,18 @@ class HubClient(SyncClient):
             tags=tags,
         )
 
-    def _run_local_eval(
-        self, dataset_id: str, tags: List[str], model: LocalModel, name: str
+    def _run_local_eval(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        dataset_id: str,
+        tags: List[str],
+        model: LocalModel,
+        name: str,
+        concurrency: int = 1,
     ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
         # Set up the evaluation run
         eval_run = self.evaluations.create_local(
             model=Model(name=model.name, description=model.description),
@@ -236,11 +516,335 @@ class HubClient(SyncClient):
         )
 
         # Run the local model
-        entries = self.evaluations.list_entries(eval_run.id)
-        for entry in entries:
-            model_output = model(entry.chat_test_case.messages)
-            self.evaluations.update_entry(
-                eval_run.id, entry.id, model_output=model_output
+        entries = self.evaluations.list_entries(eval_run.id, raw=False)
+        failures = ModelFailures()
+
+        if model.is_async:
+            errors = run_coroutine_sync(
+                self._run_async_local_model(
+                    eval_run.id,
+                    entries,
+                    model,
+                    concurrency=concurrency,
+                    failures=failures,
+                )
+            )
+            failures.raise_if_aborted()
+            return _with_submission_errors(
+                eval_run.refresh(), _submission_errors(entries, errors)
             )
 
-        return eval_run.refresh()
+        def evaluate_entry(entry: EvaluationEntry) -> Optional[HubAPIError]:
+            model_output = run_local_model(
+                model, entry.chat_test_case.messages, failures
+            )
+            if model_output is None:
+                return None
+            try:
+                self.evaluations.update_entry(
+                    eval_run.id, entry.id, model_output=model_output
+                )
+            except HubAPIError as e:
+                return e
+            return None
+
+        if concurrency == 1:
+            errors = [evaluate_entry(entry) for entry in entries]
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                errors = list(pool.map(evaluate_entry, entries))
+
+        failures.raise_if_aborted()
+        return _with_submission_errors(
+            eval_run.refresh(), _submission_errors(entries, errors)
+        )
+
+    async def _run_async_local_model(  # pylint: disable=too-many-arguments
+        self,
+        run_id: str,
+        entries: List[EvaluationEntry],
+        model: LocalModel,
+        *,
+        concurrency: int,
+        failures: ModelFailures,
+    ) -> List[Optional[HubAPIError]]:
+        """Evaluate entries with an async model on the current event loop.
+
+        Submissions go through the sync client and are offloaded to worker threads.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def evaluate_entry(entry: EvaluationEntry) -> Optional[HubAPIError]:
+            async with semaphore:
+                model_output = await arun_local_model(
+                    model, entry.chat_test_case.messages, failures
+                )
+            if model_output is None:
+                return None
+            try:
+                await asyncio.to_thread(
+                    self.evaluations.update_entry,
+                    run_id,
+                    entry.id,
+                    model_output=model_output,
+                )
+            except HubAPIError as e:
+                return e
+            return None
+
+        return await asyncio.gather(*(evaluate_entry(entry) for entry in entries))
+
+
+class AsyncHubClient(AsyncClient):
+    """Asynchronous client to handle interaction with the hub.
+
+    It exposes the same resources as `HubClient`, but all the resource methods
+    are coroutines and must be awaited. Since the constructor cannot perform
+    network calls, the connection to the Hub is validated on the first request.
+
+    Entities returned by this client are bound to it: their methods performing
+    API calls (e.g. `refresh`) return awaitables.
+
+    Attributes
+    ----------
+    chat_test_cases : AsyncChatTestCasesResource
+        Resource to interact with chat test cases (conversations).
+
+    checks : AsyncChecksResource
+        Resource to interact with checks.
+
+    datasets : AsyncDatasetsResource
+        Resource to interact with datasets.
+
+    evaluations : AsyncEvaluationsResource
+        Resource to interact with evaluations.
+
+    knowledge_bases : AsyncKnowledgeBasesResource
+        Resource to interact with knowledge bases.
+
+    models : AsyncModelsResource
+        Resource to interact with models.
+
+    projects : AsyncProjectsResource
+        Resource to interact with projects.
+
+    scheduled_evaluations : AsyncScheduledEvaluationsResource
+        Resource to interact with scheduled evaluations.
+
+    scans : AsyncScansResource
+        Resource to interact with scans and probes.
+    """
+
+    chat_test_cases: _LazyResource[AsyncChatTestCasesResource] = _LazyResource(
+        "AsyncChatTestCasesResource"
+    )
+    checks: _LazyResource[AsyncChecksResource] = _LazyResource("AsyncChecksResource")
+    datasets: _LazyResource[AsyncDatasetsResource] = _LazyResource(
+        "AsyncDatasetsResource"
+    )
+    evaluations: _LazyResource[AsyncEvaluationsResource] = _LazyResource(
+        "AsyncEvaluationsResource"
+    )
+    knowledge_bases: _LazyResource[AsyncKnowledgeBasesResource] = _LazyResource(
+        "AsyncKnowledgeBasesResource"
+    )
+    models: _LazyResource[AsyncModelsResource] = _LazyResource("AsyncModelsResource")
+    projects: _LazyResource[AsyncProjectsResource] = _LazyResource(
+        "AsyncProjectsResource"
+    )
+    scheduled_evaluations: _LazyResource[AsyncScheduledEvaluationsResource] = (
+        _LazyResource("AsyncScheduledEvaluationsResource")
+    )
+    scans: _LazyResource[AsyncScansResource] = _LazyResource("AsyncScansResource")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        hub_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        auto_add_api_suffix: Optional[bool] = True,
+        *,
+        health_check_ttl: float = 0.0,
+        health_check_cache_file: Optional[str | Path] = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the client.
+
+        Parameters
+        ----------
+        hub_url : str, optional
+            URL of the Giskard Hub instance. If not provided, it will be read
+            from the `GSK_HUB_URL` env variable.
+        api_key : str, optional
+            API key to authenticate with the Giskard Hub. If not provided, it
+            will be read from the `GSK_API_KEY` env variable.
+        auto_add_api_suffix : bool, optional
+            If True, automatically adds the `_api` suffix to the `hub_url` if not already present.
+        health_check_ttl : float, optional
+            Number of seconds during which a successful health check of the Hub
+            is reused by the clients of this process. By default 0, the
+            connection is checked by every client.
+        health_check_cache_file : str | Path, optional
+            Path of a file where successful health checks are also stored, to
+            share them with other processes for `health_check_ttl` seconds.
+        **kwargs
+            Additional options for the underlying HTTP client: `http_client`
+            (`httpx.AsyncClient`), `retry_policy` (`RetryPolicy`),
+            `connection_options` (`ConnectionOptions`), `json_codec` (`str`),
+            `intern_strings` (`bool`), `identity_map_size` (`int`) and
+            `raw_responses` (`bool`).
+
+        Raises
+        ------
+        ValueError
+            If the `hub_url` or `api_key` are not provided and the environment
+            variables are not set.
+        """
+        self._hub_url = _resolve_hub_url(hub_url, auto_add_api_suffix)
+        self._api_key = _resolve_api_key(api_key)
+        self._auto_add_api_suffix = auto_add_api_suffix
+        self._health_check_ttl = health_check_ttl
+        self._health_check_cache_file = health_check_cache_file
+        self._connection_checked = False
+        self._connection_lock = asyncio.Lock()
+
+        super().__init__(**kwargs)
+
+        # Set base url on the client
+        self._http.base_url = self._hub_url
+
+    def _headers(self):
+        return {
+            "X-API-Key": self._api_key,
+            "Content-Type": "application/json",
+        }
+
+    async def _prepare(self):
+        if self._connection_checked:
+            return
+
+        async with self._connection_lock:
+            if self._connection_checked:
+                return
+
+            key = health_cache_key(self._hub_url, self._auto_add_api_suffix)
+            if is_health_cached(
+                key, self._health_check_ttl, self._health_check_cache_file
+            ):
+                self._connection_checked = True
+                return
+
+            await self.check_connection()
+            if self._health_check_ttl > 0:
+                record_health(key, self._health_check_cache_file)
+
+    async def check_connection(self) -> None:
+        """Validate the connection to the Hub.
+
+        This is done automatically before the first request, but can be called
+        explicitly to fail early.
+
+        Raises
+        ------
+        HubConnectionError
+            If the health check fails.
+        """
+        try:
+            resp = await self._http.get("/_health")
+            resp.raise_for_status()
+            data = resp.json()
+        except Exception as e:
+            raise HubConnectionError(
+                f"Failed to connect to Giskard Hub at {self._hub_url}"
+            ) from e
+
+        _validate_health_data(data, self._hub_url, self._auto_add_api_suffix)
+        self._connection_checked = True
+
+    async def evaluate(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        dataset: str | Dataset,
+        model: Model | str | Callable[[List[ChatMessage]], ModelOutput | str],
+        name: str = NOT_GIVEN,
+        tags: List[str] = NOT_GIVEN,
+        concurrency: int = 1,
+    ):
+        """Method to run an evaluation, either locally or remotely.
+
+        See `HubClient.evaluate` for the description of the parameters. Async
+        local models are awaited on the running event loop, synchronous ones are
+        run in worker threads to avoid blocking it.
+
+        Returns
+        -------
+        EvaluationRun
+            The evaluation run entity. For local models, the errors raised when
+            submitting the outputs to the Hub are in its `submission_errors`.
+        """
+        dataset_id = entity_to_id(dataset, Dataset)
+
+        if isinstance(model, Callable):
+            if not isinstance(model, LocalModel):
+                model = LocalModel.from_callable(model)
+
+            return await self._run_local_eval(
+                dataset_id=dataset_id,
+                tags=tags,
+                model=model,
+                name=name,
+                concurrency=concurrency,
+            )
+
+        return await self.evaluations.create(
+            dataset_id=dataset_id,
+            model_id=entity_to_id(model, Model),
+            name=name,
+            tags=tags,
+        )
+
+    async def _run_local_eval(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        dataset_id: str,
+        tags: List[str],
+        model: LocalModel,
+        name: str,
+        concurrency: int = 1,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        # Set up the evaluation run
+        eval_run = await self.evaluations.create_local(
+            model=Model(name=model.name, description=model.description),
+            dataset_id=dataset_id,
+            tags=tags,
+            name=name,
+        )
+
+        # Run the local model
+        entries = await self.evaluations.list_entries(eval_run.id, raw=False)
+        failures = ModelFailures()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def evaluate_entry(entry: EvaluationEntry) -> Optional[HubAPIError]:
+            async with semaphore:
+                model_output = await arun_local_model(
+                    model, entry.chat_test_case.messages, failures
+                )
+                if model_output is None:
+                    return None
+                try:
+                    await self.evaluations.update_entry(
+                        eval_run.id, entry.id, model_output=model_output
+                    )
+                except HubAPIError as e:
+                    return e
+                return None
+
+        errors = await asyncio.gather(*(evaluate_entry(entry) for entry in entries))
+        failures.raise_if_aborted()
+
+        return _with_submission_errors(
+            await eval_run.refresh(), _submission_errors(entries, errors)
+        )
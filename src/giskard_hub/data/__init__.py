@@ -1,30 +1,49 @@
-from .chat import ChatMessage
-from .chat_test_case import ChatTestCase
-from .check import Check
-from .dataset import Dataset
-from .evaluation import EvaluationRun, Metric, ModelOutput
-from .knowledge_base import Document, KnowledgeBase, Topic
-from .model import Model
-from .project import Project
-from .scan import ProbeAttempt, ProbeResult, ScanResult
-from .scheduled_evaluation import FrequencyOption, ScheduledEvaluation
+from __future__ import annotations
 
-__all__ = [
-    "Project",
-    "Dataset",
-    "ChatTestCase",
-    "Check",
-    "ChatMessage",
-    "Model",
-    "ModelOutput",
-    "EvaluationRun",
-    "Metric",
-    "KnowledgeBase",
-    "Topic",
-    "Document",
-    "ScheduledEvaluation",
-    "FrequencyOption",
-    "ScanResult",
-    "ProbeResult",
-    "ProbeAttempt",
-]
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .chat import ChatMessage
+    from .chat_test_case import ChatTestCase
+    from .check import Check
+    from .dataset import Dataset
+    from .evaluation import EvaluationRun, Metric, ModelOutput
+    from .knowledge_base import Document, KnowledgeBase, Topic
+    from .model import Model
+    from .project import Project
+    from .scan import (
+        AttemptStats,
+        ProbeAttempt,
+        ProbeResult,
+        ProbeSummary,
+        ScanResult,
+    )
+    from .scheduled_evaluation import FrequencyOption, ScheduledEvaluation
+
+_ATTRIBUTES = {
+    "Project": ".project",
+    "Dataset": ".dataset",
+    "ChatTestCase": ".chat_test_case",
+    "Check": ".check",
+    "ChatMessage": ".chat",
+    "Model": ".model",
+    "ModelOutput": ".evaluation",
+    "EvaluationRun": ".evaluation",
+    "Metric": ".evaluation",
+    "KnowledgeBase": ".knowledge_base",
+    "Topic": ".knowledge_base",
+    "Document": ".knowledge_base",
+    "ScheduledEvaluation": ".scheduled_evaluation",
+    "FrequencyOption": ".scheduled_evaluation",
+    "ScanResult": ".scan",
+    "ProbeResult": ".scan",
+    "ProbeAttempt": ".scan",
+    "ProbeSummary": ".scan",
+    "AttemptStats": ".scan",
+}
+
+__all__ = list(_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _ATTRIBUTES)
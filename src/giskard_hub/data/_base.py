@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Dict, Literal
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Literal, TypeVar
+
+from ..errors import HubAPIError
+
+T = TypeVar("T", bound=type)
 
 
 class NotGiven:
@@ -22,10 +26,69 @@ def filter_not_given(data: Dict[str, any]) -> Dict[str, any]:
     return {k: v for k, v in data.items() if v is not NOT_GIVEN}
 
 
+# Deserializer of each dataclass, compiled on first use by `_compile_from_dict`
+_DESERIALIZERS: Dict[type, Callable[[Dict[str, Any]], Any]] = {}
+
+# Serializer of each dataclass, compiled on first use by `_compile_to_dict`
+_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+# Values of these types are already JSON-ready and returned as is
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+
+def _compile_from_dict(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """Generate the function building an instance of `cls` from a dict.
+
+    The generated code reads each field by name, so that deserializing an
+    instance does not need any introspection of the dataclass.
+    """
+    converters = getattr(cls, "_from_dict_converters", {})
+    namespace = {"cls": cls, "NOT_GIVEN": NOT_GIVEN}
+    lines = ["def from_dict(data):", "    get = data.get"]
+
+    init_args = []
+    post_fields = []
+    for index, f in enumerate(fields(cls)):
+        if not f.init:
+            post_fields.append(f.name)
+            continue
+
+        if f.name in converters:
+            namespace[f"convert_{index}"] = converters[f.name]
+            lines.append(f"    value_{index} = get({f.name!r})")
+            lines.append(f"    if value_{index}:")
+            lines.append(f"        value_{index} = convert_{index}(value_{index})")
+            init_args.append(f"{f.name}=value_{index}")
+        else:
+            init_args.append(f"{f.name}=get({f.name!r})")
+
+    lines.append(f"    instance = cls({', '.join(init_args)})")
+
+    for index, name in enumerate(post_fields):
+        lines.append(f"    value = get({name!r}, NOT_GIVEN)")
+        lines.append("    if value is not NOT_GIVEN:")
+        if name in converters:
+            namespace[f"convert_post_{index}"] = converters[name]
+            lines.append("        if value:")
+            lines.append(f"            value = convert_post_{index}(value)")
+        lines.append(f"        instance.{name} = value")
+
+    lines.append("    return instance")
+
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["from_dict"]
+
+
 @dataclass
 class BaseData:
     """Base dataclass containing utility function."""
 
+    # Allow subclasses to be slotted (i.e. without instance `__dict__`)
+    __slots__ = ()
+
+    # Functions applied to the (truthy) values of the given fields by `from_dict`
+    _from_dict_converters: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BaseData":
         """Class method factory.
@@ -40,16 +103,11 @@ class BaseData:
         BaseDataclass
             The dataclass instance.
         """
-        init_set = [f.name for f in fields(cls) if f.init]
-        instance = cls(**{k: data.get(k) for k in init_set})
-
-        post_set = [f.name for f in fields(cls) if not f.init]
-        for key in post_set:
-            value = data.get(key, NOT_GIVEN)
-            if value is not NOT_GIVEN:
-                setattr(instance, key, value)
+        deserializer = _DESERIALIZERS.get(cls)
+        if deserializer is None:
+            deserializer = _DESERIALIZERS[cls] = _compile_from_dict(cls)
 
-        return instance
+        return deserializer(data)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return the dataclass as a dictionary.
@@ -59,20 +117,139 @@ class BaseData:
         Dict[str, Any]
             The dictionary representation of the dataclass.
         """
-        return {
-            f.name: maybe_to_dict(getattr(self, f.name))
-            for f in fields(self)
-            if not f.name.startswith("_")
-        }
+        return _serializer(type(self))(self)
+
+
+class Unparsed:
+    """Raw payload of a lazy field, parsed on first access (see `lazy_fields`)."""
+
+    __slots__ = ("parse", "data")
+
+    def __init__(self, parse: Callable[[Any], Any], data: Any):
+        self.parse = parse
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"Unparsed({self.data!r})"
+
+
+class _LazyField:
+    """Descriptor of a slotted field, parsing `Unparsed` values on first access.
+
+    Parsing errors are raised as `HubAPIError`, as if the payload had been
+    parsed with the response returning it.
+    """
+
+    __slots__ = ("_name", "_slot")
+
+    def __init__(self, name: str, slot):
+        self._name = name
+        self._slot = slot
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = self._slot.__get__(instance, owner)
+        if value.__class__ is Unparsed:
+            try:
+                value = value.parse(value.data)
+            except Exception as e:
+                raise HubAPIError(
+                    "Error casting API response data for the "
+                    f"`{self._name}` field of {type(instance).__name__}: {str(e)}"
+                ) from e
+            self._slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        self._slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self._slot.__delete__(instance)
+
+
+def lazy_fields(*names: str) -> Callable[[T], T]:
+    """Class decorator allowing the given fields of a slotted dataclass to be lazy.
+
+    Values wrapped in `Unparsed` (typically by `from_dict`) are parsed on first
+    access to the field, so that nested payloads that are never read are never
+    parsed.
+    """
+
+    def decorator(cls: T) -> T:
+        for name in names:
+            setattr(cls, name, _LazyField(name, vars(cls)[name]))
+        return cls
+
+    return decorator
+
+
+def _compile_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Generate the function returning the dict representation of a `cls` instance.
+
+    Values of the public fields are read directly, and only those that are not
+    JSON scalars go through `maybe_to_dict`.
+    """
+    names = [f.name for f in fields(cls) if not f.name.startswith("_")]
+    lines = ["def to_dict(self):"]
+    lines.extend(f"    value_{i} = self.{name}" for i, name in enumerate(names))
+    items = ", ".join(
+        f"{name!r}: value_{i} if value_{i}.__class__ in SCALARS else convert(value_{i})"
+        for i, name in enumerate(names)
+    )
+    lines.append(f"    return {{{items}}}")
+
+    namespace = {"SCALARS": _JSON_SCALARS, "convert": maybe_to_dict}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["to_dict"]
+
+
+def _serializer(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is None:
+        if cls.to_dict is BaseData.to_dict:
+            serializer = _compile_to_dict(cls)
+        else:
+            # Respect custom `to_dict` implementations
+            serializer = cls.to_dict
+        _SERIALIZERS[cls] = serializer
+    return serializer
+
+
+def to_dict_list(items: Iterable[Any]) -> List[Any]:
+    """Convert the items to their dict representation.
+
+    Lists of instances of the same class (typically `ChatMessage`) are
+    converted with a single serializer lookup.
+    """
+    items = items if isinstance(items, (list, tuple)) else list(items)
+    if not items:
+        return []
+
+    cls = items[0].__class__
+    if all(item.__class__ is cls for item in items):
+        if cls in _JSON_SCALARS:
+            return list(items)
+        if issubclass(cls, BaseData):
+            serializer = _serializer(cls)
+            return [serializer(item) for item in items]
+
+    return [maybe_to_dict(item) for item in items]
 
 
 def maybe_to_dict(data):
+    if data.__class__ in _JSON_SCALARS:
+        return data
     if isinstance(data, BaseData):
-        return data.to_dict()
+        return _serializer(type(data))(data)
     if isinstance(data, (list, tuple)):
-        return [maybe_to_dict(item) for item in data]
+        return to_dict_list(data)
     if isinstance(data, dict):
-        return {k: maybe_to_dict(v) for k, v in data.items()}
+        return {
+            k: v if v.__class__ in _JSON_SCALARS else maybe_to_dict(v)
+            for k, v in data.items()
+        }
     if isinstance(data, Enum):
         return data.value
     return data
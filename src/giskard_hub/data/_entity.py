@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from time import sleep
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypeVar
-
-from dateutil import parser
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, TypeVar
 
+from .._polling import AdaptivePoller
 from ._base import BaseData
 from .task import TaskProgress, TaskStatus
 
@@ -18,6 +19,27 @@ if TYPE_CHECKING:
     from ..client import HubClient
 
 
+def parse_datetime(value: str) -> datetime:
+    """Parse a datetime returned by the Hub.
+
+    The Hub sends ISO-8601 timestamps, which `datetime.fromisoformat` parses an
+    order of magnitude faster than dateutil. Other formats, and the ISO-8601
+    variants not supported by `fromisoformat` before Python 3.11, fall back to
+    dateutil.
+    """
+    try:
+        if value.endswith(("Z", "z")):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    # dateutil is slow to import and only needed for unusual formats
+    from dateutil import parser  # pylint: disable=import-outside-toplevel
+
+    return parser.parse(value)
+
+
 def maybe_entity_to_id(entity, entity_class=None):
     if entity is None:
         return None
@@ -40,9 +62,19 @@ def entity_to_id(entity, entity_class=None):
     )
 
 
-@dataclass
+def _compared_values(entity: "Entity") -> tuple:
+    return tuple(getattr(entity, f.name) for f in fields(entity) if f.compare)
+
+
+@dataclass(slots=True, eq=False)
 class Entity(BaseData):
-    """Base class containing audit fields and id."""
+    """Base class containing audit fields and id.
+
+    Saved entities compare and hash by type and id, so that they can be put in
+    sets or used as dict keys, whatever data they were last received with.
+    Unsaved entities (without id) compare by their fields and are unhashable.
+    Subclasses are declared with `eq=False` to keep this behavior.
+    """
 
     id: str | None = field(init=False, default=None)
     created_at: datetime | None = field(init=False, default=None)
@@ -50,6 +82,11 @@ class Entity(BaseData):
 
     _client: Optional["HubClient"] = field(init=False, repr=False, default=None)
 
+    _from_dict_converters = {
+        "created_at": parse_datetime,
+        "updated_at": parse_datetime,
+    }
+
     @classmethod
     def from_dict(
         cls, data: Dict[str, Any], *, _client: Optional["HubClient"] = None
@@ -61,29 +98,58 @@ class Entity(BaseData):
         data : Dict[str, Any]
             The data to use to initialize the dataclass.
         """
-        data = dict(data)
+        # Zero-argument `super()` does not work in slotted dataclasses
+        entity = super(Entity, cls).from_dict(data)
+        setattr(entity, "_client", _client)
 
-        raw_created_at = data.get("created_at", None)
-        raw_updated_at = data.get("updated_at", None)
+        if _client is not None and _client.identity_map is not None:
+            # Nested summaries only hold some fields: only these are merged
+            return _client.identity_map.resolve(entity, data.keys())
 
-        if raw_created_at:
-            data["created_at"] = parser.parse(raw_created_at)
+        return entity  # type: ignore
 
-        if raw_updated_at:
-            data["updated_at"] = parser.parse(raw_updated_at)
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self.id is not None or other.id is not None:
+            return self.id == other.id
+        return _compared_values(self) == _compared_values(other)
 
-        entity = super().from_dict(data)
-        setattr(entity, "_client", _client)
-        return entity  # type: ignore
+    def __hash__(self):
+        if self.id is None:
+            raise TypeError(f"unhashable type: unsaved '{type(self).__name__}'")
+        return hash((self.__class__, self.id))
+
+    def _hydrate(self, data: "Entity", names: Optional[Iterable[str]] = None):
+        """Hydrate with the data from the API.
 
-    def _hydrate(self, data: "Entity"):
-        """Hydrate with the data from the API."""
+        If `names` is given, only the fields with these names are updated.
+        """
         # @TODO: make this more robust
-        for key, value in data.__dict__.items():
-            setattr(self, key, value)
+        # Entities are slotted, so their state is made of their fields only
+        names = None if names is None else frozenset(names)
+        for f in fields(data):
+            if names is None or f.name in names:
+                setattr(self, f.name, getattr(data, f.name))
+
+    def _hydrate_from(self, data):
+        """Hydrate with data returned by a resource call.
+
+        When the entity is bound to an `AsyncHubClient`, resource calls return
+        awaitables: in that case an awaitable resolving to the entity is returned.
+        """
+        if inspect.isawaitable(data):
+            return self._hydrate_async(data)
+
+        self._hydrate(data)
+        return self
+
+    async def _hydrate_async(self, data):
+        self._hydrate(await data)
+        return self
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EntityWithTaskProgress(Entity, ABC):
     progress: TaskProgress | None = field(init=False, default=None)
 
@@ -108,31 +174,77 @@ class EntityWithTaskProgress(Entity, ABC):
         return isinstance(status, TaskStatus) and status == TaskStatus.ERROR
 
     def wait_for_completion(
-        self: T, timeout: float = 600, poll_interval: float = 5
+        self: T, timeout: float = 600, poll_interval: Optional[float] = None
     ) -> T:
         """Wait for the evaluation to complete successfully.
 
+        If the entity is bound to an `AsyncHubClient`, the result must be awaited:
+        the entity is then refreshed without blocking the event loop.
+
         Parameters
         ----------
         timeout : int, optional
             The timeout in seconds, by default 600
-        poll_interval : int, optional
-            The polling interval in seconds, by default 5.
+        poll_interval : float, optional
+            Fixed polling interval in seconds. By default, polling is adaptive:
+            it starts fast, backs off while the progress does not change, and
+            is scheduled around the completion time predicted from the
+            progress (see `AdaptivePoller`).
 
         Returns
         -------
         EntityWithTaskProgress
             The updated entity instance after completion.
         """
+        if self._is_bound_to_async_client():
+            return self._wait_for_completion_async(timeout, poll_interval)
+
+        poller = AdaptivePoller() if poll_interval is None else None
         end_time = time.perf_counter() + timeout
         if self.is_running():
             self.refresh()
         while time.perf_counter() < end_time:
             if not self.is_running():
                 break
-            sleep(poll_interval)
+            sleep(self._next_poll_delay(poller, poll_interval, end_time))
             self.refresh()
 
+        return self._check_completion()
+
+    async def _wait_for_completion_async(
+        self: T, timeout: float, poll_interval: Optional[float]
+    ) -> T:
+        poller = AdaptivePoller() if poll_interval is None else None
+        end_time = time.perf_counter() + timeout
+        if self.is_running():
+            await self.refresh()
+        while time.perf_counter() < end_time:
+            if not self.is_running():
+                break
+            await asyncio.sleep(self._next_poll_delay(poller, poll_interval, end_time))
+            await self.refresh()
+
+        return self._check_completion()
+
+    def _is_bound_to_async_client(self) -> bool:
+        # Only imported once a client exists, to keep `import giskard_hub` cheap
+        from .._base_client import (  # pylint: disable=import-outside-toplevel
+            AsyncClient,
+        )
+
+        return isinstance(self._client, AsyncClient)
+
+    def _next_poll_delay(
+        self,
+        poller: Optional[AdaptivePoller],
+        poll_interval: Optional[float],
+        end_time: float,
+    ) -> float:
+        now = time.perf_counter()
+        delay = poller.next_delay(self.progress, now) if poller else poll_interval
+        return max(0.0, min(delay, end_time - now))
+
+    def _check_completion(self: T) -> T:
         if self.is_finished():
             return self
 
@@ -151,7 +263,10 @@ class EntityWithTaskProgress(Entity, ABC):
         )
 
     def refresh(self: T) -> T:
-        """Refresh the entity data from the API."""
+        """Refresh the entity data from the API.
+
+        If the entity is bound to an `AsyncHubClient`, the result must be awaited.
+        """
         if not self._client or not self.id:
             raise ValueError(
                 f"This {self.resource} instance with id '{self.id}' is detached or unsaved and cannot be refreshed."
@@ -159,13 +274,11 @@ class EntityWithTaskProgress(Entity, ABC):
 
         # Use the abstract resource property for the API call
         resource = self.resource
-        data = getattr(self._client, resource).retrieve(self.id)
-        self._hydrate(data)
-
-        return self
+        data = getattr(self._client, resource).retrieve(self.id, raw=False)
+        return self._hydrate_from(data)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Model(Entity):
     """Model entity.
 
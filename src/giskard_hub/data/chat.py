@@ -6,7 +6,7 @@ from typing import Any, Literal, Optional
 from ._base import BaseData
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage(BaseData):
     """Message from an LLM, with role & content."""
 
@@ -14,6 +14,6 @@ class ChatMessage(BaseData):
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessageWithMetadata(ChatMessage):
     metadata: Optional[dict[str, Any]] = None
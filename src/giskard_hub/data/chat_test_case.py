@@ -9,7 +9,7 @@ from ._entity import Entity
 from .chat import ChatMessage, ChatMessageWithMetadata
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ChatTestCase(Entity):
     """A Dataset entry representing a chat test case.
 
@@ -46,7 +46,7 @@ class ChatTestCase(Entity):
         checks = _format_checks_to_cli(data.get("checks", []))
 
         # Create the object with processed data
-        obj = super().from_dict(
+        obj = super(ChatTestCase, cls).from_dict(
             {
                 **data,
                 "messages": messages,
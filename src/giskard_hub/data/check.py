@@ -14,7 +14,7 @@ class TestCaseCheckConfig(BaseData):
 
 
 # SDK DTO
-@dataclass
+@dataclass(slots=True, eq=False)
 class Check(Entity):
     identifier: str
     description: str
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from ._entity import EntityWithTaskProgress
 from .chat_test_case import ChatTestCase
 from .task import TaskProgress
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Dataset(EntityWithTaskProgress):
     """Dataset object, containing the metadata about the dataset."""
 
@@ -21,9 +21,30 @@ class Dataset(EntityWithTaskProgress):
     def chat_test_cases(self):
         """Return the chat test cases of the dataset."""
         if self._client and self.id:
-            return self._client.chat_test_cases.list(dataset_id=self.id)
+            return self._client.chat_test_cases.list(dataset_id=self.id, raw=False)
         return None
 
+    def iter_chat_test_cases(self, **kwargs):
+        """Lazily iterate over the chat test cases of the dataset, page by page.
+
+        Parameters
+        ----------
+        **kwargs
+            Pagination options (`page_size`, `prefetch`) forwarded to
+            `ChatTestCasesResource.iter`.
+
+        Returns
+        -------
+        Iterator[ChatTestCase]
+            An iterator over the chat test cases (an async iterator if the
+            dataset is bound to an `AsyncHubClient`).
+        """
+        if not self._client or not self.id:
+            raise ValueError(
+                "This dataset instance is detached or unsaved, cannot iterate over chat test cases."
+            )
+        return self._client.chat_test_cases.iter(dataset_id=self.id, **kwargs)
+
     def create_chat_test_case(self, chat_test_case: ChatTestCase):
         """Add a chat test case to the dataset."""
         if not self._client or not self.id:
@@ -40,6 +61,31 @@ class Dataset(EntityWithTaskProgress):
             checks=chat_test_case.checks,
         )
 
+    def create_chat_test_cases(self, chat_test_cases: Iterable[ChatTestCase], **kwargs):
+        """Add many chat test cases to the dataset, with concurrent requests.
+
+        Parameters
+        ----------
+        chat_test_cases : Iterable[ChatTestCase]
+            The chat test cases to add.
+        **kwargs
+            Options (`concurrency`) forwarded to `ChatTestCasesResource.create_many`.
+
+        Returns
+        -------
+        List[BulkResult]
+            For each chat test case, the created chat test case or the error
+            raised by the Hub (a coroutine if the dataset is bound to an
+            `AsyncHubClient`).
+        """
+        if not self._client or not self.id:
+            raise ValueError(
+                "This dataset instance is detached or unsaved, cannot add chat test cases."
+            )
+        return self._client.chat_test_cases.create_many(
+            self.id, chat_test_cases, **kwargs
+        )
+
     @classmethod
     def from_dict(cls, data: dict, **kwargs) -> "Dataset":
         """Create a Dataset instance from a dictionary."""
@@ -47,7 +93,7 @@ class Dataset(EntityWithTaskProgress):
         if "status" in data and data["status"]:
             # Map status to progress for EntityWithTaskProgress compatibility
             data["progress"] = TaskProgress.from_dict(data["status"])
-        return super().from_dict(data, **kwargs)
+        return super(Dataset, cls).from_dict(data, **kwargs)
 
     @property
     def resource(self) -> str:
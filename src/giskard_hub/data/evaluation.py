@@ -4,10 +4,7 @@ import math
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
-from rich.console import Console
-from rich.table import Table
-
-from ._base import BaseData
+from ._base import BaseData, Unparsed, lazy_fields
 from ._entity import Entity, EntityWithTaskProgress
 from .chat_test_case import ChatTestCase
 from .dataset import Dataset
@@ -58,7 +55,7 @@ class Metric(BaseData):
         return self.passed / tot * 100
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 # pylint: disable=too-many-instance-attributes
 class EvaluationRun(EntityWithTaskProgress):
     """Evaluation run."""
@@ -73,10 +70,32 @@ class EvaluationRun(EntityWithTaskProgress):
     failure_categories: Dict[str, int] = field(default_factory=dict)
     scheduled_evaluation_id: str | None = None
 
+    _submission_errors: Dict[str, Exception] = field(
+        init=False, repr=False, default_factory=dict
+    )
+
     @property
     def resource(self) -> str:
         return "evaluations"
 
+    @property
+    def submission_errors(self) -> Dict[str, Exception]:
+        """Errors raised when submitting the outputs of a local model, by entry ID.
+
+        Only set on the run returned by `HubClient.evaluate` for a local model:
+        the entries listed here were left unanswered.
+        """
+        return self._submission_errors
+
+    def _hydrate(self, data, names=None):
+        # The submission errors are not returned by the Hub, keep them on refresh
+        submission_errors = self._submission_errors
+        # Zero-argument `super()` does not work in slotted dataclasses
+        super(EvaluationRun, self)._hydrate(  # pylint: disable=super-with-arguments
+            data, names
+        )
+        self._submission_errors = submission_errors
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any], **kwargs) -> "EvaluationRun":
         data = dict(data)
@@ -87,10 +106,15 @@ class EvaluationRun(EntityWithTaskProgress):
         data["progress"] = TaskProgress.from_dict(data.get("status", {}))
         data["metrics"] = [Metric.from_dict(m) for m in data.get("metrics", [])]
 
-        return super().from_dict(data, **kwargs)
+        return super(EvaluationRun, cls).from_dict(data, **kwargs)
 
     def print_metrics(self):
         """Print the evaluation metrics."""
+        # pylint: disable=import-outside-toplevel
+        # rich is only imported when printing, to keep the package import fast
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
         table = Table(
             "Metric",
@@ -136,9 +160,16 @@ class FailureCategoryResult(BaseData):
         return super().from_dict(data)
 
 
-@dataclass
+@lazy_fields("chat_test_case", "model_output", "failure_category")
+@dataclass(slots=True, eq=False)
 class EvaluationEntry(Entity):
-    """Evaluation entry."""
+    """Evaluation entry.
+
+    By default, the `chat_test_case`, `model_output` and `failure_category`
+    payloads are only parsed when first accessed, so that reading the
+    `results` and `status` of many entries does not pay for it. Until then,
+    the raw payloads are kept in memory.
+    """
 
     run_id: str
     chat_test_case: ChatTestCase
@@ -148,18 +179,22 @@ class EvaluationEntry(Entity):
     failure_category: FailureCategoryResult | None = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any], **kwargs) -> "EvaluationEntry":
+    def from_dict(
+        cls, data: Dict[str, Any], *, lazy: bool = True, **kwargs
+    ) -> "EvaluationEntry":
         data = dict(data)
 
-        # Process `chat_test_case` payload
-        data["chat_test_case"] = ChatTestCase.from_dict(data["chat_test_case"])
+        def parse(parser, value):
+            return Unparsed(parser, value) if lazy else parser(value)
+
+        data["chat_test_case"] = parse(ChatTestCase.from_dict, data["chat_test_case"])
 
         output = data.get("output")
-        data["model_output"] = ModelOutput.from_dict(output) if output else None
+        data["model_output"] = parse(ModelOutput.from_dict, output) if output else None
 
         failure_category = data.get("failure_category")
         data["failure_category"] = (
-            FailureCategoryResult.from_dict(failure_category)
+            parse(FailureCategoryResult.from_dict, failure_category)
             if failure_category
             else None
         )
@@ -168,7 +203,7 @@ class EvaluationEntry(Entity):
         if run_id:
             data["run_id"] = run_id
 
-        return super().from_dict(data, **kwargs)
+        return super(EvaluationEntry, cls).from_dict(data, **kwargs)
 
 
 class EvaluatorResult(BaseData):
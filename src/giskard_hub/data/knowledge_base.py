@@ -10,20 +10,20 @@ if TYPE_CHECKING:
     from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Document(Entity):
     content: str
     topic_id: "UUID" | None = None
     embedding: list[float] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Topic(Entity):
     name: str
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class KnowledgeBase(EntityWithTaskProgress):
     name: str
     project_id: str
@@ -39,7 +39,7 @@ class KnowledgeBase(EntityWithTaskProgress):
         if "status" in data and data["status"]:
             # Map status to progress for EntityWithTaskProgress compatibility
             data["progress"] = TaskProgress.from_dict(data["status"])
-        return super().from_dict(data, **kwargs)
+        return super(KnowledgeBase, cls).from_dict(data, **kwargs)
 
     @property
     def resource(self) -> str:
@@ -16,7 +16,7 @@ class ExecutionError(BaseData):
     details: Dict[str, any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelOutput(BaseData):
     """Model output."""
 
@@ -37,7 +37,7 @@ class ModelOutput(BaseData):
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Model(Entity):
     """Model"""
 
@@ -51,16 +51,19 @@ class Model(Entity):
     @classmethod
     def from_dict(cls, data: Dict[str, str], **kwargs) -> "Model":
         data = dict(data)
-        headers = data.get("headers", {})
-        if not isinstance(headers, dict):
+        headers = data.get("headers")
+        if headers is not None and not isinstance(headers, dict):
             try:
-                headers = {h["name"]: h["value"] for h in headers}
+                data["headers"] = {h["name"]: h["value"] for h in headers}
             except KeyError as e:
                 raise ValueError("Invalid model headers.") from e
 
-        data["headers"] = headers
-
-        return super().from_dict(data, **kwargs)
+        model = super(Model, cls).from_dict(data, **kwargs)
+        # Nested model summaries have no headers: they are not passed above, so
+        # that they do not erase the headers of a model shared by the client
+        if model.headers is None:
+            model.headers = {}
+        return model
 
     def chat(self, messages: List[ChatMessage]) -> ModelOutput:
         """Chat with the model.
@@ -26,7 +26,7 @@ class FailureCategory(BaseData):
     description: str
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Project(Entity):
     """Project
 
@@ -1,10 +1,10 @@
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 from typing import Any, Dict, List, Optional
 
-from rich.console import Console
-from rich.table import Table
-
 from ._base import BaseData
 from ._entity import Entity, EntityWithTaskProgress
 from .chat import ChatMessageWithMetadata
@@ -48,7 +48,7 @@ class AttemptError(BaseData):
     message: str
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ProbeAttempt(Entity):
     probe_result_id: str
     messages: List[ChatMessageWithMetadata]
@@ -77,7 +77,7 @@ class ProbeAttempt(Entity):
 
         data["severity"] = Severity(data.get("severity", Severity.SAFE.value))
 
-        return super().from_dict(data, **kwargs)
+        return super(ProbeAttempt, cls).from_dict(data, **kwargs)
 
     @property
     def reviewed(self) -> bool:
@@ -90,7 +90,7 @@ class ScanMetric(BaseData):
     count: int
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ProbeResult(EntityWithTaskProgress):
     scan_result_id: str
     probe_lidar_id: str
@@ -113,13 +113,13 @@ class ProbeResult(EntityWithTaskProgress):
                 ScanMetric.from_dict(metric) for metric in data.get("metrics")
             ]
 
-        return super().from_dict(data, **kwargs)
+        return super(ProbeResult, cls).from_dict(data, **kwargs)
 
     @property
     def attempts(self) -> List[ProbeAttempt]:
         if not self.id:
             raise ValueError("ProbeResult must have an ID to fetch attempts.")
-        return self._client.scans.list_attempts(self.id)
+        return self._client.scans.list_attempts(self.id, raw=False)
 
     @property
     def resource(self) -> str:
@@ -134,13 +134,167 @@ class ProbeResult(EntityWithTaskProgress):
 
         # Use the abstract resource property for the API call
         resource = self.resource
-        data = getattr(self._client, resource).retrieve_probe(self.id)
-        self._hydrate(data)
+        data = getattr(self._client, resource).retrieve_probe(self.id, raw=False)
+        return self._hydrate_from(data)
+
+
+@dataclass
+class ProbeSummary(BaseData):
+    """Summary of the results of a probe.
+
+    Attributes
+    ----------
+    category : str
+        Title of the category of the probe.
+    probe_name : str
+        Name of the probe.
+    status : TaskStatus, optional
+        Status of the probe if it is not finished, None otherwise.
+    severity : Severity, optional
+        Maximum severity of the attempts, None if the probe is not finished.
+    num_issues : int, optional
+        Number of attempts with a severity above `Severity.SAFE`.
+    num_attacks : int, optional
+        Number of attempts.
+    """
+
+    category: str
+    probe_name: str
+    status: TaskStatus | None = None
+    severity: Severity | None = None
+    num_issues: int | None = None
+    num_attacks: int | None = None
+
+    @classmethod
+    def from_severities(
+        cls, category: str, probe_name: str, severities: List[Severity]
+    ) -> "ProbeSummary":
+        """Summarize a finished probe from the severities of its attempts."""
+        return cls(
+            category=category,
+            probe_name=probe_name,
+            severity=max(severities, default=Severity.SAFE),
+            num_issues=sum(1 for severity in severities if severity > Severity.SAFE),
+            num_attacks=len(severities),
+        )
 
-        return self
+    @classmethod
+    def from_metrics(
+        cls, category: str, probe_name: str, metrics: List[ScanMetric]
+    ) -> "ProbeSummary":
+        """Summarize a finished probe from its number of attempts per severity."""
+        counts = {}
+        for metric in metrics:
+            severity = Severity(metric.severity)
+            counts[severity] = counts.get(severity, 0) + metric.count
+
+        return cls(
+            category=category,
+            probe_name=probe_name,
+            severity=max(
+                (severity for severity, count in counts.items() if count > 0),
+                default=Severity.SAFE,
+            ),
+            num_issues=sum(
+                count for severity, count in counts.items() if severity > Severity.SAFE
+            ),
+            num_attacks=sum(counts.values()),
+        )
 
 
 @dataclass
+class AttemptStats(BaseData):
+    """Running counts of the attempts of a scan, by probe category and severity.
+
+    Attributes
+    ----------
+    counts : Dict[str, Dict[Severity, int]]
+        Number of attempts per probe category id, then per severity.
+    """
+
+    counts: Dict[str, Dict[Severity, int]] = field(default_factory=dict)
+
+    def record(self, category: str, severity: Severity) -> None:
+        """Count an attempt of the given category and severity."""
+        by_severity = self.counts.setdefault(category, {})
+        by_severity[severity] = by_severity.get(severity, 0) + 1
+
+    @property
+    def total(self) -> int:
+        """Number of attempts counted."""
+        return sum(self.by_category.values())
+
+    @property
+    def by_category(self) -> Dict[str, int]:
+        """Number of attempts per probe category id."""
+        return {
+            category: sum(by_severity.values())
+            for category, by_severity in self.counts.items()
+        }
+
+    @property
+    def by_severity(self) -> Dict[Severity, int]:
+        """Number of attempts per severity, across categories."""
+        totals = {}
+        for by_severity in self.counts.values():
+            for severity, count in by_severity.items():
+                totals[severity] = totals.get(severity, 0) + count
+        return totals
+
+
+def _needs_attempts(probe: ProbeResult, fast: bool) -> bool:
+    return probe.progress.status == TaskStatus.FINISHED and not (fast and probe.metrics)
+
+
+def _summarize_probe(
+    probe: ProbeResult,
+    category_map: Dict[str, str],
+    attempts: Optional[List[Dict[str, Any]]],
+) -> ProbeSummary:
+    # Get category name from mapping, fallback to ID if not found
+    category_name = category_map.get(probe.probe_category, probe.probe_category)
+
+    # Clean probe name
+    probe_name = probe.probe_name
+    if probe_name.endswith(" Probe"):
+        probe_name = probe_name[:-6]
+
+    if probe.progress.status != TaskStatus.FINISHED:
+        # For non-finished probes, store the status
+        return ProbeSummary(
+            category=category_name, probe_name=probe_name, status=probe.progress.status
+        )
+
+    if attempts is None:
+        return ProbeSummary.from_metrics(category_name, probe_name, probe.metrics)
+
+    severities = [
+        Severity(attempt.get("severity", Severity.SAFE.value)) for attempt in attempts
+    ]
+    return ProbeSummary.from_severities(category_name, probe_name, severities)
+
+
+def _sorted_summaries(
+    probe_results: List[ProbeResult],
+    categories: List[ScanCategory],
+    attempts: Dict[str, List[Dict[str, Any]]],
+) -> List[ProbeSummary]:
+    category_map = {cat.id: cat.title for cat in categories}
+    summaries = [
+        _summarize_probe(probe, category_map, attempts.get(probe.id))
+        for probe in probe_results
+    ]
+    summaries.sort(
+        key=lambda x: (
+            x.category,
+            -(x.severity if x.severity is not None else -1),
+            x.probe_name,
+        )
+    )
+    return summaries
+
+
+@dataclass(slots=True, eq=False)
 class ScanResult(EntityWithTaskProgress):
     model: Model
     project_id: str
@@ -177,13 +331,13 @@ class ScanResult(EntityWithTaskProgress):
             data["progress"] = TaskProgress.from_dict(data.get("status"))
             del data["status"]
 
-        return super().from_dict(data, **kwargs)
+        return super(ScanResult, cls).from_dict(data, **kwargs)
 
     @property
     def results(self) -> List[ProbeResult]:
         if not self.id:
             raise ValueError("ScanResult must have an ID to fetch probes.")
-        return self._client.scans.list_probes(scan_id=self.id)
+        return self._client.scans.list_probes(scan_id=self.id, raw=False)
 
     @property
     def resource(self) -> str:
@@ -196,14 +350,118 @@ class ScanResult(EntityWithTaskProgress):
                 "This scan result instance is detached or unsaved and cannot be refreshed."
             )
 
-        data = self._client.scans.retrieve(self.id)
-        self._hydrate(data)
+        data = self._client.scans.retrieve(self.id, raw=False)
+        return self._hydrate_from(data)
+
+    def _probe_summaries(self, *, fast: bool, max_workers: int) -> List[ProbeSummary]:
+        """Summarize the probes of the scan.
+
+        The categories (cached by the resource), the probes and the attempts of
+        the finished probes are fetched concurrently, with at most
+        `max_workers` requests in flight. With `fast`, the attempts are only
+        fetched for the probes without metrics.
+
+        When the scan is bound to an `AsyncHubClient`, an awaitable resolving
+        to the summaries is returned.
+        """
+        if self._is_bound_to_async_client():
+            return self._probe_summaries_async(fast=fast, max_workers=max_workers)
+
+        scans = self._client.scans
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="giskard-hub-scan"
+        ) as pool:
+            categories = pool.submit(scans.list_categories)
+            probe_results = self.results
+
+            # Only the severities are needed, so the attempts are not parsed
+            attempts = {
+                probe.id: pool.submit(scans.list_attempts, probe.id, raw=True)
+                for probe in probe_results
+                if _needs_attempts(probe, fast)
+            }
+
+            return _sorted_summaries(
+                probe_results,
+                categories.result(),
+                {probe_id: future.result() for probe_id, future in attempts.items()},
+            )
+
+    async def _probe_summaries_async(
+        self, *, fast: bool, max_workers: int
+    ) -> List[ProbeSummary]:
+        scans = self._client.scans
+        semaphore = asyncio.Semaphore(max_workers)
 
-        return self
+        async def list_attempts(probe_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await scans.list_attempts(probe_id, raw=True)
+
+        categories, probe_results = await asyncio.gather(
+            scans.list_categories(), self.results
+        )
+        probe_ids = [
+            probe.id for probe in probe_results if _needs_attempts(probe, fast)
+        ]
+        attempts = await asyncio.gather(*(list_attempts(p) for p in probe_ids))
+
+        return _sorted_summaries(
+            probe_results, categories, dict(zip(probe_ids, attempts))
+        )
+
+    def summary(self, *, fast: bool = True, max_workers: int = 8) -> List[ProbeSummary]:
+        """Summarize the results of the scan, probe by probe.
+
+        Parameters
+        ----------
+        fast : bool, optional
+            Whether to compute the number of issues and attacks, and the
+            maximum severity, from the metrics of the probes, by default True.
+            The attempts are only fetched for the probes without metrics.
+            Otherwise, the attempts of all the finished probes are fetched.
+        max_workers : int, optional
+            Maximum number of concurrent requests used to fetch the attempts of
+            the probes, by default 8.
+
+        Returns
+        -------
+        List[ProbeSummary]
+            The summary of each probe, sorted by category, decreasing severity
+            and name (an awaitable if the scan is bound to an `AsyncHubClient`).
+        """
+        return self._probe_summaries(fast=fast, max_workers=max_workers)
+
+    def print_metrics(self, fast: bool = False, max_workers: int = 8):
+        """Print the scan metrics.
+
+        When the scan is bound to an `AsyncHubClient`, a coroutine printing the
+        metrics is returned, and must be awaited.
+
+        Parameters
+        ----------
+        fast : bool, optional
+            Whether to compute the results from the metrics of the probes,
+            instead of fetching all their attempts, by default False. See
+            `summary`.
+        max_workers : int, optional
+            Maximum number of concurrent requests used to fetch the attempts of
+            the probes, by default 8.
+        """
+        summaries = self._probe_summaries(fast=fast, max_workers=max_workers)
+        if inspect.isawaitable(summaries):
+            return self._print_summaries_async(summaries)
+
+        self._print_summaries(summaries)
+        return None
+
+    async def _print_summaries_async(self, summaries):
+        self._print_summaries(await summaries)
+
+    def _print_summaries(self, summaries: List[ProbeSummary]):
+        # pylint: disable=import-outside-toplevel
+        from rich.console import Console
+        from rich.table import Table
 
-    def print_metrics(self):
-        """Print the scan metrics."""
-        # pylint: disable=too-many-locals,too-many-branches
         console = Console()
         table = Table(
             "Category",
@@ -213,91 +471,33 @@ class ScanResult(EntityWithTaskProgress):
             title=f"Scan Result [bold cyan]{self.id}[/bold cyan]",
         )
 
-        category_map = {
-            cat.id: cat.title for cat in self._client.scans.list_categories()
-        }
-        probe_results = self.results
-        probe_data = []
-
-        for probe in probe_results:
-            # Get category name from mapping, fallback to ID if not found
-            category_name = category_map.get(probe.probe_category, probe.probe_category)
-
-            # Clean probe name
-            probe_name = probe.probe_name
-            if probe_name.endswith(" Probe"):
-                probe_name = probe_name[:-6]
-
-            # Check if the probe is finished
-            if probe.progress.status != TaskStatus.FINISHED:
-                # For non-finished probes, store the status
-                probe_data.append(
-                    {
-                        "category": category_name,
-                        "probe_name": probe_name,
-                        "status": probe.progress.status,
-                        "severity": None,
-                        "num_issues": None,
-                        "num_attacks": None,
-                    }
-                )
-            else:
-                attempts = probe.attempts
-                num_attacks = len(attempts)
-                num_issues = sum(
-                    1 for attempt in attempts if attempt.severity > Severity.SAFE
-                )
-
-                max_severity = max(
-                    (attempt.severity for attempt in attempts), default=Severity.SAFE
-                )
-
-                probe_data.append(
-                    {
-                        "category": category_name,
-                        "probe_name": probe_name,
-                        "status": None,
-                        "severity": max_severity,
-                        "num_issues": num_issues,
-                        "num_attacks": num_attacks,
-                    }
-                )
-
-        probe_data.sort(
-            key=lambda x: (
-                x["category"],
-                -(x["severity"] if x["severity"] is not None else -1),
-                x["probe_name"],
-            )
-        )
-
         # Add rows to table
-        for data in probe_data:
-            if data["status"] is not None:
+        for summary in summaries:
+            if summary.status is not None:
                 status_color = "bright_black"
                 severity_text = (
-                    f"[{status_color}]{data['status'].value.upper()}[/{status_color}]"
+                    f"[{status_color}]{summary.status.value.upper()}[/{status_color}]"
                 )
-                results_text = data["status"].value.capitalize()
+                results_text = summary.status.value.capitalize()
 
                 table.add_row(
-                    data["category"],
-                    data["probe_name"],
+                    summary.category,
+                    summary.probe_name,
                     severity_text,
                     results_text,
                 )
             else:
-                if data["severity"] == Severity.CRITICAL:
+                if summary.severity == Severity.CRITICAL:
                     color = "red"
-                elif data["severity"] == Severity.MAJOR:
+                elif summary.severity == Severity.MAJOR:
                     color = "yellow"
-                elif data["severity"] == Severity.MINOR:
+                elif summary.severity == Severity.MINOR:
                     color = "orange"
                 else:
                     color = "green"
 
-                num_issues = data["num_issues"]
-                num_attacks = data["num_attacks"]
+                num_issues = summary.num_issues
+                num_attacks = summary.num_attacks
 
                 if num_issues == 0:
                     issues_text = "[bold]No issues found[/bold]"
@@ -312,9 +512,9 @@ class ScanResult(EntityWithTaskProgress):
                 results_text = f"{issues_text} / {attacks_text}"
 
                 table.add_row(
-                    data["category"],
-                    data["probe_name"],
-                    f"[{color}]{data['severity'].name}[/{color}]",
+                    summary.category,
+                    summary.probe_name,
+                    f"[{color}]{summary.severity.name}[/{color}]",
                     results_text,
                 )
 
@@ -5,9 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Literal, Union
 
-from dateutil import parser
-
-from ._entity import Entity
+from ._entity import Entity, parse_datetime
 
 
 class FrequencyOption(str, Enum):
@@ -45,7 +43,15 @@ class ErrorExecutionStatus:
 ExecutionStatus = Union[SuccessExecutionStatus, ErrorExecutionStatus]
 
 
-@dataclass
+def _parse_execution_status(data: dict[str, Any]) -> ExecutionStatus | dict[str, Any]:
+    if data.get("status") == "success":
+        return SuccessExecutionStatus.from_dict(data)
+    if data.get("status") == "error":
+        return ErrorExecutionStatus.from_dict(data)
+    return data
+
+
+@dataclass(slots=True, eq=False)
 class ScheduledEvaluation(Entity):  # pylint: disable=too-many-instance-attributes
     """Scheduled evaluation entity.
 
@@ -93,29 +99,18 @@ class ScheduledEvaluation(Entity):  # pylint: disable=too-many-instance-attribut
     last_execution_at: datetime | None = None
     last_execution_status: ExecutionStatus | None = None
 
+    _from_dict_converters = {
+        **Entity._from_dict_converters,
+        "frequency": FrequencyOption,
+        "last_execution_at": parse_datetime,
+        "last_execution_status": _parse_execution_status,
+    }
+
     @classmethod
     def from_dict(
         cls, data: dict[str, Any], *, _client=None, **kwargs: Any
     ) -> "ScheduledEvaluation":
-        data = dict(data)
-        if data.get("frequency"):
-            data["frequency"] = FrequencyOption(data["frequency"])
-        if data.get("last_execution_at"):
-            data["last_execution_at"] = parser.parse(data["last_execution_at"])
-
-        # Handle execution status
-        if data.get("last_execution_status"):
-            status_data = data["last_execution_status"]
-            if status_data.get("status") == "success":
-                data["last_execution_status"] = SuccessExecutionStatus.from_dict(
-                    status_data
-                )
-            elif status_data.get("status") == "error":
-                data["last_execution_status"] = ErrorExecutionStatus.from_dict(
-                    status_data
-                )
-
-        return super().from_dict(data, **kwargs)
+        return super(ScheduledEvaluation, cls).from_dict(data, **kwargs)
 
     @property
     def resource(self) -> str:
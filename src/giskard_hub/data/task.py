@@ -14,7 +14,7 @@ class TaskStatus(str, Enum):
     CANCELED = "canceled"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskProgress(BaseData):
     status: TaskStatus
     current: int
@@ -1,21 +1,44 @@
-from .chat_test_cases import ChatTestCasesResource
-from .checks import ChecksResource
-from .datasets import DatasetsResource
-from .evaluations import EvaluationsResource
-from .knowledge_bases import KnowledgeBasesResource
-from .models import ModelsResource
-from .projects import ProjectsResource
-from .scans import ScansResource
-from .scheduled_evaluations import ScheduledEvaluationsResource
+from __future__ import annotations
 
-__all__ = [
-    "ProjectsResource",
-    "DatasetsResource",
-    "ChatTestCasesResource",
-    "ChecksResource",
-    "ModelsResource",
-    "EvaluationsResource",
-    "KnowledgeBasesResource",
-    "ScansResource",
-    "ScheduledEvaluationsResource",
-]
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .chat_test_cases import AsyncChatTestCasesResource, ChatTestCasesResource
+    from .checks import AsyncChecksResource, ChecksResource
+    from .datasets import AsyncDatasetsResource, DatasetsResource
+    from .evaluations import AsyncEvaluationsResource, EvaluationsResource
+    from .knowledge_bases import AsyncKnowledgeBasesResource, KnowledgeBasesResource
+    from .models import AsyncModelsResource, ModelsResource
+    from .projects import AsyncProjectsResource, ProjectsResource
+    from .scans import AsyncScansResource, ScansResource
+    from .scheduled_evaluations import (
+        AsyncScheduledEvaluationsResource,
+        ScheduledEvaluationsResource,
+    )
+
+_ATTRIBUTES = {
+    "ProjectsResource": ".projects",
+    "DatasetsResource": ".datasets",
+    "ChatTestCasesResource": ".chat_test_cases",
+    "ChecksResource": ".checks",
+    "ModelsResource": ".models",
+    "EvaluationsResource": ".evaluations",
+    "KnowledgeBasesResource": ".knowledge_bases",
+    "ScansResource": ".scans",
+    "ScheduledEvaluationsResource": ".scheduled_evaluations",
+    "AsyncProjectsResource": ".projects",
+    "AsyncDatasetsResource": ".datasets",
+    "AsyncChatTestCasesResource": ".chat_test_cases",
+    "AsyncChecksResource": ".checks",
+    "AsyncModelsResource": ".models",
+    "AsyncEvaluationsResource": ".evaluations",
+    "AsyncKnowledgeBasesResource": ".knowledge_bases",
+    "AsyncScansResource": ".scans",
+    "AsyncScheduledEvaluationsResource": ".scheduled_evaluations",
+}
+
+__all__ = list(_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _ATTRIBUTES)
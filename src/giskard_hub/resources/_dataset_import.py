@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..data.chat import ChatMessage, ChatMessageWithMetadata
+from ..data.check import CheckConfig
+from ..errors import HubAPIError
+from ._utils import prepare_chat_test_case_data
+
+ImportFormat = Literal["jsonl", "csv"]
+PathLike = Union[str, "os.PathLike[str]"]
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+# Columns of CSV files holding JSON values
+_CSV_JSON_COLUMNS = ("messages", "demo_output", "tags", "checks")
+
+# The checkpoint is saved once this many records are processed, or once this
+# many seconds have passed since it was last saved, and when the import stops
+CHECKPOINT_EVERY_RECORDS = 100
+CHECKPOINT_EVERY_SECONDS = 1.0
+
+# Errors raised when building a chat test case from an invalid record
+_RECORD_ERRORS = (ValueError, TypeError, KeyError, AttributeError)
+
+
+@dataclass
+class DatasetImportResult:
+    """Outcome of the import of a file into a dataset.
+
+    Attributes
+    ----------
+    num_imported : int
+        Number of records imported by this call.
+    num_skipped : int
+        Number of records skipped because a previous import of the file, recorded
+        in the checkpoint, already imported them.
+    errors : Dict[int, Exception]
+        Errors by index of the record in the file (starting at 0, blank lines
+        excluded): `HubAPIError` if the Hub rejected the chat test case, and
+        `ValueError` if the record is invalid. Failed records are retried when
+        the import is resumed.
+    """
+
+    num_imported: int = 0
+    num_skipped: int = 0
+    errors: Dict[int, Exception] = field(default_factory=dict)
+
+
+def resolve_format(path: Path, file_format: Optional[ImportFormat]) -> ImportFormat:
+    if file_format is None:
+        file_format = path.suffix.lower().lstrip(".")
+        if file_format == "json":
+            file_format = "jsonl"
+    if file_format not in ("jsonl", "csv"):
+        raise ValueError(
+            f"Cannot import {str(path)!r}, expected a `jsonl` or `csv` file format."
+        )
+    return file_format
+
+
+def resolve_checkpoint(path: Path, checkpoint: Union[bool, PathLike]) -> Optional[Path]:
+    if checkpoint is True:
+        return path.with_name(path.name + CHECKPOINT_SUFFIX)
+    if checkpoint is False:
+        return None
+    return Path(checkpoint)
+
+
+def decode_record(raw: Any, file_format: ImportFormat) -> Dict[str, Any]:
+    """Decode a line of a JSONL file or a row of a CSV file."""
+    if file_format == "jsonl":
+        return json.loads(raw)
+
+    record = {}
+    for column in _CSV_JSON_COLUMNS:
+        value = raw.get(column)
+        if value:
+            try:
+                record[column] = json.loads(value)
+            except ValueError as e:
+                raise ValueError(f"invalid JSON in the `{column}` column") from e
+    return record
+
+
+def prepare_record(record: Dict[str, Any], dataset_id: str) -> Dict[str, Any]:
+    """Prepare the creation payload of a chat test case from a file record."""
+    if not isinstance(record, dict) or not record.get("messages"):
+        raise ValueError("records must be objects with a non-empty `messages` list")
+
+    demo_output = record.get("demo_output")
+    return prepare_chat_test_case_data(
+        dataset_id=dataset_id,
+        messages=[ChatMessage.from_dict(message) for message in record["messages"]],
+        demo_output=(
+            ChatMessageWithMetadata.from_dict(demo_output) if demo_output else None
+        ),
+        tags=record.get("tags"),
+        checks=[CheckConfig.from_dict(check) for check in record.get("checks") or []],
+    )
+
+
+def _iter_jsonl(
+    path: Path, start: int, offset: int
+) -> Iterator[Tuple[int, Tuple[int, int], bytes]]:
+    with path.open("rb") as f:
+        f.seek(offset)
+        index = start
+        for line in f:
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+            yield index, (line_offset, offset), line
+            index += 1
+
+
+def _iter_csv(path: Path, start: int) -> Iterator[Tuple[int, Tuple[int, int], Any]]:
+    with path.open(newline="", encoding="utf-8") as f:
+        for index, row in enumerate(csv.DictReader(f)):
+            if index >= start:
+                # CSV files cannot be resumed from a byte offset
+                yield index, (0, 0), row
+
+
+class ImportProgress:  # pylint: disable=too-many-instance-attributes
+    """Progress of the import of a file, saved to a checkpoint file.
+
+    Records complete out of order when uploaded concurrently. The checkpoint
+    keeps the number of leading records all processed (with the offset of the
+    next record, to resume without reading the file again), the few records
+    processed after them, and the records that failed, with their offset, to
+    retry them on resume. Apart from the failures, its size is thus bounded by
+    the number of requests in flight, whatever the size of the file.
+    """
+
+    def __init__(self, path: Path, dataset_id: str, checkpoint: Optional[Path]):
+        self.path = path
+        self.dataset_id = dataset_id
+        self.checkpoint = checkpoint
+        self.result = DatasetImportResult()
+
+        self._done = 0
+        self._offset = 0
+        self._processed: Set[int] = set()
+        self._failed: Dict[int, int] = {}
+        self._offsets: Dict[int, Tuple[int, int]] = {}
+
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+        if checkpoint is not None and checkpoint.exists():
+            self._load(checkpoint)
+
+    def _load(self, checkpoint: Path) -> None:
+        state = json.loads(checkpoint.read_text(encoding="utf-8"))
+        if state.get("dataset_id") != self.dataset_id:
+            raise ValueError(
+                f"The checkpoint {str(checkpoint)!r} belongs to the import of another "
+                "dataset. Delete it to import the file again."
+            )
+        self._done = state["done"]
+        self._offset = state["offset"]
+        self._failed = dict(state.get("failed", []))
+        self._processed = set(state["processed"]) - set(self._failed)
+        self.result.num_skipped = self._done - sum(
+            1 for index in self._failed if index < self._done
+        )
+
+    def save(self) -> None:
+        """Write the progress to the checkpoint file, atomically."""
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+        if self.checkpoint is None:
+            return
+        state = {
+            "dataset_id": self.dataset_id,
+            "done": self._done,
+            "offset": self._offset,
+            "processed": sorted(self._processed),
+            "failed": sorted(self._failed.items()),
+        }
+        tmp_path = self.checkpoint.with_name(self.checkpoint.name + ".tmp")
+        tmp_path.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp_path, self.checkpoint)
+
+    def _maybe_save(self) -> None:
+        self._unsaved += 1
+        if (
+            self._unsaved >= CHECKPOINT_EVERY_RECORDS
+            or time.monotonic() - self._saved_at >= CHECKPOINT_EVERY_SECONDS
+        ):
+            self.save()
+
+    def records(self, file_format: ImportFormat) -> Iterator[Tuple[int, Any]]:
+        """Yield the records of the file not imported yet, with their index.
+
+        Records that failed in a previous import are yielded again, reading the
+        file from the first of them.
+        """
+        start, offset = self._done, self._offset
+        if self._failed:
+            start = min(self._failed)
+            offset = self._failed[start]
+
+        if file_format == "jsonl":
+            records = _iter_jsonl(self.path, start, offset)
+        else:
+            records = _iter_csv(self.path, start)
+
+        for index, offsets, raw in records:
+            if index in self._failed:
+                self._offsets[index] = offsets
+                yield index, raw
+            elif index < self._done:
+                continue
+            elif index in self._processed:
+                self._offsets[index] = offsets
+                self.result.num_skipped += 1
+                self.finish(index)
+            else:
+                self._offsets[index] = offsets
+                yield index, raw
+
+    def prepare(
+        self, index: int, raw: Any, file_format: ImportFormat
+    ) -> Optional[Dict[str, Any]]:
+        """Return the payload of a record, or None if it is invalid.
+
+        Invalid records are reported in the errors of the result, with their
+        index, so that the other records are still imported.
+        """
+        try:
+            return prepare_record(decode_record(raw, file_format), self.dataset_id)
+        except _RECORD_ERRORS as e:
+            error = ValueError(f"Invalid record {index} of {self.path}: {e}")
+            error.__cause__ = e
+            self.finish(index, error)
+            return None
+
+    def finish(self, index: int, error: Optional[Exception] = None) -> None:
+        """Record that a record was processed."""
+        if error is not None:
+            self.result.errors[index] = error
+            self._failed[index] = self._offsets[index][0]
+        elif self._failed.pop(index, None) is not None or index not in self._processed:
+            # Records already in `_processed` were imported by a previous import
+            self.result.num_imported += 1
+
+        if index < self._done:
+            # Failed record retried after the records processed before
+            self._offsets.pop(index, None)
+        else:
+            self._processed.add(index)
+        while self._done in self._processed:
+            self._processed.remove(self._done)
+            self._offset = self._offsets.pop(self._done, (0, self._offset))[1]
+            self._done += 1
+        self._maybe_save()
+
+    def finish_all(self, pending: Dict[Any, int], done: Iterable[Any]) -> None:
+        """Record the completed uploads, removing them from the pending ones.
+
+        Errors other than the ones raised by the Hub are raised once all the
+        completed uploads are recorded, leaving their record unprocessed.
+        """
+        unexpected = None
+        for future in done:
+            index = pending.pop(future)
+            try:
+                future.result()
+            except HubAPIError as e:
+                self.finish(index, e)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                unexpected = unexpected or e
+            else:
+                self.finish(index)
+
+        if unexpected is not None:
+            raise unexpected
+
+
+def run_import(
+    progress: ImportProgress,
+    file_format: ImportFormat,
+    upload: Callable[[Dict[str, Any]], Any],
+    *,
+    concurrency: int,
+) -> DatasetImportResult:
+    """Upload the records of the file in threads, see `DatasetsResource.import_file`."""
+    pending: Dict[Future, int] = {}
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="giskard-hub-import"
+    ) as pool:
+        try:
+            for index, raw in progress.records(file_format):
+                payload = progress.prepare(index, raw, file_format)
+                if payload is None:
+                    continue
+                if len(pending) >= concurrency:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    progress.finish_all(pending, done)
+                pending[pool.submit(upload, payload)] = index
+        finally:
+            # Record the uploads in flight, so that they are not repeated on resume
+            try:
+                if pending:
+                    progress.finish_all(pending, wait(pending).done)
+            finally:
+                progress.save()
+    return progress.result
+
+
+async def arun_import(
+    progress: ImportProgress,
+    file_format: ImportFormat,
+    upload: Callable[[Dict[str, Any]], Awaitable[Any]],
+    *,
+    concurrency: int,
+) -> DatasetImportResult:
+    """Async version of `run_import`, uploading the records in tasks."""
+    pending: Dict[asyncio.Future, int] = {}
+    try:
+        for index, raw in progress.records(file_format):
+            payload = progress.prepare(index, raw, file_format)
+            if payload is None:
+                continue
+            if len(pending) >= concurrency:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                progress.finish_all(pending, done)
+            pending[asyncio.ensure_future(upload(payload))] = index
+    finally:
+        # Record the uploads in flight, so that they are not repeated on resume
+        try:
+            if pending:
+                done, _ = await asyncio.wait(pending)
+                progress.finish_all(pending, done)
+        finally:
+            progress.save()
+    return progress.result
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from .._base_client import AsyncClient, SyncClient
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def _page_params(params: Optional[Dict[str, Any]], offset: int, page_size: int):
+    return {**(params or {}), "offset": offset, "limit": page_size}
+
+
+def _is_last_page(data: Dict[str, Any], offset: int, page_size: int) -> bool:
+    items = data.get("items", [])
+    total = data.get("total")
+    if isinstance(total, int) and offset + len(items) >= total:
+        return True
+    return len(items) < page_size
+
+
+def _validate_page_size(page_size: int) -> None:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1.")
+
+
+def iter_pages(
+    client: SyncClient,
+    path: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    params: Optional[Dict[str, Any]] = None,
+    prefetch: bool = True,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Iterate over the pages of an `offset`/`limit` paginated endpoint.
+
+    With `prefetch`, the next page is requested in a background thread while the
+    caller processes the current one, so at most two pages are held in memory.
+
+    Parameters
+    ----------
+    client : SyncClient
+        The client used to request the pages.
+    path : str
+        The path of the paginated endpoint, returning an object with `items`
+        (and optionally `total`).
+    page_size : int, optional
+        The number of items requested per page.
+    params : Dict[str, Any], optional
+        Additional query parameters.
+    prefetch : bool, optional
+        Whether to fetch the next page in the background, by default True.
+
+    Yields
+    ------
+    List[Dict[str, Any]]
+        The raw items of each page.
+    """
+    _validate_page_size(page_size)
+
+    def fetch(offset: int) -> Dict[str, Any]:
+        return client.get(path, params=_page_params(params, offset, page_size))
+
+    if not prefetch:
+        offset = 0
+        while True:
+            data = fetch(offset)
+            yield data.get("items", [])
+            if _is_last_page(data, offset, page_size):
+                return
+            offset += page_size
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="giskard-hub-page")
+    try:
+        offset = 0
+        future = pool.submit(fetch, offset)
+        while True:
+            data = future.result()
+            last_page = _is_last_page(data, offset, page_size)
+            if not last_page:
+                offset += page_size
+                future = pool.submit(fetch, offset)
+
+            yield data.get("items", [])
+
+            if last_page:
+                return
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    client: AsyncClient,
+    path: str,
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    params: Optional[Dict[str, Any]] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Async version of `iter_pages`, prefetching the next page in a task."""
+    _validate_page_size(page_size)
+
+    def fetch(offset: int):
+        return client.get(path, params=_page_params(params, offset, page_size))
+
+    offset = 0
+    pending = asyncio.ensure_future(fetch(offset))
+    try:
+        while True:
+            data = await pending
+            pending = None
+            last_page = _is_last_page(data, offset, page_size)
+            if not last_page:
+                offset += page_size
+                request = fetch(offset)
+                pending = asyncio.ensure_future(request) if prefetch else request
+
+            yield data.get("items", [])
+
+            if last_page:
+                return
+    finally:
+        if pending is not None:
+            if asyncio.isfuture(pending):
+                pending.cancel()
+            else:
+                pending.close()
@@ -1,8 +1,34 @@
-from .._base_client import SyncClient
+from typing import Optional, Type, TypeVar
 
+from .._base_client import AsyncClient, SyncClient
 
-class APIResource:
+T = TypeVar("T")
+
+
+class _BaseAPIResource:
+    _client: SyncClient | AsyncClient
+
+    def _is_raw(self, raw: Optional[bool]) -> bool:
+        """Whether to return the decoded JSON instead of building the entities.
+
+        `raw` is the value given to the method, if any. Otherwise, the
+        `raw_responses` option of the client applies.
+        """
+        return self._client.raw_responses if raw is None else raw
+
+    def _cast_to(self, cls: Type[T], raw: Optional[bool]) -> Optional[Type[T]]:
+        return None if self._is_raw(raw) else cls
+
+
+class APIResource(_BaseAPIResource):
     _client: SyncClient
 
     def __init__(self, client: SyncClient):
         self._client = client
+
+
+class AsyncAPIResource(_BaseAPIResource):
+    _client: AsyncClient
+
+    def __init__(self, client: AsyncClient):
+        self._client = client
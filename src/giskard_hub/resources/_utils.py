@@ -2,7 +2,7 @@ from typing import Any, List, Optional
 
 from giskard_hub.data.check import _format_checks_to_backend
 
-from ..data._base import NOT_GIVEN, filter_not_given, maybe_to_dict
+from ..data._base import NOT_GIVEN, filter_not_given, maybe_to_dict, to_dict_list
 from ..data.chat import ChatMessage, ChatMessageWithMetadata
 from ..data.chat_test_case import CheckConfig
 
@@ -17,13 +17,13 @@ def prepare_chat_test_case_data(
     """Prepare the data for creating or updating a chat test case."""
 
     if messages is not NOT_GIVEN:
-        messages = [maybe_to_dict(msg) for msg in messages]
+        messages = to_dict_list(messages)
     if tags is None:
         tags = []
     if checks is None:
         checks = []
     if checks is not NOT_GIVEN:
-        checks = [maybe_to_dict(check) for check in _format_checks_to_backend(checks)]
+        checks = to_dict_list(_format_checks_to_backend(checks))
 
     return filter_not_given(
         {
@@ -1,18 +1,45 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
 
+from .._bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    BulkResult,
+    arun_bulk,
+    chunked,
+    run_bulk,
+)
 from ..data._base import NOT_GIVEN
 from ..data.chat import ChatMessage, ChatMessageWithMetadata
 from ..data.chat_test_case import ChatTestCase, CheckConfig
-from ._resource import APIResource
+from ._pagination import DEFAULT_PAGE_SIZE, aiter_pages, iter_pages
+from ._resource import APIResource, AsyncAPIResource
 from ._utils import prepare_chat_test_case_data
 
+DEFAULT_DELETE_CHUNK_SIZE = 100
+
+
+def _require_id(chat_test_case: ChatTestCase) -> str:
+    if not chat_test_case.id:
+        raise ValueError("Chat test cases must have an ID to be updated.")
+    return chat_test_case.id
+
+
+def _expand_chunk_results(
+    results: List[BulkResult[List[str], None]],
+) -> List[BulkResult[str, None]]:
+    return [
+        BulkResult(chat_test_case_id, error=result.error)
+        for result in results
+        for chat_test_case_id in result.item
+    ]
+
 
 class ChatTestCasesResource(APIResource):
-    def retrieve(self, chat_test_case_id: str):
+    def retrieve(self, chat_test_case_id: str, *, raw: Optional[bool] = None):
         return self._client.get(
-            f"/chat-test-cases/{chat_test_case_id}", cast_to=ChatTestCase
+            f"/chat-test-cases/{chat_test_case_id}",
+            cast_to=self._cast_to(ChatTestCase, raw),
         )
 
     # pylint: disable=too-many-arguments
@@ -69,9 +96,298 @@ class ChatTestCasesResource(APIResource):
             "/chat-test-cases", params={"chat_test_case_ids": chat_test_case_id}
         )
 
-    def list(self, dataset_id: str) -> List[ChatTestCase]:
+    def create_many(
+        self,
+        dataset_id: str,
+        chat_test_cases: Iterable[ChatTestCase],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult[ChatTestCase, ChatTestCase]]:
+        """Create many chat test cases in a dataset, with concurrent requests.
+
+        Parameters
+        ----------
+        dataset_id : str
+            ID of the dataset to add the chat test cases to.
+        chat_test_cases : Iterable[ChatTestCase]
+            The chat test cases to create. Their ID and timestamps are ignored.
+        concurrency : int, optional
+            Maximum number of requests in flight, by default 8.
+
+        Returns
+        -------
+        List[BulkResult[ChatTestCase, ChatTestCase]]
+            For each chat test case, in order, the created chat test case or the
+            error raised by the Hub. A failure does not stop the other requests.
+        """
+
+        def create(chat_test_case: ChatTestCase) -> ChatTestCase:
+            return self.create(
+                dataset_id=dataset_id,
+                messages=chat_test_case.messages,
+                demo_output=chat_test_case.demo_output,
+                tags=chat_test_case.tags,
+                checks=chat_test_case.checks,
+            )
+
+        return run_bulk(create, chat_test_cases, concurrency=concurrency)
+
+    def update_many(
+        self,
+        chat_test_cases: Iterable[ChatTestCase],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult[ChatTestCase, ChatTestCase]]:
+        """Update many chat test cases, with concurrent requests.
+
+        Parameters
+        ----------
+        chat_test_cases : Iterable[ChatTestCase]
+            The chat test cases to update, identified by their ID. Their messages,
+            demo output, tags and checks are saved.
+        concurrency : int, optional
+            Maximum number of requests in flight, by default 8.
+
+        Returns
+        -------
+        List[BulkResult[ChatTestCase, ChatTestCase]]
+            For each chat test case, in order, the updated chat test case or the
+            error raised for it, e.g. a `ValueError` if it has no ID. A failure
+            does not stop the other requests.
+        """
+
+        def update(chat_test_case: ChatTestCase) -> ChatTestCase:
+            return self.update(
+                _require_id(chat_test_case),
+                messages=chat_test_case.messages,
+                demo_output=chat_test_case.demo_output,
+                tags=chat_test_case.tags,
+                checks=chat_test_case.checks,
+            )
+
+        return run_bulk(update, chat_test_cases, concurrency=concurrency)
+
+    def delete_many(
+        self,
+        chat_test_case_ids: Iterable[str],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult[str, None]]:
+        """Delete many chat test cases, in chunks deleted with concurrent requests.
+
+        Parameters
+        ----------
+        chat_test_case_ids : Iterable[str]
+            IDs of the chat test cases to delete.
+        chunk_size : int, optional
+            Maximum number of chat test cases deleted per request, by default 100,
+            so that the query string of the requests stays short.
+        concurrency : int, optional
+            Maximum number of requests in flight, by default 8.
+
+        Returns
+        -------
+        List[BulkResult[str, None]]
+            For each ID, in order, the error raised when deleting its chunk, if
+            any. A failure does not stop the other requests.
+        """
+        results = run_bulk(
+            self.delete,
+            chunked(chat_test_case_ids, chunk_size),
+            concurrency=concurrency,
+        )
+        return _expand_chunk_results(results)
+
+    def list(
+        self, dataset_id: str, *, raw: Optional[bool] = None
+    ) -> List[ChatTestCase]:
         data = self._client.get(f"/datasets/{dataset_id}/chat-test-cases?limit=100000")
+        if self._is_raw(raw):
+            return data.get("items", [])
         return [
             ChatTestCase.from_dict(d, _client=self._client)
             for d in data.get("items", [])
         ]
+
+    def iter(
+        self,
+        dataset_id: str,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[ChatTestCase]:
+        """Iterate over the chat test cases of a dataset, page by page.
+
+        Unlike `list`, test cases are fetched lazily with `offset`/`limit`
+        pagination, so processing can start as soon as the first page is received.
+
+        Parameters
+        ----------
+        dataset_id : str
+            ID of the dataset.
+        page_size : int, optional
+            Number of chat test cases requested per page.
+        prefetch : bool, optional
+            Whether to fetch the next page in the background while the current
+            one is being processed, by default True.
+
+        Yields
+        ------
+        ChatTestCase
+            The chat test cases of the dataset.
+        """
+        for page in iter_pages(
+            self._client,
+            f"/datasets/{dataset_id}/chat-test-cases",
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            for d in page:
+                yield ChatTestCase.from_dict(d, _client=self._client)
+
+
+class AsyncChatTestCasesResource(AsyncAPIResource):
+    async def retrieve(self, chat_test_case_id: str, *, raw: Optional[bool] = None):
+        return await self._client.get(
+            f"/chat-test-cases/{chat_test_case_id}",
+            cast_to=self._cast_to(ChatTestCase, raw),
+        )
+
+    # pylint: disable=too-many-arguments
+    async def create(
+        self,
+        *,
+        dataset_id: str,
+        messages: List[ChatMessage],
+        demo_output: Optional[ChatMessageWithMetadata] = None,
+        tags: Optional[List[str]] = None,
+        checks: Optional[List[CheckConfig]] = None,
+    ):
+        data = prepare_chat_test_case_data(
+            dataset_id=dataset_id,
+            messages=messages,
+            demo_output=demo_output,
+            tags=tags,
+            checks=checks,
+        )
+
+        return await self._client.post(
+            "/chat-test-cases",
+            json=data,
+            cast_to=ChatTestCase,
+        )
+
+    # pylint: disable=too-many-arguments
+    async def update(
+        self,
+        chat_test_case_id: str,
+        *,
+        dataset_id: str = NOT_GIVEN,
+        messages: List[ChatMessage] = NOT_GIVEN,
+        demo_output: Optional[ChatMessageWithMetadata] = NOT_GIVEN,
+        tags: Optional[List[str]] = NOT_GIVEN,
+        checks: Optional[List[CheckConfig]] = NOT_GIVEN,
+    ) -> ChatTestCase:
+        data = prepare_chat_test_case_data(
+            dataset_id=dataset_id,
+            messages=messages,
+            demo_output=demo_output,
+            tags=tags,
+            checks=checks,
+        )
+
+        return await self._client.patch(
+            f"/chat-test-cases/{chat_test_case_id}",
+            json=data,
+            cast_to=ChatTestCase,
+        )
+
+    async def delete(self, chat_test_case_id: str | List[str]) -> None:
+        await self._client.delete(
+            "/chat-test-cases", params={"chat_test_case_ids": chat_test_case_id}
+        )
+
+    async def create_many(
+        self,
+        dataset_id: str,
+        chat_test_cases: Iterable[ChatTestCase],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult[ChatTestCase, ChatTestCase]]:
+        """Create many chat test cases, see `ChatTestCasesResource.create_many`."""
+
+        def create(chat_test_case: ChatTestCase):
+            return self.create(
+                dataset_id=dataset_id,
+                messages=chat_test_case.messages,
+                demo_output=chat_test_case.demo_output,
+                tags=chat_test_case.tags,
+                checks=chat_test_case.checks,
+            )
+
+        return await arun_bulk(create, chat_test_cases, concurrency=concurrency)
+
+    async def update_many(
+        self,
+        chat_test_cases: Iterable[ChatTestCase],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult[ChatTestCase, ChatTestCase]]:
+        """Update many chat test cases, see `ChatTestCasesResource.update_many`."""
+
+        def update(chat_test_case: ChatTestCase):
+            return self.update(
+                _require_id(chat_test_case),
+                messages=chat_test_case.messages,
+                demo_output=chat_test_case.demo_output,
+                tags=chat_test_case.tags,
+                checks=chat_test_case.checks,
+            )
+
+        return await arun_bulk(update, chat_test_cases, concurrency=concurrency)
+
+    async def delete_many(
+        self,
+        chat_test_case_ids: Iterable[str],
+        *,
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> List[BulkResult[str, None]]:
+        """Delete many chat test cases, see `ChatTestCasesResource.delete_many`."""
+        results = await arun_bulk(
+            self.delete,
+            chunked(chat_test_case_ids, chunk_size),
+            concurrency=concurrency,
+        )
+        return _expand_chunk_results(results)
+
+    async def list(
+        self, dataset_id: str, *, raw: Optional[bool] = None
+    ) -> List[ChatTestCase]:
+        data = await self._client.get(
+            f"/datasets/{dataset_id}/chat-test-cases?limit=100000"
+        )
+        if self._is_raw(raw):
+            return data.get("items", [])
+        return [
+            ChatTestCase.from_dict(d, _client=self._client)
+            for d in data.get("items", [])
+        ]
+
+    async def iter(
+        self,
+        dataset_id: str,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[ChatTestCase]:
+        """Iterate over the chat test cases of a dataset, see `ChatTestCasesResource.iter`."""
+        async for page in aiter_pages(
+            self._client,
+            f"/datasets/{dataset_id}/chat-test-cases",
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            for d in page:
+                yield ChatTestCase.from_dict(d, _client=self._client)
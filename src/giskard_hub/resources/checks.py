@@ -2,17 +2,19 @@ from typing import Any, Dict, List, Optional, Union
 
 from ..data._base import NOT_GIVEN, filter_not_given
 from ..data.check import Check, extract_check_params
-from ._resource import APIResource
+from ._resource import APIResource, AsyncAPIResource
 
 
 class ChecksResource(APIResource):
     _base_url = "/checks"
 
-    def list(self, project_id: str):
+    def list(self, project_id: str, *, raw: Optional[bool] = None):
         data = self._client.get(
             self._base_url,
             params={"project_id": project_id, "filter_builtin": True},
         )
+        if self._is_raw(raw):
+            return data
 
         return [
             Check.from_dict(
@@ -24,8 +26,10 @@ class ChecksResource(APIResource):
             for check in data
         ]
 
-    def retrieve(self, check_id: str):
+    def retrieve(self, check_id: str, *, raw: Optional[bool] = None):
         data = self._client.get(f"{self._base_url}/{check_id}")
+        if self._is_raw(raw):
+            return data
         return Check.from_dict(
             {
                 **data,
@@ -80,3 +84,84 @@ class ChecksResource(APIResource):
 
         data = self._client.patch(f"{self._base_url}/{check_id}", json=data)
         return Check.from_dict({**data, "params": extract_check_params(data)})
+
+
+class AsyncChecksResource(AsyncAPIResource):
+    _base_url = "/checks"
+
+    async def list(self, project_id: str, *, raw: Optional[bool] = None):
+        data = await self._client.get(
+            self._base_url,
+            params={"project_id": project_id, "filter_builtin": True},
+        )
+        if self._is_raw(raw):
+            return data
+
+        return [
+            Check.from_dict(
+                {
+                    **check,
+                    "params": extract_check_params(check),
+                }
+            )
+            for check in data
+        ]
+
+    async def retrieve(self, check_id: str, *, raw: Optional[bool] = None):
+        data = await self._client.get(f"{self._base_url}/{check_id}")
+        if self._is_raw(raw):
+            return data
+        return Check.from_dict(
+            {
+                **data,
+                "params": extract_check_params(data),
+            }
+        )
+
+    async def delete(self, check_id: Union[str, List[str]]) -> None:
+        await self._client.delete(self._base_url, params={"check_ids": check_id})
+
+    # pylint: disable=too-many-arguments
+    async def create(
+        self,
+        *,
+        project_id: str,
+        identifier: str,
+        name: str,
+        params: Dict[str, Any],
+        description: Optional[str] = None,
+    ) -> Check:
+        data = await self._client.post(
+            self._base_url,
+            json={
+                "project_id": project_id,
+                "description": description,
+                "name": name,
+                "identifier": identifier,
+                "assertions": [params],
+            },
+        )
+        return Check.from_dict({**data, "params": extract_check_params(data)})
+
+    # pylint: disable=too-many-arguments
+    async def update(
+        self,
+        check_id: str,
+        *,
+        identifier: Optional[str] = NOT_GIVEN,
+        name: Optional[str] = NOT_GIVEN,
+        description: Optional[str] = NOT_GIVEN,
+        params: Optional[Dict[str, Any]] = NOT_GIVEN,
+    ) -> Check:
+
+        data = filter_not_given(
+            {
+                "identifier": identifier,
+                "name": name,
+                "description": description,
+                "assertions": [params] if params != NOT_GIVEN else NOT_GIVEN,
+            }
+        )
+
+        data = await self._client.patch(f"{self._base_url}/{check_id}", json=data)
+        return Check.from_dict({**data, "params": extract_check_params(data)})
@@ -1,18 +1,46 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional, Union
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
+from .._bulk import DEFAULT_BULK_CONCURRENCY, validate_concurrency
 from ..data._base import NOT_GIVEN, filter_not_given
 from ..data.dataset import Dataset
-from ._resource import APIResource
+from ._dataset_import import (
+    DatasetImportResult,
+    ImportFormat,
+    ImportProgress,
+    PathLike,
+    arun_import,
+    resolve_checkpoint,
+    resolve_format,
+    run_import,
+)
+from ._resource import APIResource, AsyncAPIResource
+
+
+def _import_progress(
+    path: PathLike,
+    dataset_id: str,
+    file_format: Optional[ImportFormat],
+    concurrency: int,
+    checkpoint: Union[bool, PathLike],
+) -> Tuple[ImportProgress, ImportFormat]:
+    validate_concurrency(concurrency)
+    path = Path(path)
+    file_format = resolve_format(path, file_format)
+    progress = ImportProgress(path, dataset_id, resolve_checkpoint(path, checkpoint))
+    return progress, file_format
 
 
 class DatasetsResource(APIResource):
     _base_url = "/datasets"
 
-    def retrieve(self, dataset_id: str):
-        return self._client.get(f"{self._base_url}/{dataset_id}", cast_to=Dataset)
+    def retrieve(self, dataset_id: str, *, raw: Optional[bool] = None):
+        return self._client.get(
+            f"{self._base_url}/{dataset_id}", cast_to=self._cast_to(Dataset, raw)
+        )
 
     def create(self, *, name: str, description: str, project_id: str) -> Dataset:
         return self._client.post(
@@ -45,9 +73,11 @@ class DatasetsResource(APIResource):
     def delete(self, dataset_id: str | List[str]) -> None:
         self._client.delete(self._base_url, params={"datasets_ids": dataset_id})
 
-    def list(self, project_id: str) -> List[Dataset]:
+    def list(self, project_id: str, *, raw: Optional[bool] = None) -> List[Dataset]:
         return self._client.get(
-            self._base_url, params={"project_id": project_id}, cast_to=Dataset
+            self._base_url,
+            params={"project_id": project_id},
+            cast_to=self._cast_to(Dataset, raw),
         )
 
     def generate_adversarial(  # pylint: disable=too-many-arguments
@@ -129,3 +159,184 @@ class DatasetsResource(APIResource):
             json=payload,
             cast_to=Dataset,
         )
+
+    def import_file(  # pylint: disable=too-many-arguments
+        self,
+        path: PathLike,
+        *,
+        dataset_id: str,
+        file_format: Optional[ImportFormat] = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        checkpoint: Union[bool, PathLike] = True,
+    ) -> DatasetImportResult:
+        """Import the chat test cases of a JSONL or CSV file into a dataset.
+
+        The file is read record by record while the chat test cases are uploaded
+        concurrently, so memory usage stays constant whatever the size of the file.
+        Each record is an object with the `messages`, `demo_output`, `tags` and
+        `checks` of a chat test case, as accepted by `ChatTestCasesResource.create`.
+        In CSV files, these columns hold JSON values.
+
+        The progress is saved to a checkpoint file next to the imported file,
+        every 100 records or every second, and when the import stops. Calling
+        `import_file` again resumes the import after the last records uploaded,
+        and retries the records that failed. If the process is killed, the
+        records uploaded since the last save are uploaded again. The checkpoint
+        is kept once the import is complete, so that importing the same file
+        again only retries the failed records: delete it to import the file anew.
+
+        Invalid records and the records rejected by the Hub do not stop the
+        import, and are reported in the errors of the result.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            Path of the file to import.
+        dataset_id : str
+            ID of the dataset to add the chat test cases to.
+        file_format : str, optional
+            Format of the file, `"jsonl"` or `"csv"`. By default, inferred from the
+            extension of the file.
+        concurrency : int, optional
+            Maximum number of uploads in flight, by default 8.
+        checkpoint : bool or PathLike, optional
+            Path of the checkpoint file, by default the path of the imported file
+            with a `.checkpoint` suffix. Pass False to disable checkpointing.
+
+        Returns
+        -------
+        DatasetImportResult
+            The number of chat test cases imported and skipped, and the errors
+            of the records that could not be imported.
+        """
+        progress, file_format = _import_progress(
+            path, dataset_id, file_format, concurrency, checkpoint
+        )
+
+        def upload(payload: Dict[str, Any]):
+            return self._client.post("/chat-test-cases", json=payload)
+
+        return run_import(progress, file_format, upload, concurrency=concurrency)
+
+
+class AsyncDatasetsResource(AsyncAPIResource):
+    _base_url = "/datasets"
+
+    async def retrieve(self, dataset_id: str, *, raw: Optional[bool] = None):
+        return await self._client.get(
+            f"{self._base_url}/{dataset_id}", cast_to=self._cast_to(Dataset, raw)
+        )
+
+    async def create(self, *, name: str, description: str, project_id: str) -> Dataset:
+        return await self._client.post(
+            self._base_url,
+            json={
+                "name": name,
+                "description": description,
+                "project_id": project_id,
+            },
+            cast_to=Dataset,
+        )
+
+    async def update(
+        self,
+        dataset_id: str,
+        *,
+        name: str = NOT_GIVEN,
+        description: str = NOT_GIVEN,
+        project_id: str = NOT_GIVEN,
+    ) -> Dataset:
+        data = filter_not_given(
+            {"name": name, "description": description, "project_id": project_id}
+        )
+        return await self._client.patch(
+            f"{self._base_url}/{dataset_id}",
+            json=data,
+            cast_to=Dataset,
+        )
+
+    async def delete(self, dataset_id: str | List[str]) -> None:
+        await self._client.delete(self._base_url, params={"datasets_ids": dataset_id})
+
+    async def list(
+        self, project_id: str, *, raw: Optional[bool] = None
+    ) -> List[Dataset]:
+        return await self._client.get(
+            self._base_url,
+            params={"project_id": project_id},
+            cast_to=self._cast_to(Dataset, raw),
+        )
+
+    async def generate_adversarial(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        model_id: str,
+        dataset_name: str = "Generated Dataset",
+        description: str = "",
+        categories: Union[List[str], Any] = NOT_GIVEN,
+        n_examples: int = 10,
+    ) -> Dataset:
+        """Async version of `DatasetsResource.generate_adversarial`."""
+        payload = filter_not_given(
+            {
+                "model_id": model_id,
+                "dataset_name": dataset_name,
+                "description": description,
+                "categories": categories,
+                "nb_examples": n_examples,
+            }
+        )
+        return await self._client.post(
+            f"{self._base_url}/generate",
+            json=payload,
+            cast_to=Dataset,
+        )
+
+    async def generate_document_based(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        model_id: str,
+        knowledge_base_id: str,
+        dataset_name: str = "Generated Dataset",
+        description: str = "",
+        n_questions: int = 10,
+        topic_ids: Optional[List[UUID]] = None,
+    ) -> Dataset:
+        """Async version of `DatasetsResource.generate_document_based`."""
+        if topic_ids is None:
+            topic_ids = []
+        payload = filter_not_given(
+            {
+                "model_id": model_id,
+                "knowledge_base_id": knowledge_base_id,
+                "dataset_name": dataset_name,
+                "description": description,
+                "nb_questions": n_questions,
+                "topic_ids": topic_ids,
+            }
+        )
+
+        return await self._client.post(
+            f"{self._base_url}/generate/knowledge",
+            json=payload,
+            cast_to=Dataset,
+        )
+
+    async def import_file(  # pylint: disable=too-many-arguments
+        self,
+        path: PathLike,
+        *,
+        dataset_id: str,
+        file_format: Optional[ImportFormat] = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        checkpoint: Union[bool, PathLike] = True,
+    ) -> DatasetImportResult:
+        """Import the chat test cases of a file, see `DatasetsResource.import_file`."""
+        progress, file_format = _import_progress(
+            path, dataset_id, file_format, concurrency, checkpoint
+        )
+
+        def upload(payload: Dict[str, Any]):
+            return self._client.post("/chat-test-cases", json=payload)
+
+        return await arun_import(progress, file_format, upload, concurrency=concurrency)
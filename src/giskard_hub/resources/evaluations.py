@@ -1,16 +1,45 @@
 from __future__ import annotations
 
-from typing import List
+from typing import AsyncIterator, Iterator, List, Optional
 
-from ..data._base import NOT_GIVEN, filter_not_given, maybe_to_dict
+from ..data._base import NOT_GIVEN, filter_not_given, maybe_to_dict, to_dict_list
 from ..data.evaluation import EvaluationEntry, EvaluationRun, EvaluatorResult
 from ..data.model import Model, ModelOutput
-from ._resource import APIResource
+from ._pagination import DEFAULT_PAGE_SIZE, aiter_pages, iter_pages
+from ._resource import APIResource, AsyncAPIResource
+
+
+def _prepare_entry_update_data(
+    *,
+    model_output: ModelOutput = NOT_GIVEN,
+    results: List[EvaluatorResult] = NOT_GIVEN,
+) -> dict:
+    if model_output and not isinstance(model_output, ModelOutput):
+        model_output = ModelOutput.from_dict(model_output)
+
+    if model_output:
+        output = {
+            "response": maybe_to_dict(model_output.message),
+            "metadata": model_output.metadata,
+        }
+        if model_output.error:
+            output["error"] = model_output.error.to_dict()
+    else:
+        output = NOT_GIVEN
+
+    return filter_not_given(
+        {
+            "output": output,
+            "results": (to_dict_list(results) if results else NOT_GIVEN),
+        }
+    )
 
 
 class EvaluationsResource(APIResource):
-    def retrieve(self, run_id: str):
-        return self._client.get(f"/evaluations/{run_id}", cast_to=EvaluationRun)
+    def retrieve(self, run_id: str, *, raw: Optional[bool] = None):
+        return self._client.get(
+            f"/evaluations/{run_id}", cast_to=self._cast_to(EvaluationRun, raw)
+        )
 
     # pylint: disable=too-many-arguments
     def create(
@@ -76,17 +105,57 @@ class EvaluationsResource(APIResource):
     def delete(self, evaluation_id: str | List[str]) -> None:
         self._client.delete("/evaluations", params={"evaluation_ids": evaluation_id})
 
-    def list(self, project_id: str):
+    def list(self, project_id: str, *, raw: Optional[bool] = None):
         return self._client.get(
-            "/evaluations", params={"project_id": project_id}, cast_to=EvaluationRun
+            "/evaluations",
+            params={"project_id": project_id},
+            cast_to=self._cast_to(EvaluationRun, raw),
         )
 
-    def list_entries(self, run_id: str):
+    def list_entries(self, run_id: str, *, raw: Optional[bool] = None):
         entries = self._client.get(f"/evaluations/{run_id}/results?limit=100_000")[
             "items"
         ]
+        if self._is_raw(raw):
+            return entries
         return [EvaluationEntry.from_dict(entry) for entry in entries]
 
+    def iter_entries(
+        self,
+        run_id: str,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[EvaluationEntry]:
+        """Iterate over the entries of an evaluation run, page by page.
+
+        Unlike `list_entries`, entries are fetched lazily with `offset`/`limit`
+        pagination, so memory usage stays bounded for very large runs.
+
+        Parameters
+        ----------
+        run_id : str
+            ID of the evaluation run.
+        page_size : int, optional
+            Number of entries requested per page.
+        prefetch : bool, optional
+            Whether to fetch the next page in the background while the current
+            one is being processed, by default True.
+
+        Yields
+        ------
+        EvaluationEntry
+            The entries of the evaluation run.
+        """
+        for page in iter_pages(
+            self._client,
+            f"/evaluations/{run_id}/results",
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            for entry in page:
+                yield EvaluationEntry.from_dict(entry)
+
     def update_entry(
         self,
         run_id: str,
@@ -95,28 +164,126 @@ class EvaluationsResource(APIResource):
         model_output: ModelOutput = NOT_GIVEN,
         results: List[EvaluatorResult] = NOT_GIVEN,
     ):
-        if model_output and not isinstance(model_output, ModelOutput):
-            model_output = ModelOutput.from_dict(model_output)
+        data = _prepare_entry_update_data(model_output=model_output, results=results)
+        return self._client.patch(
+            f"/evaluations/{run_id}/results/{entry_id}/submit-local",
+            json=data,
+            cast_to=EvaluationEntry,
+        )
+
 
-        if model_output:
-            output = {
-                "response": model_output.message.to_dict(),
-                "metadata": model_output.metadata,
+class AsyncEvaluationsResource(AsyncAPIResource):
+    async def retrieve(self, run_id: str, *, raw: Optional[bool] = None):
+        return await self._client.get(
+            f"/evaluations/{run_id}", cast_to=self._cast_to(EvaluationRun, raw)
+        )
+
+    # pylint: disable=too-many-arguments
+    async def create(
+        self,
+        *,
+        model_id: str,
+        dataset_id: str,
+        tags: List[str] = NOT_GIVEN,
+        name: str = NOT_GIVEN,
+        run_count: int = 1,
+    ):
+        data = filter_not_given(
+            {
+                "name": name,
+                "model_id": model_id,
+                "run_count": run_count,
             }
-        else:
-            output = NOT_GIVEN
+        )
+        data["criteria"] = [
+            filter_not_given(
+                {
+                    "dataset_id": dataset_id,
+                    "tags": tags,
+                }
+            )
+        ]
 
+        return await self._client.post(
+            "/evaluations",
+            json=data,
+            cast_to=EvaluationRun,
+        )
+
+    async def create_local(
+        self,
+        *,
+        model: Model,
+        dataset_id: str,
+        tags: List[str] = NOT_GIVEN,
+        name: str = NOT_GIVEN,
+    ):
         data = filter_not_given(
             {
-                "output": output,
-                "results": (
-                    [maybe_to_dict(result) for result in results]
-                    if results
-                    else NOT_GIVEN
-                ),
+                "name": name,
+                "model": model.to_dict(),
             }
         )
-        return self._client.patch(
+        data["criteria"] = [
+            filter_not_given(
+                {
+                    "dataset_id": dataset_id,
+                    "tags": tags,
+                }
+            )
+        ]
+
+        return await self._client.post(
+            "/evaluations/local",
+            json=data,
+            cast_to=EvaluationRun,
+        )
+
+    async def delete(self, evaluation_id: str | List[str]) -> None:
+        await self._client.delete(
+            "/evaluations", params={"evaluation_ids": evaluation_id}
+        )
+
+    async def list(self, project_id: str, *, raw: Optional[bool] = None):
+        return await self._client.get(
+            "/evaluations",
+            params={"project_id": project_id},
+            cast_to=self._cast_to(EvaluationRun, raw),
+        )
+
+    async def list_entries(self, run_id: str, *, raw: Optional[bool] = None):
+        data = await self._client.get(f"/evaluations/{run_id}/results?limit=100_000")
+        if self._is_raw(raw):
+            return data["items"]
+        return [EvaluationEntry.from_dict(entry) for entry in data["items"]]
+
+    async def iter_entries(
+        self,
+        run_id: str,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[EvaluationEntry]:
+        """Iterate over the entries of an evaluation run, see `EvaluationsResource.iter_entries`."""
+        async for page in aiter_pages(
+            self._client,
+            f"/evaluations/{run_id}/results",
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            for entry in page:
+                yield EvaluationEntry.from_dict(entry)
+
+    async def update_entry(
+        self,
+        run_id: str,
+        entry_id: str,
+        *,
+        model_output: ModelOutput = NOT_GIVEN,
+        results: List[EvaluatorResult] = NOT_GIVEN,
+    ):
+        data = _prepare_entry_update_data(model_output=model_output, results=results)
+        return await self._client.patch(
             f"/evaluations/{run_id}/results/{entry_id}/submit-local",
             json=data,
             cast_to=EvaluationEntry,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-from ..data._base import NOT_GIVEN, filter_not_given, maybe_to_dict
+from ..data._base import NOT_GIVEN, filter_not_given, to_dict_list
 from ..data.chat import ChatMessage
 from ..data.model import Model, ModelOutput
-from ._resource import APIResource
+from ._resource import APIResource, AsyncAPIResource
 
 
 def _maybe_headers_to_list(headers: Dict[str, str] | None):
@@ -17,8 +17,10 @@ def _maybe_headers_to_list(headers: Dict[str, str] | None):
 class ModelsResource(APIResource):
     _base_url = "/models"
 
-    def retrieve(self, model_id: str) -> Model:
-        return self._client.get(f"{self._base_url}/{model_id}", cast_to=Model)
+    def retrieve(self, model_id: str, *, raw: Optional[bool] = None) -> Model:
+        return self._client.get(
+            f"{self._base_url}/{model_id}", cast_to=self._cast_to(Model, raw)
+        )
 
     # pylint: disable=too-many-arguments
     def create(
@@ -78,14 +80,97 @@ class ModelsResource(APIResource):
     def delete(self, model_id: str | List[str]) -> None:
         self._client.delete(self._base_url, params={"model_ids": model_id})
 
-    def list(self, project_id: str) -> List[Model]:
+    def list(self, project_id: str, *, raw: Optional[bool] = None) -> List[Model]:
         return self._client.get(
-            self._base_url, params={"project_id": project_id}, cast_to=Model
+            self._base_url,
+            params={"project_id": project_id},
+            cast_to=self._cast_to(Model, raw),
         )
 
     def chat(self, model_id: str, messages: List[ChatMessage]) -> ModelOutput:
         return self._client.post(
             f"{self._base_url}/{model_id}/chat",
-            json={"messages": [maybe_to_dict(msg) for msg in messages]},
+            json={"messages": to_dict_list(messages)},
+            cast_to=ModelOutput,
+        )
+
+
+class AsyncModelsResource(AsyncAPIResource):
+    _base_url = "/models"
+
+    async def retrieve(self, model_id: str, *, raw: Optional[bool] = None) -> Model:
+        return await self._client.get(
+            f"{self._base_url}/{model_id}", cast_to=self._cast_to(Model, raw)
+        )
+
+    # pylint: disable=too-many-arguments
+    async def create(
+        self,
+        *,
+        name: str,
+        description: str,
+        url: str,
+        supported_languages: List[str],
+        headers: Dict[str, str] = None,
+        project_id: str,
+    ) -> Model:
+        data = filter_not_given(
+            {
+                "name": name,
+                "description": description,
+                "url": url,
+                "supported_languages": supported_languages,
+                "headers": _maybe_headers_to_list(headers),
+                "project_id": project_id,
+            }
+        )
+        return await self._client.post(
+            self._base_url,
+            json=data,
+            cast_to=Model,
+        )
+
+    # pylint: disable=too-many-arguments
+    async def update(
+        self,
+        model_id: str,
+        *,
+        name: str = NOT_GIVEN,
+        description: str = NOT_GIVEN,
+        url: str = NOT_GIVEN,
+        supported_languages: List[str] = NOT_GIVEN,
+        headers: Dict[str, str] = NOT_GIVEN,
+        project_id: str = NOT_GIVEN,
+    ) -> Model:
+        data = filter_not_given(
+            {
+                "name": name,
+                "description": description,
+                "url": url,
+                "supported_languages": supported_languages,
+                "headers": _maybe_headers_to_list(headers),
+                "project_id": project_id,
+            }
+        )
+        return await self._client.patch(
+            f"{self._base_url}/{model_id}",
+            json=data,
+            cast_to=Model,
+        )
+
+    async def delete(self, model_id: str | List[str]) -> None:
+        await self._client.delete(self._base_url, params={"model_ids": model_id})
+
+    async def list(self, project_id: str, *, raw: Optional[bool] = None) -> List[Model]:
+        return await self._client.get(
+            self._base_url,
+            params={"project_id": project_id},
+            cast_to=self._cast_to(Model, raw),
+        )
+
+    async def chat(self, model_id: str, messages: List[ChatMessage]) -> ModelOutput:
+        return await self._client.post(
+            f"{self._base_url}/{model_id}/chat",
+            json={"messages": to_dict_list(messages)},
             cast_to=ModelOutput,
         )
@@ -4,14 +4,16 @@ from typing import List, Optional
 
 from ..data._base import NOT_GIVEN, filter_not_given, maybe_to_dict
 from ..data.project import FailureCategory, Project
-from ._resource import APIResource
+from ._resource import APIResource, AsyncAPIResource
 
 
 class ProjectsResource(APIResource):
     _base_url = "/projects"
 
-    def retrieve(self, project_id: str):
-        return self._client.get(f"{self._base_url}/{project_id}", cast_to=Project)
+    def retrieve(self, project_id: str, *, raw: Optional[bool] = None):
+        return self._client.get(
+            f"{self._base_url}/{project_id}", cast_to=self._cast_to(Project, raw)
+        )
 
     def create(
         self,
@@ -60,6 +62,70 @@ class ProjectsResource(APIResource):
     def delete(self, project_id: str | List[str]) -> None:
         self._client.delete(self._base_url, params={"project_ids": project_id})
 
-    def list(self):
+    def list(self, *, raw: Optional[bool] = None):
         data = self._client.get(self._base_url)
+        if self._is_raw(raw):
+            return data
+        return [Project.from_dict(item, _client=self._client) for item in data]
+
+
+class AsyncProjectsResource(AsyncAPIResource):
+    _base_url = "/projects"
+
+    async def retrieve(self, project_id: str, *, raw: Optional[bool] = None):
+        return await self._client.get(
+            f"{self._base_url}/{project_id}", cast_to=self._cast_to(Project, raw)
+        )
+
+    async def create(
+        self,
+        *,
+        name: str,
+        description: str = "",
+    ):
+
+        data = filter_not_given(
+            {
+                "name": name,
+                "description": description,
+            }
+        )
+        return await self._client.post(
+            self._base_url,
+            json=data,
+            cast_to=Project,
+        )
+
+    async def update(
+        self,
+        project_id: str,
+        *,
+        name: str = NOT_GIVEN,
+        description: str = NOT_GIVEN,
+        failure_categories: Optional[List[FailureCategory]] = NOT_GIVEN,
+    ):
+        if failure_categories is not NOT_GIVEN:
+            failure_categories = maybe_to_dict(failure_categories)
+
+        data = filter_not_given(
+            {
+                "name": name,
+                "description": description,
+                "failure_categories": failure_categories,
+            }
+        )
+
+        return await self._client.patch(
+            f"{self._base_url}/{project_id}",
+            json=data,
+            cast_to=Project,
+        )
+
+    async def delete(self, project_id: str | List[str]) -> None:
+        await self._client.delete(self._base_url, params={"project_ids": project_id})
+
+    async def list(self, *, raw: Optional[bool] = None):
+        data = await self._client.get(self._base_url)
+        if self._is_raw(raw):
+            return data
         return [Project.from_dict(item, _client=self._client) for item in data]
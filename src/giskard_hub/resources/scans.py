@@ -1,18 +1,120 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import List, Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from ..data._base import NOT_GIVEN, filter_not_given
 from ..data.scan import (
+    AttemptStats,
     ProbeAttempt,
     ProbeResult,
     ScanCategory,
     ScanResult,
+    Severity,
 )
-from ._resource import APIResource
+from ._resource import APIResource, AsyncAPIResource
 
 _SCAN_BASE_URL = "/scans"
 _PROBE_BASE_URL = "/probes"
 
+DEFAULT_ATTEMPTS_PREFETCH = 2
+
+
+def _validate_prefetch(prefetch: int) -> None:
+    if prefetch < 0:
+        raise ValueError("prefetch must be at least 0.")
+
+
+def _iter_probe_attempts(
+    probes: List[Dict[str, Any]],
+    fetch: Callable[[str], List[Dict[str, Any]]],
+    prefetch: int,
+) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    if prefetch == 0:
+        for probe in probes:
+            yield probe, fetch(probe["id"])
+        return
+
+    pool = ThreadPoolExecutor(
+        max_workers=prefetch, thread_name_prefix="giskard-hub-attempts"
+    )
+    try:
+        remaining = iter(probes)
+        window = deque()
+        for probe in remaining:
+            window.append((probe, pool.submit(fetch, probe["id"])))
+            if len(window) > prefetch:
+                break
+
+        while window:
+            probe, future = window.popleft()
+            attempts = future.result()
+            next_probe = next(remaining, None)
+            if next_probe is not None:
+                window.append((next_probe, pool.submit(fetch, next_probe["id"])))
+
+            yield probe, attempts
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aiter_probe_attempts(
+    probes: List[Dict[str, Any]],
+    fetch: Callable[[str], Awaitable[List[Dict[str, Any]]]],
+    prefetch: int,
+) -> AsyncIterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+    if prefetch == 0:
+        for probe in probes:
+            yield probe, await fetch(probe["id"])
+        return
+
+    remaining = iter(probes)
+    window = deque()
+    try:
+        for probe in remaining:
+            window.append((probe, asyncio.ensure_future(fetch(probe["id"]))))
+            if len(window) > prefetch:
+                break
+
+        while window:
+            probe, task = window.popleft()
+            attempts = await task
+            next_probe = next(remaining, None)
+            if next_probe is not None:
+                task = asyncio.ensure_future(fetch(next_probe["id"]))
+                window.append((next_probe, task))
+
+            yield probe, attempts
+    finally:
+        for _, task in window:
+            task.cancel()
+
+
+def _filter_attempts(
+    attempts: List[Dict[str, Any]],
+    category: str,
+    stats: AttemptStats,
+    min_severity: Optional[Severity],
+) -> List[Dict[str, Any]]:
+    selected = []
+    for attempt in attempts:
+        severity = Severity(attempt.get("severity", Severity.SAFE.value))
+        stats.record(category, severity)
+        if min_severity is None or severity >= min_severity:
+            selected.append(attempt)
+    return selected
+
 
 class ScansResource(APIResource):
     @lru_cache(maxsize=1)
@@ -64,44 +166,54 @@ class ScansResource(APIResource):
             cast_to=ScanResult,
         )
 
-    def retrieve(self, scan_id: str) -> ScanResult:
+    def retrieve(self, scan_id: str, *, raw: Optional[bool] = None) -> ScanResult:
         """Retrieve a scan by its ID.
 
         Parameters
         ----------
         scan_id : str
             ID of the scan to retrieve.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of a `ScanResult`. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
         ScanResult
             The retrieved scan result.
         """
-        return self._client.get(f"{_SCAN_BASE_URL}/{scan_id}", cast_to=ScanResult)
+        return self._client.get(
+            f"{_SCAN_BASE_URL}/{scan_id}", cast_to=self._cast_to(ScanResult, raw)
+        )
 
-    def list(self, project_id: Optional[str] = None) -> List[ScanResult]:
+    def list(
+        self, project_id: Optional[str] = None, *, raw: Optional[bool] = None
+    ) -> List[ScanResult]:
         """List all scans or optionally for a given project.
 
         Parameters
         ----------
         project_id : str, optional
             ID of the project to list scans for. If not provided, scans for all projects will be listed.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of `ScanResult` objects. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
         List[ScanResult]
             List of scan results.
         """
-        return [
-            ScanResult.from_dict(r, _client=self._client)
-            for r in self._client.get(
-                (
-                    _SCAN_BASE_URL
-                    if project_id is None
-                    else f"{_SCAN_BASE_URL}?project_id={project_id}"
-                ),
-            )["items"]
-        ]
+        items = self._client.get(
+            (
+                _SCAN_BASE_URL
+                if project_id is None
+                else f"{_SCAN_BASE_URL}?project_id={project_id}"
+            ),
+        )["items"]
+        if self._is_raw(raw):
+            return items
+        return [ScanResult.from_dict(r, _client=self._client) for r in items]
 
     def delete(self, scan_id: str | List[str]) -> None:
         """Delete a scan by its ID.
@@ -118,13 +230,18 @@ class ScansResource(APIResource):
         """
         self._client.delete(_SCAN_BASE_URL, params={"scan_result_ids": scan_id})
 
-    def retrieve_probe(self, probe_result_id: str) -> ProbeResult:
+    def retrieve_probe(
+        self, probe_result_id: str, *, raw: Optional[bool] = None
+    ) -> ProbeResult:
         """Retrieve a probe result by its ID.
 
         Parameters
         ----------
         probe_result_id : str
             The ID of the probe result to retrieve.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of a `ProbeResult`. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
@@ -132,45 +249,230 @@ class ScansResource(APIResource):
             The retrieved probe result.
         """
         return self._client.get(
-            f"{_PROBE_BASE_URL}/{probe_result_id}", cast_to=ProbeResult
+            f"{_PROBE_BASE_URL}/{probe_result_id}",
+            cast_to=self._cast_to(ProbeResult, raw),
         )
 
-    def list_probes(self, scan_id: str) -> List[ProbeResult]:
+    def list_probes(
+        self, scan_id: str, *, raw: Optional[bool] = None
+    ) -> List[ProbeResult]:
         """List all probe results for a given scan.
 
         Parameters
         ----------
         scan_id : str
             ID of the scan to list probes for.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of `ProbeResult` objects. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
         List[ProbeResult]
             List of probe results for the given scan.
         """
-        return [
-            ProbeResult.from_dict(r, _client=self._client)
-            for r in self._client.get(
-                f"{_SCAN_BASE_URL}/{scan_id}/probes",
-            )["items"]
-        ]
+        items = self._client.get(f"{_SCAN_BASE_URL}/{scan_id}/probes")["items"]
+        if self._is_raw(raw):
+            return items
+        return [ProbeResult.from_dict(r, _client=self._client) for r in items]
 
-    def list_attempts(self, probe_result_id: str) -> List[ProbeAttempt]:
+    def list_attempts(
+        self, probe_result_id: str, *, raw: Optional[bool] = None
+    ) -> List[ProbeAttempt]:
         """List all attempts (attacks) for a given probe result.
 
         Parameters
         ----------
         probe_result_id : str
             The ID of the probe result to list attempts for.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of `ProbeAttempt` objects. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
         List[ProbeAttempt]
             List of attempts for the given probe result.
         """
-        return [
-            ProbeAttempt.from_dict(r, _client=self._client)
-            for r in self._client.get(f"{_PROBE_BASE_URL}/{probe_result_id}/attempts")[
-                "items"
-            ]
+        items = self._client.get(f"{_PROBE_BASE_URL}/{probe_result_id}/attempts")[
+            "items"
         ]
+        if self._is_raw(raw):
+            return items
+        return [ProbeAttempt.from_dict(r, _client=self._client) for r in items]
+
+    def iter_attempts(  # pylint: disable=too-many-arguments
+        self,
+        scan_id: str,
+        *,
+        min_severity: Optional[Severity] = None,
+        stats: Optional[AttemptStats] = None,
+        prefetch: int = DEFAULT_ATTEMPTS_PREFETCH,
+        raw: Optional[bool] = None,
+    ) -> Iterator[ProbeAttempt]:
+        """Iterate over the attempts of all the probes of a scan, probe by probe.
+
+        While the attempts of a probe are processed, those of the next `prefetch`
+        probes are requested concurrently in background threads. Only the attempts
+        of these probes are held in memory, whatever the size of the scan.
+
+        Parameters
+        ----------
+        scan_id : str
+            The ID of the scan to iterate the attempts of.
+        min_severity : Severity, optional
+            If given, only the attempts of at least this severity are yielded.
+        stats : AttemptStats, optional
+            If given, updated with the counts, by category and severity, of the
+            attempts of each probe as it is reached, including the attempts
+            filtered out by `min_severity`.
+        prefetch : int, optional
+            Number of probes whose attempts are requested ahead, by default 2.
+            With 0, the attempts are requested only when needed.
+        raw : bool, optional
+            Whether to yield the decoded JSON instead of `ProbeAttempt` objects. By
+            default, the `raw_responses` option of the client applies.
+
+        Yields
+        ------
+        ProbeAttempt
+            The attempts of the scan.
+        """
+        _validate_prefetch(prefetch)
+        raw = self._is_raw(raw)
+        stats = AttemptStats() if stats is None else stats
+
+        def fetch(probe_result_id: str) -> List[Dict[str, Any]]:
+            return self.list_attempts(probe_result_id, raw=True)
+
+        probes = self.list_probes(scan_id, raw=True)
+        pages = _iter_probe_attempts(probes, fetch, prefetch)
+        try:
+            for probe, items in pages:
+                category = probe.get("probe_category")
+                for item in _filter_attempts(items, category, stats, min_severity):
+                    if raw:
+                        yield item
+                    else:
+                        yield ProbeAttempt.from_dict(item, _client=self._client)
+        finally:
+            pages.close()
+
+
+class AsyncScansResource(AsyncAPIResource):
+    _categories: Optional[List[ScanCategory]] = None
+
+    async def list_categories(self) -> List[ScanCategory]:
+        """List scan categories that can be use as tags to create/launch a scan.
+
+        The result is cached on the resource after the first call.
+        """
+        if self._categories is None:
+            data = await self._client.get(f"{_SCAN_BASE_URL}/categories")
+            self._categories = [ScanCategory.from_dict(item) for item in data["items"]]
+        return self._categories
+
+    async def create(
+        self,
+        *,
+        model_id: str,
+        knowledge_base_id: str = NOT_GIVEN,
+        tags: List[str] = NOT_GIVEN,
+    ) -> ScanResult:
+        """Create and run a new scan, see `ScansResource.create`."""
+
+        data = filter_not_given(
+            {
+                "model_id": model_id,
+                "knowledge_base_id": knowledge_base_id,
+                "tags": tags,
+            }
+        )
+
+        return await self._client.post(
+            _SCAN_BASE_URL,
+            json=data,
+            cast_to=ScanResult,
+        )
+
+    async def retrieve(self, scan_id: str, *, raw: Optional[bool] = None) -> ScanResult:
+        """Retrieve a scan by its ID."""
+        return await self._client.get(
+            f"{_SCAN_BASE_URL}/{scan_id}", cast_to=self._cast_to(ScanResult, raw)
+        )
+
+    async def list(
+        self, project_id: Optional[str] = None, *, raw: Optional[bool] = None
+    ) -> List[ScanResult]:
+        """List all scans or optionally for a given project."""
+        data = await self._client.get(
+            (
+                _SCAN_BASE_URL
+                if project_id is None
+                else f"{_SCAN_BASE_URL}?project_id={project_id}"
+            ),
+        )
+        if self._is_raw(raw):
+            return data["items"]
+        return [ScanResult.from_dict(r, _client=self._client) for r in data["items"]]
+
+    async def delete(self, scan_id: str | List[str]) -> None:
+        """Delete a scan by its ID."""
+        await self._client.delete(_SCAN_BASE_URL, params={"scan_result_ids": scan_id})
+
+    async def retrieve_probe(
+        self, probe_result_id: str, *, raw: Optional[bool] = None
+    ) -> ProbeResult:
+        """Retrieve a probe result by its ID."""
+        return await self._client.get(
+            f"{_PROBE_BASE_URL}/{probe_result_id}",
+            cast_to=self._cast_to(ProbeResult, raw),
+        )
+
+    async def list_probes(
+        self, scan_id: str, *, raw: Optional[bool] = None
+    ) -> List[ProbeResult]:
+        """List all probe results for a given scan."""
+        data = await self._client.get(f"{_SCAN_BASE_URL}/{scan_id}/probes")
+        if self._is_raw(raw):
+            return data["items"]
+        return [ProbeResult.from_dict(r, _client=self._client) for r in data["items"]]
+
+    async def list_attempts(
+        self, probe_result_id: str, *, raw: Optional[bool] = None
+    ) -> List[ProbeAttempt]:
+        """List all attempts (attacks) for a given probe result."""
+        data = await self._client.get(f"{_PROBE_BASE_URL}/{probe_result_id}/attempts")
+        if self._is_raw(raw):
+            return data["items"]
+        return [ProbeAttempt.from_dict(r, _client=self._client) for r in data["items"]]
+
+    async def iter_attempts(  # pylint: disable=too-many-arguments
+        self,
+        scan_id: str,
+        *,
+        min_severity: Optional[Severity] = None,
+        stats: Optional[AttemptStats] = None,
+        prefetch: int = DEFAULT_ATTEMPTS_PREFETCH,
+        raw: Optional[bool] = None,
+    ) -> AsyncIterator[ProbeAttempt]:
+        """Iterate over the attempts of a scan, see `ScansResource.iter_attempts`."""
+        _validate_prefetch(prefetch)
+        raw = self._is_raw(raw)
+        stats = AttemptStats() if stats is None else stats
+
+        def fetch(probe_result_id: str) -> Awaitable[List[Dict[str, Any]]]:
+            return self.list_attempts(probe_result_id, raw=True)
+
+        probes = await self.list_probes(scan_id, raw=True)
+        pages = _aiter_probe_attempts(probes, fetch, prefetch)
+        try:
+            async for probe, items in pages:
+                category = probe.get("probe_category")
+                for item in _filter_attempts(items, category, stats, min_severity):
+                    if raw:
+                        yield item
+                    else:
+                        yield ProbeAttempt.from_dict(item, _client=self._client)
+        finally:
+            await pages.aclose()
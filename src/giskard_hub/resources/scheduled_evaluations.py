@@ -7,11 +7,11 @@ from ..data._base import NOT_GIVEN, NotGiven, filter_not_given
 from ..data.evaluation import EvaluationRun
 from ..data.scheduled_evaluation import FrequencyOption, ScheduledEvaluation
 from ..errors import HubValidationError
-from ._resource import APIResource
+from ._resource import APIResource, AsyncAPIResource
 
 
-class ScheduledEvaluationsResource(APIResource):
-    """Resource for managing scheduled evaluations."""
+class _ScheduleValidationMixin:
+    """Schedule validation shared by the sync and async resources."""
 
     def _validate_schedule(
         self,
@@ -91,10 +91,15 @@ class ScheduledEvaluationsResource(APIResource):
                 day_of_month=dom_val,
             )
 
+
+class ScheduledEvaluationsResource(_ScheduleValidationMixin, APIResource):
+    """Resource for managing scheduled evaluations."""
+
     def list(
         self,
         *,
         project_id: str,
+        raw: Optional[bool] = None,
     ) -> List[ScheduledEvaluation]:
         """List scheduled evaluations for a project.
 
@@ -102,6 +107,9 @@ class ScheduledEvaluationsResource(APIResource):
         ----------
         project_id : str
             The ID of the project to list scheduled evaluations for.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of `ScheduledEvaluation` objects. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
@@ -112,16 +120,23 @@ class ScheduledEvaluationsResource(APIResource):
             "/scheduled-evaluations",
             params={"project_id": project_id},
         )
+        if self._is_raw(raw):
+            return data
 
         return [ScheduledEvaluation.from_dict(d, _client=self._client) for d in data]
 
-    def retrieve(self, scheduled_evaluation_id: str) -> ScheduledEvaluation:
+    def retrieve(
+        self, scheduled_evaluation_id: str, *, raw: Optional[bool] = None
+    ) -> ScheduledEvaluation:
         """Retrieve a scheduled evaluation by ID.
 
         Parameters
         ----------
         scheduled_evaluation_id : str
             The ID of the scheduled evaluation to retrieve.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of a `ScheduledEvaluation`. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
@@ -130,7 +145,7 @@ class ScheduledEvaluationsResource(APIResource):
         """
         return self._client.get(
             f"/scheduled-evaluations/{scheduled_evaluation_id}",
-            cast_to=ScheduledEvaluation,
+            cast_to=self._cast_to(ScheduledEvaluation, raw),
         )
 
     def create(  # pylint: disable=too-many-arguments
@@ -279,13 +294,18 @@ class ScheduledEvaluationsResource(APIResource):
             params={"scheduled_evaluation_ids": scheduled_evaluation_ids},
         )
 
-    def list_evaluations(self, scheduled_evaluation_id: str) -> List[EvaluationRun]:
+    def list_evaluations(
+        self, scheduled_evaluation_id: str, *, raw: Optional[bool] = None
+    ) -> List[EvaluationRun]:
         """List evaluations linked to a scheduled evaluation.
 
         Parameters
         ----------
         scheduled_evaluation_id : str
             The ID of the scheduled evaluation to get evaluations for.
+        raw : bool, optional
+            Whether to return the decoded JSON instead of `EvaluationRun` objects. By default,
+            the `raw_responses` option of the client applies.
 
         Returns
         -------
@@ -295,5 +315,133 @@ class ScheduledEvaluationsResource(APIResource):
         data = self._client.get(
             f"/scheduled-evaluations/{scheduled_evaluation_id}/evaluations",
         )
+        if self._is_raw(raw):
+            return data
+
+        return [EvaluationRun.from_dict(evaluation) for evaluation in data]
+
+
+class AsyncScheduledEvaluationsResource(_ScheduleValidationMixin, AsyncAPIResource):
+    """Async resource for managing scheduled evaluations."""
+
+    async def list(
+        self,
+        *,
+        project_id: str,
+        raw: Optional[bool] = None,
+    ) -> List[ScheduledEvaluation]:
+        """List scheduled evaluations for a project."""
+        data = await self._client.get(
+            "/scheduled-evaluations",
+            params={"project_id": project_id},
+        )
+        if self._is_raw(raw):
+            return data
+
+        return [ScheduledEvaluation.from_dict(d, _client=self._client) for d in data]
+
+    async def retrieve(
+        self, scheduled_evaluation_id: str, *, raw: Optional[bool] = None
+    ) -> ScheduledEvaluation:
+        """Retrieve a scheduled evaluation by ID."""
+        return await self._client.get(
+            f"/scheduled-evaluations/{scheduled_evaluation_id}",
+            cast_to=self._cast_to(ScheduledEvaluation, raw),
+        )
+
+    async def create(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        project_id: str,
+        name: str,
+        model_id: str,
+        dataset_id: str,
+        frequency: Union[Literal["daily", "weekly", "monthly"], FrequencyOption],
+        time: str,
+        tags: Optional[List[str]] = None,
+        run_count: int = 1,
+        day_of_week: Optional[int] = None,
+        day_of_month: Optional[int] = None,
+    ) -> ScheduledEvaluation:
+        """Create a new scheduled evaluation, see `ScheduledEvaluationsResource.create`."""
+        self._validate_schedule(
+            frequency=frequency,
+            day_of_week=day_of_week,
+            day_of_month=day_of_month,
+        )
+
+        payload = {
+            "project_id": project_id,
+            "name": name,
+            "model_id": model_id,
+            "dataset_id": dataset_id,
+            "frequency": frequency,
+            "time": time,
+            "run_count": run_count,
+        }
+        if tags is not None:
+            payload["tags"] = tags
+        if day_of_week is not None:
+            payload["day_of_week"] = day_of_week
+        if day_of_month is not None:
+            payload["day_of_month"] = day_of_month
+
+        return await self._client.post(
+            "/scheduled-evaluations",
+            json=payload,
+            cast_to=ScheduledEvaluation,
+        )
+
+    async def update(  # pylint: disable=too-many-arguments
+        self,
+        scheduled_evaluation_id: str,
+        *,
+        name: Union[str, NotGiven] = NOT_GIVEN,
+        run_count: Union[int, NotGiven] = NOT_GIVEN,
+        frequency: Union[
+            Literal["daily", "weekly", "monthly"], FrequencyOption, NotGiven
+        ] = NOT_GIVEN,
+        time: Union[str, NotGiven] = NOT_GIVEN,
+        day_of_week: Union[int, NotGiven] = NOT_GIVEN,
+        day_of_month: Union[int, NotGiven] = NOT_GIVEN,
+        paused: Union[bool, NotGiven] = NOT_GIVEN,
+    ) -> ScheduledEvaluation:
+        """Update a scheduled evaluation, see `ScheduledEvaluationsResource.update`."""
+        self._validate_schedule_update(frequency, day_of_week, day_of_month)
+
+        payload = filter_not_given(
+            {
+                "name": name,
+                "frequency": frequency,
+                "time": time,
+                "run_count": run_count,
+                "day_of_week": day_of_week,
+                "day_of_month": day_of_month,
+                "paused": paused,
+            }
+        )
+
+        return await self._client.patch(
+            f"/scheduled-evaluations/{scheduled_evaluation_id}",
+            json=payload,
+            cast_to=ScheduledEvaluation,
+        )
+
+    async def delete(self, scheduled_evaluation_ids: Union[str, List[str]]) -> None:
+        """Delete scheduled evaluations."""
+        await self._client.delete(
+            "/scheduled-evaluations",
+            params={"scheduled_evaluation_ids": scheduled_evaluation_ids},
+        )
+
+    async def list_evaluations(
+        self, scheduled_evaluation_id: str, *, raw: Optional[bool] = None
+    ) -> List[EvaluationRun]:
+        """List evaluations linked to a scheduled evaluation."""
+        data = await self._client.get(
+            f"/scheduled-evaluations/{scheduled_evaluation_id}/evaluations",
+        )
+        if self._is_raw(raw):
+            return data
 
         return [EvaluationRun.from_dict(evaluation) for evaluation in data]
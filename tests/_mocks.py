@@ -0,0 +1,9 @@
+from unittest.mock import MagicMock
+
+
+def mock_hub_client(mock_class=MagicMock, **kwargs):
+    """Return a mock client, with the client options set to their defaults."""
+    client = mock_class(**kwargs)
+    client.raw_responses = False
+    client.identity_map = None
+    return client
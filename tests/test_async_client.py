@@ -0,0 +1,249 @@
+import asyncio
+import inspect
+
+import httpx
+import pytest
+
+from giskard_hub import resources
+from giskard_hub.client import AsyncHubClient, HubClient
+from giskard_hub.data.dataset import Dataset
+from giskard_hub.data.evaluation import EvaluationRun
+from giskard_hub.errors import HubAuthenticationError, HubConnectionError
+
+_HEALTH = {"status": "ok", "services": {"backend": "ok"}}
+
+_TEST_DATASET = {
+    "id": "ds_123",
+    "name": "Test Dataset",
+    "description": "A dataset",
+    "project_id": "proj_123",
+    "tags": [],
+}
+
+
+def _make_client(handler, **kwargs):
+    calls = []
+
+    def _handler(request: httpx.Request):
+        calls.append((request.method, request.url.path))
+        if request.url.path.endswith("/_health"):
+            return httpx.Response(200, json=_HEALTH)
+        return handler(request)
+
+    client = AsyncHubClient(
+        hub_url="https://hub.example.com",
+        api_key="test-key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        **kwargs,
+    )
+    return client, calls
+
+
+def test_async_client_checks_connection_on_first_request():
+    client, calls = _make_client(lambda r: httpx.Response(200, json=_TEST_DATASET))
+
+    async def _run():
+        assert calls == []
+        first = await client.datasets.retrieve("ds_123")
+        second = await client.datasets.retrieve("ds_123")
+        return first, second
+
+    first, second = asyncio.run(_run())
+
+    assert isinstance(first, Dataset)
+    assert first.id == "ds_123"
+    assert first._client is client
+    assert second.name == "Test Dataset"
+    assert calls == [
+        ("GET", "/_api/_health"),
+        ("GET", "/_api/datasets/ds_123"),
+        ("GET", "/_api/datasets/ds_123"),
+    ]
+
+
+def test_async_client_sends_api_key():
+    seen_headers = {}
+
+    def handler(request):
+        seen_headers.update(request.headers)
+        return httpx.Response(200, json=[_TEST_DATASET])
+
+    client, _ = _make_client(handler)
+    datasets = asyncio.run(client.datasets.list(project_id="proj_123"))
+
+    assert len(datasets) == 1
+    assert seen_headers["x-api-key"] == "test-key"
+
+
+def test_async_client_health_check_failure():
+    def handler(request):
+        return httpx.Response(200, json={"status": "error"})
+
+    client = AsyncHubClient(
+        hub_url="https://hub.example.com",
+        api_key="test-key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(HubConnectionError):
+        asyncio.run(client.projects.list())
+
+
+def test_async_client_error_handling():
+    client, _ = _make_client(lambda r: httpx.Response(401, text="Unauthorized"))
+
+    with pytest.raises(HubAuthenticationError) as exc_info:
+        asyncio.run(client.projects.retrieve("proj_123"))
+
+    assert exc_info.value.status_code == 401
+
+
+def test_async_entity_refresh_is_awaitable():
+    client, _ = _make_client(
+        lambda r: httpx.Response(200, json={**_TEST_DATASET, "name": "Renamed"})
+    )
+    dataset = Dataset.from_dict(_TEST_DATASET, _client=client)
+
+    result = dataset.refresh()
+    assert inspect.isawaitable(result)
+    assert asyncio.run(result) is dataset
+    assert dataset.name == "Renamed"
+
+
+def test_async_client_local_evaluation():
+    run_data = {
+        "id": "run_123",
+        "name": "local",
+        "project_id": "proj_123",
+        "model": {"id": "model_123", "name": "my_model"},
+        "status": {"state": "finished", "current": 1, "total": 1},
+    }
+    submitted = []
+
+    def handler(request):
+        if request.url.path.endswith("/evaluations/local"):
+            return httpx.Response(200, json=run_data)
+        if request.url.path.endswith("/results"):
+            entry = {
+                "id": "entry_1",
+                "evaluation_id": "run_123",
+                "chat_test_case": {"messages": [{"role": "user", "content": "Hi"}]},
+            }
+            return httpx.Response(200, json={"items": [entry]})
+        if request.url.path.endswith("/submit-local"):
+            submitted.append(request.url.path)
+            return httpx.Response(
+                200,
+                json={"id": "entry_1", "chat_test_case": {"messages": []}},
+            )
+        return httpx.Response(200, json=run_data)
+
+    client, _ = _make_client(handler)
+
+    def my_model(messages):
+        return f"Echo: {messages[-1].content}"
+
+    run = asyncio.run(client.evaluate(dataset="ds_123", model=my_model))
+
+    assert isinstance(run, EvaluationRun)
+    assert run.is_finished()
+    assert submitted == ["/_api/evaluations/run_123/results/entry_1/submit-local"]
+
+
+def _resource_class(client_cls, resource_name):
+    # Resources are created lazily, the descriptor knows the resource class name
+    class_name = vars(client_cls)[resource_name]._class_name
+    return getattr(resources, class_name)
+
+
+@pytest.mark.parametrize(
+    "resource_name",
+    [
+        "chat_test_cases",
+        "checks",
+        "datasets",
+        "evaluations",
+        "knowledge_bases",
+        "models",
+        "projects",
+        "scheduled_evaluations",
+        "scans",
+    ],
+)
+def test_async_resources_have_parity_with_sync(resource_name):
+    sync_cls = _resource_class(HubClient, resource_name)
+    async_cls = _resource_class(AsyncHubClient, resource_name)
+
+    sync_methods = {
+        name
+        for name, _ in inspect.getmembers(sync_cls, callable)
+        if not name.startswith("_")
+    }
+    for name in sync_methods:
+        method = getattr(async_cls, name, None)
+        assert method is not None, f"{async_cls.__name__} is missing `{name}`"
+        assert inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(
+            method
+        ), f"`{name}` should be async"
+
+
+def test_async_iter_entries_walks_all_pages():
+    entries = [
+        {
+            "id": f"entry_{i}",
+            "evaluation_id": "run_123",
+            "chat_test_case": {"messages": [{"role": "user", "content": "Hi"}]},
+        }
+        for i in range(5)
+    ]
+
+    def handler(request):
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        return httpx.Response(200, json={"items": entries[offset : offset + limit]})
+
+    client, calls = _make_client(handler)
+
+    async def _collect():
+        return [
+            e.id async for e in client.evaluations.iter_entries("run_123", page_size=2)
+        ]
+
+    assert asyncio.run(_collect()) == [f"entry_{i}" for i in range(5)]
+    assert len(calls) == 4  # health check + 3 pages
+
+
+def test_async_wait_for_completion_awaits_refreshes():
+    states = iter(["running", "running", "finished"])
+
+    def handler(request):
+        status = {"state": next(states), "current": 1, "total": 2}
+        return httpx.Response(200, json={**_TEST_DATASET, "status": status})
+
+    client, calls = _make_client(handler)
+
+    async def _run():
+        dataset = await client.datasets.retrieve("ds_123")
+        assert dataset.is_running()
+        return dataset, await dataset.wait_for_completion(poll_interval=0)
+
+    dataset, result = asyncio.run(_run())
+
+    assert result is dataset
+    assert dataset.is_finished()
+    assert calls.count(("GET", "/_api/datasets/ds_123")) == 3
+
+
+def test_async_wait_for_completion_times_out():
+    def handler(request):
+        status = {"state": "running", "current": 1, "total": 2}
+        return httpx.Response(200, json={**_TEST_DATASET, "status": status})
+
+    client, _ = _make_client(handler)
+
+    async def _run():
+        dataset = await client.datasets.retrieve("ds_123")
+        await dataset.wait_for_completion(timeout=0.05, poll_interval=0.01)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(_run())
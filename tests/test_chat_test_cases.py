@@ -1,7 +1,10 @@
-from unittest.mock import MagicMock
+import asyncio
+import threading
+import time
 
 import pytest
 
+from giskard_hub._bulk import arun_bulk, run_bulk
 from giskard_hub.data.chat import ChatMessage, ChatMessageWithMetadata
 from giskard_hub.data.chat_test_case import ChatTestCase
 from giskard_hub.data.check import CheckConfig
@@ -9,12 +12,16 @@ from giskard_hub.errors import (
     HubAPIError,
     HubValidationError,
 )
-from giskard_hub.resources.chat_test_cases import ChatTestCasesResource
+from giskard_hub.resources.chat_test_cases import (
+    AsyncChatTestCasesResource,
+    ChatTestCasesResource,
+)
+from tests._mocks import mock_hub_client
 
 
 @pytest.fixture
 def mock_client():
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     def mock_get(path, cast_to=None, **kwargs):
         data = mock_client.get.return_value
@@ -47,7 +54,7 @@ def mock_client():
 
 @pytest.fixture
 def mock_client_with_errors():
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
     return mock_client
 
 
@@ -463,6 +470,43 @@ def test_chat_test_cases_list_empty_dataset(mock_client):
     assert len(result) == 0
 
 
+def test_chat_test_cases_iter_walks_pages(
+    mock_client_with_errors, sample_chat_test_case_data
+):
+    items = [{**sample_chat_test_case_data, "id": f"test_case_{i}"} for i in range(5)]
+
+    def paginated_get(path, params=None, **kwargs):
+        offset, limit = params["offset"], params["limit"]
+        return {"items": items[offset : offset + limit]}
+
+    mock_client_with_errors.get.side_effect = paginated_get
+
+    resource = ChatTestCasesResource(mock_client_with_errors)
+    test_cases = resource.iter(dataset_id="ds_456", page_size=2)
+
+    # Nothing is fetched until the iteration starts
+    mock_client_with_errors.get.assert_not_called()
+
+    result = list(test_cases)
+
+    assert [tc.id for tc in result] == [f"test_case_{i}" for i in range(5)]
+    assert all(isinstance(tc, ChatTestCase) for tc in result)
+    assert result[0].messages[0] == ChatMessage(
+        role="user", content="Hello, how are you?"
+    )
+    assert mock_client_with_errors.get.call_count == 3
+    mock_client_with_errors.get.assert_called_with(
+        "/datasets/ds_456/chat-test-cases", params={"offset": 4, "limit": 2}
+    )
+
+
+def test_chat_test_cases_iter_rejects_invalid_page_size(mock_client_with_errors):
+    resource = ChatTestCasesResource(mock_client_with_errors)
+
+    with pytest.raises(ValueError):
+        list(resource.iter(dataset_id="ds_456", page_size=0))
+
+
 def test_chat_test_cases_retrieve_not_found_error(mock_client_with_errors):
     mock_client_with_errors.get.side_effect = HubAPIError(
         "Chat test case not found",
@@ -517,3 +561,164 @@ def test_chat_test_cases_update_not_found_error(mock_client_with_errors):
 
     assert exc_info.value.status_code == 404
     assert "Chat test case not found" in exc_info.value.message
+
+
+def _bulk_client(sample_chat_test_case_data, failing_ids=()):
+    mock_client = mock_hub_client()
+    lock = threading.Lock()
+    in_flight = {"current": 0, "max": 0}
+
+    def request(path, json=None, cast_to=None, **kwargs):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        try:
+            time.sleep(0.01)
+            content = json["messages"][0]["content"]
+            if content in failing_ids:
+                raise HubValidationError(f"Invalid {content}", status_code=422)
+            return cast_to.from_dict(
+                {
+                    **sample_chat_test_case_data,
+                    "id": content,
+                    "messages": json["messages"],
+                }
+            )
+        finally:
+            with lock:
+                in_flight["current"] -= 1
+
+    mock_client.post.side_effect = request
+    mock_client.patch.side_effect = request
+    return mock_client, in_flight
+
+
+def _test_cases(n):
+    return (
+        ChatTestCase(messages=[ChatMessage(role="user", content=f"case_{i}")])
+        for i in range(n)
+    )
+
+
+def test_chat_test_cases_create_many(sample_chat_test_case_data):
+    mock_client, in_flight = _bulk_client(
+        sample_chat_test_case_data, failing_ids={"case_3"}
+    )
+
+    resource = ChatTestCasesResource(mock_client)
+    results = resource.create_many("dataset_123", _test_cases(20), concurrency=4)
+
+    assert [r.item.messages[0].content for r in results] == [
+        f"case_{i}" for i in range(20)
+    ]
+    assert [r.ok for r in results] == [i != 3 for i in range(20)]
+    assert results[0].result.id == "case_0"
+    assert results[3].result is None
+    assert isinstance(results[3].error, HubValidationError)
+    assert 1 < in_flight["max"] <= 4
+    assert mock_client.post.call_args.kwargs["json"]["dataset_id"] == "dataset_123"
+
+    with pytest.raises(ValueError):
+        resource.create_many("dataset_123", _test_cases(1), concurrency=0)
+
+
+def test_chat_test_cases_update_many(sample_chat_test_case_data):
+    mock_client, _ = _bulk_client(sample_chat_test_case_data)
+    test_cases = list(_test_cases(3))
+    for i, test_case in enumerate(test_cases):
+        test_case.id = f"test_case_{i}"
+
+    # A test case without ID fails without stopping the others
+    test_cases[1].id = None
+
+    resource = ChatTestCasesResource(mock_client)
+    results = resource.update_many(test_cases, concurrency=1)
+
+    assert [r.ok for r in results] == [True, False, True]
+    assert isinstance(results[1].error, ValueError)
+    assert [call.args[0] for call in mock_client.patch.call_args_list] == [
+        "/chat-test-cases/test_case_0",
+        "/chat-test-cases/test_case_2",
+    ]
+
+
+def test_chat_test_cases_delete_many_chunks_ids(mock_client):
+    ids = [f"test_case_{i}" for i in range(250)]
+
+    def delete(path, params=None, **kwargs):
+        if "test_case_120" in params["chat_test_case_ids"]:
+            raise HubAPIError("Deletion failed", status_code=500)
+
+    mock_client.delete.side_effect = delete
+
+    resource = ChatTestCasesResource(mock_client)
+    results = resource.delete_many(iter(ids), chunk_size=100, concurrency=2)
+
+    chunks = [
+        call.kwargs["params"]["chat_test_case_ids"]
+        for call in mock_client.delete.call_args_list
+    ]
+    assert sorted(len(chunk) for chunk in chunks) == [50, 100, 100]
+    assert [r.item for r in results] == ids
+    assert [r.ok for r in results] == [not 100 <= i < 200 for i in range(250)]
+
+
+def test_async_chat_test_cases_create_many(sample_chat_test_case_data):
+    mock_client, _ = _bulk_client(sample_chat_test_case_data, failing_ids={"case_1"})
+    post = mock_client.post.side_effect
+
+    async def async_post(path, **kwargs):
+        return post(path, **kwargs)
+
+    mock_client.post = async_post
+
+    resource = AsyncChatTestCasesResource(mock_client)
+    results = asyncio.run(
+        resource.create_many("dataset_123", _test_cases(5), concurrency=2)
+    )
+
+    assert [r.ok for r in results] == [True, False, True, True, True]
+    assert results[4].result.id == "case_4"
+
+
+def test_run_bulk_does_not_wait_for_the_oldest_call():
+    completed = []
+    others_done = threading.Event()
+
+    def call(i):
+        # The first call only completes once all the others did
+        if i == 0:
+            assert others_done.wait(5)
+        else:
+            completed.append(i)
+            if len(completed) == 7:
+                others_done.set()
+        return i
+
+    results = run_bulk(call, range(8), concurrency=2)
+
+    assert [r.result for r in results] == list(range(8))
+    assert all(r.ok for r in results)
+
+
+def test_arun_bulk_does_not_wait_for_the_oldest_call():
+    completed = []
+
+    async def _run():
+        others_done = asyncio.Event()
+
+        async def call(i):
+            if i == 0:
+                await asyncio.wait_for(others_done.wait(), 5)
+            else:
+                completed.append(i)
+                if len(completed) == 7:
+                    others_done.set()
+            return i
+
+        return await arun_bulk(call, range(8), concurrency=2)
+
+    results = asyncio.run(_run())
+
+    assert [r.result for r in results] == list(range(8))
+    assert all(r.ok for r in results)
@@ -1,5 +1,3 @@
-from unittest.mock import MagicMock
-
 import pytest
 
 from giskard_hub.data.check import Check
@@ -8,11 +6,12 @@ from giskard_hub.errors import (
     HubValidationError,
 )
 from giskard_hub.resources.checks import ChecksResource
+from tests._mocks import mock_hub_client
 
 
 @pytest.fixture
 def mock_client():
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     # GET
     mock_client.get.side_effect = lambda path, **kwargs: mock_client.get.return_value
@@ -35,7 +34,7 @@ def mock_client():
 
 @pytest.fixture
 def mock_client_with_errors():
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
     return mock_client
 
 
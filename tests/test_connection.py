@@ -0,0 +1,67 @@
+import httpx
+import pytest
+
+from giskard_hub import ConnectionOptions
+from giskard_hub._base_client import AsyncClient, SyncClient
+
+
+def _pool(client):
+    return client._http._transport._pool
+
+
+def test_default_connection_options():
+    client = SyncClient()
+
+    pool = _pool(client)
+    assert pool._max_connections == 100
+    assert pool._max_keepalive_connections == 20
+    assert pool._keepalive_expiry == 30.0
+    assert pool._http2 is False
+    assert client._http.timeout == httpx.Timeout(30.0)
+    assert client._http.follow_redirects is True
+
+
+def test_custom_connection_options():
+    options = ConnectionOptions(
+        max_connections=250,
+        max_keepalive_connections=50,
+        keepalive_expiry=120,
+        connect_timeout=5,
+        read_timeout=300,
+        write_timeout=60,
+        pool_timeout=10,
+    )
+    client = SyncClient(connection_options=options)
+
+    pool = _pool(client)
+    assert pool._max_connections == 250
+    assert pool._max_keepalive_connections == 50
+    assert pool._keepalive_expiry == 120
+    assert client._http.timeout == httpx.Timeout(connect=5, read=300, write=60, pool=10)
+
+
+def test_async_client_connection_options():
+    client = AsyncClient(connection_options=ConnectionOptions(max_connections=42))
+
+    assert _pool(client)._max_connections == 42
+
+
+def test_connection_options_cannot_be_combined_with_http_client():
+    with pytest.raises(ValueError, match="connection_options"):
+        SyncClient(http_client=httpx.Client(), connection_options=ConnectionOptions())
+
+
+def test_http2_requires_h2(monkeypatch):
+    monkeypatch.setattr(
+        "giskard_hub._connection.importlib.util.find_spec", lambda name: None
+    )
+
+    with pytest.raises(ImportError, match="giskard-hub\\[http2\\]"):
+        SyncClient(connection_options=ConnectionOptions(http2=True))
+
+
+def test_invalid_connection_options():
+    with pytest.raises(ValueError):
+        ConnectionOptions(max_connections=0)
+    with pytest.raises(ValueError):
+        ConnectionOptions(max_keepalive_connections=-1)
@@ -1,3 +1,7 @@
+import asyncio
+import csv
+import json
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -5,13 +9,16 @@ import pytest
 from giskard_hub.data.chat import ChatMessage
 from giskard_hub.data.chat_test_case import ChatTestCase
 from giskard_hub.data.dataset import Dataset
-from giskard_hub.resources.datasets import DatasetsResource
+from giskard_hub.errors import HubValidationError
+from giskard_hub.resources import _dataset_import
+from giskard_hub.resources.datasets import AsyncDatasetsResource, DatasetsResource
+from tests._mocks import mock_hub_client
 
 
 @pytest.fixture
 def mock_client():
     """Mock client for testing."""
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     def handle_get_response(path, cast_to=None, **kwargs):
         response_data = mock_client.get.return_value
@@ -408,7 +415,7 @@ class TestDatasetDataModel:
 
     def test_dataset_chat_test_cases_property_with_client(self):
         """Test chat_test_cases property with a client."""
-        mock_client = MagicMock()
+        mock_client = mock_hub_client()
         mock_client.chat_test_cases.list.return_value = ["test_case_1", "test_case_2"]
 
         dataset = Dataset.from_dict(
@@ -421,7 +428,9 @@ class TestDatasetDataModel:
 
         result = dataset.chat_test_cases
 
-        mock_client.chat_test_cases.list.assert_called_once_with(dataset_id="dataset-1")
+        mock_client.chat_test_cases.list.assert_called_once_with(
+            dataset_id="dataset-1", raw=False
+        )
         assert result == ["test_case_1", "test_case_2"]
 
     def test_dataset_chat_test_cases_property_without_client(self):
@@ -434,7 +443,7 @@ class TestDatasetDataModel:
 
     def test_dataset_chat_test_cases_property_without_id(self):
         """Test chat_test_cases property without an ID returns None."""
-        mock_client = MagicMock()
+        mock_client = mock_hub_client()
         dataset = Dataset(name="Test Dataset")
         dataset._client = mock_client
 
@@ -442,12 +451,36 @@ class TestDatasetDataModel:
 
         assert result is None
 
+    def test_dataset_iter_chat_test_cases_with_client(self):
+        """Test iter_chat_test_cases delegates to the paginated resource method."""
+        mock_client = mock_hub_client()
+        mock_client.chat_test_cases.iter.return_value = iter(["test_case_1"])
+
+        dataset = Dataset.from_dict(
+            {"id": "dataset-1", "name": "Test Dataset"},
+            _client=mock_client,
+        )
+
+        result = list(dataset.iter_chat_test_cases(page_size=50))
+
+        mock_client.chat_test_cases.iter.assert_called_once_with(
+            dataset_id="dataset-1", page_size=50
+        )
+        assert result == ["test_case_1"]
+
+    def test_dataset_iter_chat_test_cases_without_client(self):
+        """Test iter_chat_test_cases raises on detached datasets."""
+        dataset = Dataset(name="Test Dataset")
+
+        with pytest.raises(ValueError, match="detached or unsaved"):
+            dataset.iter_chat_test_cases()
+
     def test_dataset_create_chat_test_case_with_client(self):
         """Test create_chat_test_case with a client."""
         from giskard_hub.data.chat import ChatMessage
         from giskard_hub.data.chat_test_case import ChatTestCase
 
-        mock_client = MagicMock()
+        mock_client = mock_hub_client()
         mock_client.chat_test_cases.create.return_value = "created_test_case"
 
         dataset = Dataset.from_dict(
@@ -518,7 +551,7 @@ class TestDatasetDataModel:
         from giskard_hub.resources.chat_test_cases import ChatTestCasesResource
 
         # HTTP-level client mock used by the resource
-        http_client = MagicMock()
+        http_client = mock_hub_client()
 
         # Mimic casting behavior of the lower-level client
         def mock_post(path, json=None, cast_to=None, **kwargs):
@@ -533,7 +566,7 @@ class TestDatasetDataModel:
         resource = ChatTestCasesResource(http_client)
 
         # Dataset client exposing the resource
-        client = SimpleNamespace(chat_test_cases=resource)
+        client = SimpleNamespace(chat_test_cases=resource, identity_map=None)
 
         dataset = Dataset.from_dict(
             {
@@ -575,3 +608,209 @@ class TestDatasetDataModel:
 
         # And we get a proper ChatTestCase back
         assert result.id == "tc-new"
+
+
+def _write_jsonl(path, n):
+    lines = [
+        json.dumps({"messages": [{"role": "user", "content": f"case_{i}"}]})
+        for i in range(n)
+    ]
+    # Blank lines are ignored
+    path.write_text("\n".join(lines[:3] + [""] + lines[3:]) + "\n", encoding="utf-8")
+
+
+def _import_client(fail=(), crash=()):
+    client = mock_hub_client()
+    uploaded = []
+    lock = threading.Lock()
+
+    def post(path, json=None, **kwargs):
+        assert path == "/chat-test-cases"
+        content = json["messages"][0]["content"]
+        if content in crash:
+            raise RuntimeError("Connection lost")
+        if content in fail:
+            raise HubValidationError("Invalid test case", status_code=422)
+        with lock:
+            uploaded.append(content)
+        return {"id": content}
+
+    client.post.side_effect = post
+    return client, uploaded
+
+
+class TestDatasetImport:
+    def test_import_jsonl(self, tmp_path):
+        path = tmp_path / "dataset.jsonl"
+        _write_jsonl(path, 10)
+        client, uploaded = _import_client(fail={"case_4"})
+
+        resource = DatasetsResource(client)
+        result = resource.import_file(path, dataset_id="dataset-1", concurrency=3)
+
+        assert result.num_imported == 9
+        assert result.num_skipped == 0
+        assert list(result.errors) == [4]
+        assert isinstance(result.errors[4], HubValidationError)
+        assert sorted(uploaded) == sorted(f"case_{i}" for i in range(10) if i != 4)
+        assert client.post.call_args.kwargs["json"]["dataset_id"] == "dataset-1"
+
+        # The failed record is saved in the checkpoint and retried on resume
+        checkpoint = json.loads((tmp_path / "dataset.jsonl.checkpoint").read_text())
+        assert checkpoint["done"] == 10
+        assert checkpoint["processed"] == []
+        assert [index for index, _ in checkpoint["failed"]] == [4]
+
+        result = resource.import_file(path, dataset_id="dataset-1")
+        assert result.num_imported == 0
+        assert result.num_skipped == 9
+        assert list(result.errors) == [4]
+        assert client.post.call_count == 11
+
+        client, uploaded = _import_client()
+        result = DatasetsResource(client).import_file(path, dataset_id="dataset-1")
+        assert result.num_imported == 1
+        assert result.errors == {}
+        assert uploaded == ["case_4"]
+
+        # The complete import is not repeated
+        result = DatasetsResource(client).import_file(path, dataset_id="dataset-1")
+        assert result.num_imported == 0
+        assert result.num_skipped == 10
+        assert client.post.call_count == 1
+
+    def test_import_resumes_after_crash(self, tmp_path):
+        path = tmp_path / "dataset.jsonl"
+        _write_jsonl(path, 20)
+        client, uploaded = _import_client(crash={"case_8"})
+
+        resource = DatasetsResource(client)
+        with pytest.raises(RuntimeError):
+            resource.import_file(path, dataset_id="dataset-1", concurrency=4)
+
+        checkpoint = json.loads((tmp_path / "dataset.jsonl.checkpoint").read_text())
+        assert checkpoint["done"] == 8
+        assert checkpoint["offset"] > 0
+        first_run = list(uploaded)
+
+        client, uploaded = _import_client()
+        result = DatasetsResource(client).import_file(
+            path, dataset_id="dataset-1", concurrency=4
+        )
+
+        # Every record is uploaded exactly once across both runs
+        assert sorted(first_run + uploaded) == sorted(f"case_{i}" for i in range(20))
+        assert result.num_imported == len(uploaded)
+        assert result.num_skipped == len(first_run)
+
+    def test_import_reports_invalid_records(self, tmp_path):
+        path = tmp_path / "dataset.jsonl"
+        valid = json.dumps({"messages": [{"role": "user", "content": "ok"}]})
+        path.write_text(
+            "\n".join([valid, "{not json", json.dumps({"tags": []}), valid]) + "\n",
+            encoding="utf-8",
+        )
+        client, uploaded = _import_client()
+
+        resource = DatasetsResource(client)
+        result = resource.import_file(path, dataset_id="dataset-1")
+
+        assert result.num_imported == 2
+        assert uploaded == ["ok", "ok"]
+        assert sorted(result.errors) == [1, 2]
+        assert all(isinstance(e, ValueError) for e in result.errors.values())
+        assert "Invalid record 1 of" in str(result.errors[1])
+
+        # The invalid records are retried on resume, and fail again
+        result = resource.import_file(path, dataset_id="dataset-1")
+        assert result.num_imported == 0
+        assert sorted(result.errors) == [1, 2]
+        assert client.post.call_count == 2
+
+    def test_import_saves_checkpoint_periodically(self, tmp_path, monkeypatch):
+        path = tmp_path / "dataset.jsonl"
+        _write_jsonl(path, 250)
+        client, _ = _import_client()
+
+        saves = []
+        replace = _dataset_import.os.replace
+
+        def counting_replace(src, dst):
+            saves.append(dst)
+            replace(src, dst)
+
+        monkeypatch.setattr(_dataset_import, "CHECKPOINT_EVERY_SECONDS", 3600)
+        monkeypatch.setattr(_dataset_import.os, "replace", counting_replace)
+
+        DatasetsResource(client).import_file(path, dataset_id="dataset-1")
+
+        # Every 100 records, and once at the end
+        assert len(saves) == 3
+        checkpoint = json.loads((tmp_path / "dataset.jsonl.checkpoint").read_text())
+        assert checkpoint["done"] == 250
+
+    def test_import_csv(self, tmp_path):
+        path = tmp_path / "dataset.csv"
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["messages", "tags", "checks"])
+            writer.writerow(
+                [
+                    json.dumps([{"role": "user", "content": "Hello"}]),
+                    json.dumps(["greeting"]),
+                    json.dumps(
+                        [{"identifier": "correctness", "params": {"reference": "Hi"}}]
+                    ),
+                ]
+            )
+            writer.writerow([json.dumps([{"role": "user", "content": "Bye"}]), "", ""])
+        client, uploaded = _import_client()
+
+        result = DatasetsResource(client).import_file(
+            path, dataset_id="dataset-1", checkpoint=False
+        )
+
+        assert result.num_imported == 2
+        assert sorted(uploaded) == ["Bye", "Hello"]
+        assert not (tmp_path / "dataset.csv.checkpoint").exists()
+        payloads = {
+            call.kwargs["json"]["messages"][0]["content"]: call.kwargs["json"]
+            for call in client.post.call_args_list
+        }
+        assert payloads["Hello"]["tags"] == ["greeting"]
+        assert payloads["Hello"]["checks"][0]["identifier"] == "correctness"
+        assert payloads["Bye"]["tags"] == []
+
+    def test_import_rejects_checkpoint_of_other_dataset(self, tmp_path):
+        path = tmp_path / "dataset.jsonl"
+        _write_jsonl(path, 2)
+        client, _ = _import_client()
+
+        resource = DatasetsResource(client)
+        resource.import_file(path, dataset_id="dataset-1")
+
+        with pytest.raises(ValueError, match="another dataset"):
+            resource.import_file(path, dataset_id="dataset-2")
+        with pytest.raises(ValueError, match="jsonl"):
+            resource.import_file(tmp_path / "dataset.txt", dataset_id="dataset-1")
+
+    def test_async_import_jsonl(self, tmp_path):
+        path = tmp_path / "dataset.jsonl"
+        _write_jsonl(path, 6)
+        client, uploaded = _import_client(fail={"case_2"})
+        post = client.post.side_effect
+
+        async def async_post(path, **kwargs):
+            return post(path, **kwargs)
+
+        client.post = async_post
+
+        result = asyncio.run(
+            AsyncDatasetsResource(client).import_file(
+                path, dataset_id="dataset-1", concurrency=2
+            )
+        )
+
+        assert result.num_imported == 5
+        assert list(result.errors) == [2]
+        assert len(uploaded) == 5
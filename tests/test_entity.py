@@ -0,0 +1,294 @@
+import copy
+import pickle
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dateutil import parser
+
+from giskard_hub.data import _base
+from giskard_hub.data._base import _DESERIALIZERS, BaseData, maybe_to_dict, to_dict_list
+from giskard_hub.data._entity import Entity, parse_datetime
+from giskard_hub.data.chat import ChatMessage, ChatMessageWithMetadata
+from giskard_hub.data.chat_test_case import ChatTestCase
+from giskard_hub.data.check import CheckConfig
+from giskard_hub.data.evaluation import EvaluationEntry
+from giskard_hub.data.model import Model, ModelOutput
+from giskard_hub.data.project import Project
+from giskard_hub.data.scan import ProbeAttempt
+from giskard_hub.data.task import TaskProgress, TaskStatus
+from tests._mocks import mock_hub_client
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-06-17T12:46:52.424Z",
+        "2025-06-17T12:46:52.424123Z",
+        "2025-06-17T12:46:52Z",
+        "2025-06-17T12:46:52.424+02:00",
+        "2025-06-17T12:46:52.424123",
+        "2025-06-17 12:46:52",
+        "2025-06-17",
+        # Not supported by `datetime.fromisoformat` before Python 3.11
+        "2025-06-17T12:46:52.4Z",
+        "2025-06-17T12:46:52.424+0200",
+        # Not ISO-8601
+        "June 17, 2025 12:46:52 UTC",
+    ],
+)
+def test_parse_datetime_matches_dateutil(value):
+    parsed = parse_datetime(value)
+
+    assert parsed == parser.parse(value)
+    assert parsed.utcoffset() == parser.parse(value).utcoffset()
+
+
+def test_parse_datetime_uses_utc_for_z_suffix():
+    parsed = parse_datetime("2025-06-17T12:46:52.424Z")
+
+    assert parsed == datetime(2025, 6, 17, 12, 46, 52, 424000, tzinfo=timezone.utc)
+    assert parsed.utcoffset() == timedelta(0)
+
+
+def test_parse_datetime_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        parse_datetime("not a date")
+
+
+def test_entity_from_dict_parses_timestamps():
+    project = Project.from_dict(
+        {
+            "id": "proj_1",
+            "name": "Project",
+            "description": "",
+            "created_at": "2025-06-17T12:46:52.424Z",
+            "updated_at": "2025-06-18T08:00:00+02:00",
+        }
+    )
+
+    assert project.created_at == datetime(
+        2025, 6, 17, 12, 46, 52, 424000, tzinfo=timezone.utc
+    )
+    assert project.updated_at == datetime(2025, 6, 18, 6, tzinfo=timezone.utc)
+
+
+@dataclass
+class _Item(BaseData):
+    name: str
+    count: int = 0
+    label: str | None = field(init=False, default="default")
+    when: datetime | None = field(init=False, default=None)
+
+    _from_dict_converters = {"when": parse_datetime, "count": int}
+
+
+def test_base_data_from_dict_uses_compiled_deserializer():
+    item = _Item.from_dict(
+        {"name": "a", "count": "3", "label": "x", "when": "2025-06-17T12:00:00Z"}
+    )
+
+    assert item.name == "a"
+    assert item.count == 3
+    assert item.label == "x"
+    assert item.when == datetime(2025, 6, 17, 12, tzinfo=timezone.utc)
+    assert _Item in _DESERIALIZERS
+
+
+def test_base_data_from_dict_keeps_missing_and_falsy_values():
+    item = _Item.from_dict({"count": 0, "when": None})
+
+    # Missing init fields are None, missing non-init fields keep their default
+    assert item.name is None
+    assert item.count == 0
+    assert item.label == "default"
+    assert item.when is None
+
+
+def test_base_data_from_dict_is_compiled_once(monkeypatch):
+    compiled = []
+    original = _base._compile_from_dict
+
+    def _compile(cls):
+        compiled.append(cls)
+        return original(cls)
+
+    monkeypatch.setattr(_base, "_compile_from_dict", _compile)
+    monkeypatch.delitem(_DESERIALIZERS, _Item, raising=False)
+
+    _Item.from_dict({"name": "a"})
+    _Item.from_dict({"name": "b"})
+
+    assert compiled == [_Item]
+
+
+def test_subclasses_have_their_own_deserializer():
+    client = mock_hub_client()
+    project = Project.from_dict({"id": "proj_1", "name": "Project"}, _client=client)
+    entity = Entity.from_dict({"id": "entity_1", "name": "ignored"})
+
+    assert isinstance(project, Project)
+    assert project._client is client
+    assert type(entity) is Entity
+    assert entity.id == "entity_1"
+
+
+def test_to_dict_serializes_nested_values():
+    entry = EvaluationEntry(
+        run_id="run_1",
+        chat_test_case=ChatTestCase(
+            messages=[ChatMessage(role="user", content="Hi")],
+            demo_output=ChatMessageWithMetadata(
+                role="assistant", content="Hello", metadata={"k": [1, 2]}
+            ),
+            tags=("a", "b"),
+            checks=[CheckConfig(identifier="correctness", params={"reference": "x"})],
+        ),
+        status=TaskStatus.FINISHED,
+    )
+
+    assert entry.to_dict() == {
+        "id": None,
+        "created_at": None,
+        "updated_at": None,
+        "run_id": "run_1",
+        "chat_test_case": {
+            "id": None,
+            "created_at": None,
+            "updated_at": None,
+            "messages": [{"role": "user", "content": "Hi"}],
+            "demo_output": {
+                "role": "assistant",
+                "content": "Hello",
+                "metadata": {"k": [1, 2]},
+            },
+            "tags": ["a", "b"],
+            "checks": [
+                {
+                    "identifier": "correctness",
+                    "params": {"reference": "x"},
+                    "enabled": True,
+                }
+            ],
+        },
+        "model_output": None,
+        "results": [],
+        "status": "finished",
+        "failure_category": None,
+    }
+
+
+def test_to_dict_respects_custom_implementations():
+    @dataclass
+    class _Custom(BaseData):
+        value: int
+
+        def to_dict(self):
+            return {"custom": self.value}
+
+    assert maybe_to_dict([_Custom(1), _Custom(2)]) == [{"custom": 1}, {"custom": 2}]
+    assert maybe_to_dict({"a": _Custom(3)}) == {"a": {"custom": 3}}
+
+
+@pytest.mark.parametrize(
+    "items, expected",
+    [
+        ([], []),
+        (["a", "b"], ["a", "b"]),
+        (
+            (ChatMessage(role="user", content="Hi") for _ in range(2)),
+            [{"role": "user", "content": "Hi"}] * 2,
+        ),
+        (
+            [
+                ChatMessage(role="user", content="Hi"),
+                {"role": "assistant", "content": "Hello"},
+                ChatMessageWithMetadata(role="assistant", content="!", metadata=None),
+            ],
+            [
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello"},
+                {"role": "assistant", "content": "!", "metadata": None},
+            ],
+        ),
+        (["a", TaskStatus.FINISHED], ["a", "finished"]),
+    ],
+)
+def test_to_dict_list(items, expected):
+    assert to_dict_list(items) == expected
+
+
+def test_to_dict_list_does_not_share_nested_containers():
+    message = ChatMessageWithMetadata(role="user", content="Hi", metadata={"a": 1})
+
+    serialized = to_dict_list([message])
+    serialized[0]["metadata"]["a"] = 2
+
+    assert message.metadata == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        ChatMessage,
+        ChatMessageWithMetadata,
+        ModelOutput,
+        TaskProgress,
+        ChatTestCase,
+        EvaluationEntry,
+        ProbeAttempt,
+        Project,
+    ],
+)
+def test_data_classes_are_slotted(cls):
+    assert "__slots__" in vars(cls)
+    assert not hasattr(cls.__new__(cls), "__dict__")
+
+
+def test_slotted_entity_round_trip():
+    data = {
+        "id": "proj_1",
+        "name": "Project",
+        "description": "",
+        "created_at": "2025-06-17T12:46:52.424Z",
+        "updated_at": "2025-06-17T12:46:52.424Z",
+    }
+    project = Project.from_dict(data)
+
+    assert project.id == "proj_1"
+    assert project.to_dict()["name"] == "Project"
+    assert pickle.loads(pickle.dumps(project)) == project
+    assert copy.deepcopy(project) == project
+
+
+def test_slotted_entity_hydrate():
+    project = Project.from_dict({"id": "proj_1", "name": "Old"})
+    project._hydrate(  # pylint: disable=protected-access
+        Project.from_dict({"id": "proj_1", "name": "New", "description": "Desc"})
+    )
+
+    assert project.name == "New"
+    assert project.description == "Desc"
+
+
+def test_saved_entities_compare_and_hash_by_id():
+    first = Model.from_dict({"id": "model_1", "name": "Model"})
+    updated = Model.from_dict({"id": "model_1", "name": "Renamed"})
+    other = Model.from_dict({"id": "model_2", "name": "Model"})
+    project = Project.from_dict({"id": "model_1", "name": "Model"})
+
+    assert first == updated
+    assert hash(first) == hash(updated)
+    assert first != other
+    assert first != project
+    assert {first, updated, other, project} == {first, other, project}
+    assert {first: "value"}[updated] == "value"
+
+
+def test_unsaved_entities_compare_by_fields():
+    assert Project(name="Project") == Project(name="Project")
+    assert Project(name="Project") != Project(name="Other")
+    assert Project(name="Project") != Project.from_dict({"id": "p", "name": "Project"})
+
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(Project(name="Project"))
@@ -14,6 +14,7 @@ from giskard_hub.errors import (
     HubValidationError,
 )
 from giskard_hub.resources.evaluations import EvaluationsResource
+from tests._mocks import mock_hub_client
 
 TEST_CONVERSATION_DATA = {
     "id": "conv_123",
@@ -115,7 +116,7 @@ TEST_EVALUATION_ENTRY_WITH_FAILURE_CATEGORY = {
 @pytest.fixture
 def mock_client():
     """Create a mock client for testing."""
-    client = Mock()
+    client = mock_hub_client(Mock)
     return client
 
 
@@ -144,6 +145,66 @@ def test_evaluation_entry_from_chat_test_case():
     assert evaluation_entry.chat_test_case.id == chat_test_case.id
 
 
+_LAZY_ENTRY_DATA = {
+    "id": "entry_1",
+    "evaluation_id": "run_123",
+    "chat_test_case": TEST_CONVERSATION_DATA,
+    "output": {"response": {"role": "assistant", "content": "Hi"}},
+    "results": [{"name": "correctness", "status": "finished", "passed": True}],
+    "status": "finished",
+    "failure_category": {"category": None, "status": "finished", "error": None},
+}
+
+
+def test_evaluation_entry_parses_nested_payloads_lazily(monkeypatch):
+    parsed = []
+    from_dict = ChatTestCase.from_dict
+    monkeypatch.setattr(
+        ChatTestCase,
+        "from_dict",
+        classmethod(lambda cls, data: parsed.append(data) or from_dict(data)),
+    )
+
+    entry = EvaluationEntry.from_dict(_LAZY_ENTRY_DATA)
+
+    assert entry.run_id == "run_123"
+    assert entry.results[0]["passed"] is True
+    assert not parsed
+
+    assert entry.chat_test_case is entry.chat_test_case
+    assert entry.chat_test_case.id == "conv_123"
+    assert len(parsed) == 1
+
+
+def test_lazy_evaluation_entry_matches_eager_one():
+    lazy = EvaluationEntry.from_dict(_LAZY_ENTRY_DATA)
+    eager = EvaluationEntry.from_dict(_LAZY_ENTRY_DATA, lazy=False)
+
+    assert isinstance(eager.chat_test_case, ChatTestCase)
+    assert isinstance(lazy.model_output, ModelOutput)
+    assert lazy.failure_category.status == TaskStatus.FINISHED
+    assert lazy == eager
+    assert lazy.to_dict() == eager.to_dict()
+
+
+def test_lazy_evaluation_entry_field_can_be_set():
+    entry = EvaluationEntry.from_dict(_LAZY_ENTRY_DATA)
+    chat_test_case = ChatTestCase(tags=["new"])
+
+    entry.chat_test_case = chat_test_case
+
+    assert entry.chat_test_case is chat_test_case
+
+
+def test_lazy_evaluation_entry_field_with_invalid_payload():
+    entry = EvaluationEntry.from_dict(
+        {**_LAZY_ENTRY_DATA, "chat_test_case": ["invalid"]}
+    )
+
+    with pytest.raises(HubAPIError, match="`chat_test_case` field of EvaluationEntry"):
+        entry.chat_test_case  # pylint: disable=pointless-statement
+
+
 # Tests for EvaluationsResource.retrieve()
 def test_retrieve_success(evaluations_resource, mock_client):
     """Test successful retrieval of evaluation run."""
@@ -682,3 +743,66 @@ def test_update_entry_forbidden(evaluations_resource, mock_client):
             entry_id="entry_456",
             model_output=ModelOutput.from_dict(TEST_MODEL_OUTPUT_DATA),
         )
+
+
+def _paginated_get(items):
+    def get(path, params=None, **kwargs):
+        offset, limit = params["offset"], params["limit"]
+        return {"items": items[offset : offset + limit]}
+
+    return get
+
+
+# Tests for EvaluationsResource.iter_entries()
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_entries_walks_all_pages(evaluations_resource, mock_client, prefetch):
+    """Test iterating over evaluation entries page by page."""
+    items = [{**TEST_EVALUATION_ENTRY_DATA, "id": f"entry_{i}"} for i in range(5)]
+    mock_client.get.side_effect = _paginated_get(items)
+
+    entries = evaluations_resource.iter_entries(
+        "run_123", page_size=2, prefetch=prefetch
+    )
+
+    assert [entry.id for entry in entries] == [f"entry_{i}" for i in range(5)]
+    assert [call.kwargs["params"] for call in mock_client.get.call_args_list] == [
+        {"offset": 0, "limit": 2},
+        {"offset": 2, "limit": 2},
+        {"offset": 4, "limit": 2},
+    ]
+    mock_client.get.assert_called_with(
+        "/evaluations/run_123/results", params={"offset": 4, "limit": 2}
+    )
+
+
+def test_iter_entries_is_lazy(evaluations_resource, mock_client):
+    """Test that pages are only requested when iterating."""
+    items = [{**TEST_EVALUATION_ENTRY_DATA, "id": f"entry_{i}"} for i in range(10)]
+    mock_client.get.side_effect = _paginated_get(items)
+
+    entries = evaluations_resource.iter_entries("run_123", page_size=2, prefetch=False)
+    mock_client.get.assert_not_called()
+
+    first = next(entries)
+    assert isinstance(first, EvaluationEntry)
+    assert mock_client.get.call_count == 1
+    entries.close()
+
+
+def test_iter_entries_stops_on_total(evaluations_resource, mock_client):
+    """Test that no extra request is made when the total is known."""
+    mock_client.get.return_value = {
+        "items": [TEST_EVALUATION_ENTRY_DATA, TEST_EVALUATION_ENTRY_DATA],
+        "total": 2,
+    }
+
+    assert len(list(evaluations_resource.iter_entries("run_123", page_size=2))) == 2
+    mock_client.get.assert_called_once()
+
+
+def test_iter_entries_propagates_errors(evaluations_resource, mock_client):
+    """Test that errors raised while fetching a page are propagated."""
+    mock_client.get.side_effect = HubAPIError("Server error", status_code=500)
+
+    with pytest.raises(HubAPIError):
+        list(evaluations_resource.iter_entries("run_123"))
@@ -0,0 +1,179 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from giskard_hub._health import clear_health_cache
+from giskard_hub.client import AsyncHubClient, HubClient
+from giskard_hub.errors import HubConnectionError
+
+_HEALTH = {"status": "ok", "services": {"backend": "ok"}}
+_PROJECT = {"id": "proj_1", "name": "Project", "description": ""}
+
+
+@pytest.fixture(autouse=True)
+def _clear_health_cache():
+    clear_health_cache()
+    yield
+    clear_health_cache()
+
+
+class _Hub:
+    def __init__(self, health=None):
+        self.health = health or _HEALTH
+        self.calls = []
+
+    def __call__(self, request):
+        self.calls.append(request.url.path)
+        if request.url.path.endswith("/_health"):
+            return httpx.Response(200, json=self.health)
+        return httpx.Response(200, json=_PROJECT)
+
+    @property
+    def health_checks(self):
+        return self.calls.count("/_api/_health")
+
+    def client(self, **kwargs):
+        return HubClient(
+            hub_url="https://hub.example.com",
+            api_key="test-key",
+            http_client=httpx.Client(transport=httpx.MockTransport(self)),
+            **kwargs,
+        )
+
+
+def test_health_is_checked_on_creation_by_default():
+    hub = _Hub()
+
+    hub.client()
+    hub.client()
+
+    assert hub.health_checks == 2
+
+
+def test_lazy_client_checks_connection_on_first_request():
+    hub = _Hub()
+
+    client = hub.client(lazy=True)
+    assert hub.calls == []
+
+    client.projects.retrieve("proj_1")
+    client.projects.retrieve("proj_1")
+
+    assert hub.calls == [
+        "/_api/_health",
+        "/_api/projects/proj_1",
+        "/_api/projects/proj_1",
+    ]
+
+
+def test_lazy_client_raises_on_first_request():
+    hub = _Hub(health={"status": "error"})
+
+    client = hub.client(lazy=True)
+
+    with pytest.raises(HubConnectionError, match="Expected status 'ok'"):
+        client.projects.retrieve("proj_1")
+    assert hub.calls == ["/_api/_health"]
+
+
+def test_health_check_is_cached_across_clients():
+    hub = _Hub()
+
+    hub.client(health_check_ttl=60)
+    hub.client(health_check_ttl=60)
+    client = hub.client(health_check_ttl=60, lazy=True)
+    client.projects.retrieve("proj_1")
+
+    assert hub.health_checks == 1
+
+
+def test_health_check_cache_expires(monkeypatch):
+    hub = _Hub()
+    now = [1000.0]
+    monkeypatch.setattr("giskard_hub._health.time.time", lambda: now[0])
+
+    hub.client(health_check_ttl=60)
+    now[0] += 59
+    hub.client(health_check_ttl=60)
+    now[0] += 2
+    hub.client(health_check_ttl=60)
+
+    assert hub.health_checks == 2
+
+
+def test_failed_health_checks_are_not_cached():
+    hub = _Hub(health={"status": "error"})
+
+    for _ in range(2):
+        with pytest.raises(HubConnectionError):
+            hub.client(health_check_ttl=60)
+
+    assert hub.health_checks == 2
+
+
+def test_strict_health_check_is_not_satisfied_by_cached_check():
+    hub = _Hub(health={"status": "ok", "services": {"frontend": "ok"}})
+
+    hub.client(health_check_ttl=60)
+    with pytest.raises(HubConnectionError, match="frontend URL"):
+        HubClient(
+            hub_url="https://hub.example.com/_api",
+            api_key="test-key",
+            auto_add_api_suffix=False,
+            health_check_ttl=60,
+            http_client=httpx.Client(transport=httpx.MockTransport(hub)),
+        )
+
+
+def test_health_check_disk_cache(tmp_path):
+    hub = _Hub()
+    cache_file = tmp_path / "cache" / "health.json"
+
+    hub.client(health_check_ttl=60, health_check_cache_file=cache_file)
+    assert "https://hub.example.com/_api|api" in json.loads(cache_file.read_text())
+
+    # Simulate a new process
+    clear_health_cache()
+    hub.client(health_check_ttl=60, health_check_cache_file=cache_file)
+
+    assert hub.health_checks == 1
+
+
+def test_corrupted_disk_cache_is_ignored(tmp_path):
+    hub = _Hub()
+    cache_file = tmp_path / "health.json"
+    cache_file.write_text("not json")
+
+    hub.client(health_check_ttl=60, health_check_cache_file=cache_file)
+
+    assert hub.health_checks == 1
+    assert json.loads(cache_file.read_text())
+
+
+def test_explicit_check_connection_ignores_cache():
+    hub = _Hub()
+
+    client = hub.client(health_check_ttl=60)
+    client.check_connection()
+
+    assert hub.health_checks == 2
+
+
+def test_async_client_uses_health_check_cache():
+    hub = _Hub()
+
+    async def _run():
+        for _ in range(2):
+            client = AsyncHubClient(
+                hub_url="https://hub.example.com",
+                api_key="test-key",
+                health_check_ttl=60,
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(hub)),
+            )
+            await client.projects.retrieve("proj_1")
+
+    asyncio.run(_run())
+
+    assert hub.health_checks == 1
@@ -0,0 +1,173 @@
+import asyncio
+
+import httpx
+import pytest
+
+from giskard_hub._base_client import AsyncClient
+from giskard_hub._identity_map import IdentityMap
+from giskard_hub.client import HubClient
+from giskard_hub.data.dataset import Dataset
+from giskard_hub.data.evaluation import EvaluationRun
+from giskard_hub.data.model import Model
+from giskard_hub.data.project import Project
+from tests._mocks import mock_hub_client
+
+_MODEL = {"id": "model_1", "name": "Model", "project_id": "proj_1"}
+_DATASET = {"id": "dataset_1", "name": "Dataset", "project_id": "proj_1"}
+
+
+def _run(index, model=None):
+    return {
+        "id": f"run_{index}",
+        "name": f"Run {index}",
+        "project_id": "proj_1",
+        "datasets": [_DATASET],
+        "model": model or _MODEL,
+        "status": {"state": "finished", "current": 1, "total": 1},
+        "metrics": [],
+    }
+
+
+def _client(identity_map_size):
+    client = mock_hub_client()
+    client.identity_map = IdentityMap(identity_map_size)
+    return client
+
+
+def test_identity_map_shares_entities():
+    client = _client(10)
+
+    first = Model.from_dict(_MODEL, _client=client)
+    second = Model.from_dict({**_MODEL, "name": "Renamed"}, _client=client)
+
+    assert second is first
+    assert first.name == "Renamed"
+    assert len(client.identity_map) == 1
+
+
+def test_identity_map_merges_partial_payloads():
+    client = _client(10)
+    full = {
+        **_MODEL,
+        "url": "https://model.example.com",
+        "description": "A model",
+        "supported_languages": ["en"],
+        "headers": [{"name": "X-API-Key", "value": "secret"}],
+    }
+
+    model = Model.from_dict(full, _client=client)
+    run = EvaluationRun.from_dict(
+        _run(1, model={**_MODEL, "name": "Renamed"}), _client=client
+    )
+
+    # The nested summary updates the fields it holds, and keeps the others
+    assert run.model is model
+    assert model.name == "Renamed"
+    assert model.url == "https://model.example.com"
+    assert model.headers == {"X-API-Key": "secret"}
+
+
+def test_identity_map_is_keyed_by_type_and_id():
+    client = _client(10)
+
+    model = Model.from_dict({**_MODEL, "id": "same"}, _client=client)
+    dataset = Dataset.from_dict({**_DATASET, "id": "same"}, _client=client)
+
+    assert dataset is not model
+    assert client.identity_map.get(Model, "same") is model
+    assert client.identity_map.get(Dataset, "same") is dataset
+
+
+def test_identity_map_evicts_least_recently_received():
+    client = _client(2)
+
+    first = Project.from_dict({"id": "proj_1", "name": "1"}, _client=client)
+    Project.from_dict({"id": "proj_2", "name": "2"}, _client=client)
+    Project.from_dict({"id": "proj_1", "name": "1"}, _client=client)
+    Project.from_dict({"id": "proj_3", "name": "3"}, _client=client)
+
+    assert len(client.identity_map) == 2
+    assert client.identity_map.get(Project, "proj_1") is first
+    assert client.identity_map.get(Project, "proj_2") is None
+
+
+def test_identity_map_ignores_entities_without_id():
+    identity_map = IdentityMap(10)
+
+    first = identity_map.resolve(Project(name="1"))
+    second = identity_map.resolve(Project(name="2"))
+
+    assert first is not second
+    assert len(identity_map) == 0
+
+
+def test_identity_map_size_must_be_positive():
+    with pytest.raises(ValueError):
+        IdentityMap(0)
+
+
+def test_entities_are_not_shared_without_identity_map():
+    client = mock_hub_client()
+
+    assert Model.from_dict(_MODEL, _client=client) is not Model.from_dict(
+        _MODEL, _client=client
+    )
+
+
+def _hub(identity_map_size=0):
+    def handler(request):
+        if request.url.path.endswith("/_health"):
+            return httpx.Response(200, json={"status": "ok"})
+        return httpx.Response(200, json=[_run(1), _run(2)])
+
+    return HubClient(
+        hub_url="https://hub.example.com",
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        identity_map_size=identity_map_size,
+    )
+
+
+def test_hub_client_shares_nested_entities():
+    hub = _hub(identity_map_size=100)
+
+    first, second = hub.evaluations.list("proj_1")
+    again, _ = hub.evaluations.list("proj_1")
+
+    assert isinstance(first, EvaluationRun)
+    assert first.model is second.model
+    assert first.datasets[0] is second.datasets[0]
+    assert again is first
+    assert hub.identity_map.get(Model, "model_1") is first.model
+
+
+def test_identity_map_is_disabled_by_default():
+    hub = _hub()
+
+    first, second = hub.evaluations.list("proj_1")
+
+    assert hub.identity_map is None
+    assert first.model is not second.model
+    assert first.model == second.model
+
+
+def test_async_client_identity_map():
+    client = AsyncClient(
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json=_MODEL)
+            ),
+            base_url="https://hub",
+        ),
+        identity_map_size=10,
+    )
+
+    async def run():
+        async with client:
+            first = await client.get("/models/model_1", cast_to=Model)
+            second = await client.get("/models/model_1", cast_to=Model)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first is second
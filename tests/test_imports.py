@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+import giskard_hub
+
+
+def _loaded_modules(statement, modules):
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {modules!r} if m in sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return output.split()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import giskard_hub",
+        "from giskard_hub import Dataset, EvaluationRun, ScanResult",
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(statement):
+    loaded = _loaded_modules(
+        statement, ["httpx", "rich", "dateutil", "giskard_hub.client"]
+    )
+
+    assert loaded == []
+
+
+def test_client_import_does_not_load_unused_modules():
+    loaded = _loaded_modules(
+        "from giskard_hub import HubClient",
+        ["dateutil", "giskard_hub.resources.scans", "giskard_hub.data.scan"],
+    )
+
+    assert loaded == []
+
+
+def test_resources_are_loaded_on_first_access():
+    loaded = _loaded_modules(
+        "from giskard_hub import HubClient\n"
+        "client = HubClient.__new__(HubClient)\n"
+        "client.scans",
+        ["giskard_hub.resources.scans", "giskard_hub.resources.models"],
+    )
+
+    assert loaded == ["giskard_hub.resources.scans"]
+
+
+def test_lazy_attributes():
+    from giskard_hub.data.dataset import Dataset
+
+    assert giskard_hub.Dataset is Dataset
+    assert set(giskard_hub.__all__) <= set(dir(giskard_hub))
+
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        giskard_hub.Unknown  # pylint: disable=pointless-statement
@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from giskard_hub._base_client import AsyncClient, SyncClient
+from giskard_hub._intern import MAX_INTERNED_LENGTH, intern_strings
+from giskard_hub.data.evaluation import EvaluationEntry
+
+_ENTRIES = {
+    "items": [
+        {
+            "id": f"entry_{i}",
+            "run_id": "run_" + "1",
+            "status": "finished",
+            "chat_test_case": {
+                "messages": [{"role": "us" + "er", "content": f"Question {i}?"}],
+                "tags": ["ta" + "g"],
+                "checks": [{"identifier": "correct" + "ness", "enabled": True}],
+            },
+        }
+        for i in range(2)
+    ]
+}
+
+
+def _decoded():
+    return json.loads(json.dumps(_ENTRIES))
+
+
+def test_intern_strings_shares_repeated_values():
+    data = intern_strings(_decoded())
+    first, second = data["items"]
+
+    assert first["run_id"] is second["run_id"]
+    assert first["status"] is second["status"]
+    first_case, second_case = first["chat_test_case"], second["chat_test_case"]
+    assert first_case["messages"][0]["role"] is second_case["messages"][0]["role"]
+    assert first_case["tags"][0] is second_case["tags"][0]
+    assert (
+        first_case["checks"][0]["identifier"] is second_case["checks"][0]["identifier"]
+    )
+
+
+def test_intern_strings_keeps_values():
+    assert intern_strings(_decoded()) == _ENTRIES
+
+
+def test_intern_strings_ignores_other_keys_and_long_values():
+    long_value = "x" * (MAX_INTERNED_LENGTH + 1)
+    data = json.loads(
+        json.dumps(
+            [
+                {"content": "Hello", "run_id": long_value},
+                {"content": "Hello", "run_id": long_value},
+            ]
+        )
+    )
+
+    intern_strings(data)
+
+    assert data[0]["content"] is not data[1]["content"]
+    assert data[0]["run_id"] is not data[1]["run_id"]
+
+
+@pytest.mark.parametrize("data", [None, 1, "text", [], {}, [1, "a", None]])
+def test_intern_strings_accepts_any_json(data):
+    assert intern_strings(data) == data
+
+
+def _transport():
+    return httpx.MockTransport(
+        lambda request: httpx.Response(200, content=json.dumps(_ENTRIES).encode())
+    )
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_client_interns_responses(enabled):
+    client = SyncClient(
+        http_client=httpx.Client(transport=_transport(), base_url="https://hub"),
+        json_codec="stdlib",
+        intern_strings=enabled,
+    )
+
+    entries = [EvaluationEntry.from_dict(e) for e in client.get("/entries")["items"]]
+
+    messages = [entry.chat_test_case.messages[0] for entry in entries]
+    assert (messages[0].role is messages[1].role) is enabled
+
+
+def test_async_client_interns_responses():
+    async def run():
+        client = AsyncClient(
+            http_client=httpx.AsyncClient(
+                transport=_transport(), base_url="https://hub"
+            ),
+            intern_strings=True,
+        )
+        async with client:
+            return await client.get("/entries")
+
+    first, second = asyncio.run(run())["items"]
+
+    assert first["run_id"] is second["run_id"]
+
+
+def test_client_does_not_intern_responses_by_default():
+    client = SyncClient(
+        http_client=httpx.Client(transport=_transport(), base_url="https://hub"),
+    )
+
+    first, second = client.get("/entries")["items"]
+
+    assert first["run_id"] is not second["run_id"]
@@ -0,0 +1,196 @@
+import asyncio
+import json
+import math
+from datetime import datetime
+
+import httpx
+import pytest
+
+from giskard_hub._base_client import AsyncClient, SyncClient
+from giskard_hub._json import (
+    MsgspecCodec,
+    OrjsonCodec,
+    is_plain_json,
+    resolve_json_codec,
+)
+from giskard_hub.errors import HubAPIError, HubJSONDecodeError
+
+_PAYLOAD = {
+    "name": "Évaluation 🚀",
+    "values": [1, 2.5, -0.0, 1e-7, 123456789012345678, None, True],
+    "nested": {"a": [{"b": "c"}], "empty": {}},
+}
+
+
+@pytest.fixture(params=["orjson", "msgspec"])
+def codec_name(request):
+    pytest.importorskip(request.param)
+    return request.param
+
+
+def _client(codec_name, handler):
+    return SyncClient(
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(handler), base_url="https://hub"
+        ),
+        json_codec=codec_name,
+    )
+
+
+def _echo(request):
+    return httpx.Response(200, content=request.content or b"{}")
+
+
+def _stdlib_body(data):
+    return httpx.Request("POST", "https://hub", json=data).content
+
+
+def test_request_body_is_identical_to_stdlib(codec_name):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    _client(codec_name, handler).post("/test", json=_PAYLOAD)
+
+    # Floats may be written differently (e.g. 1e-7 and 1e-07), but not parsed so
+    assert json.loads(requests[0].content) == json.loads(_stdlib_body(_PAYLOAD))
+    assert requests[0].headers["content-type"] == "application/json"
+
+
+def test_response_is_decoded_like_stdlib(codec_name):
+    body = json.dumps(_PAYLOAD, ensure_ascii=False).encode()
+    client = _client(codec_name, lambda r: httpx.Response(200, content=body))
+
+    assert client.get("/test") == json.loads(body)
+
+
+def test_response_falls_back_to_stdlib(codec_name):
+    body = b'{"percentage": NaN}'
+    client = _client(codec_name, lambda r: httpx.Response(200, content=body))
+
+    data = client.get("/test")
+
+    assert math.isnan(data["percentage"])
+
+
+def test_invalid_response_raises_stdlib_error(codec_name):
+    client = _client(codec_name, lambda r: httpx.Response(200, content=b"{invalid"))
+
+    with pytest.raises(HubJSONDecodeError) as exc_info:
+        client.get("/test")
+
+    assert "Expecting property name enclosed in double quotes" in str(exc_info.value)
+
+
+def test_request_body_falls_back_to_stdlib(codec_name):
+    client = _client(codec_name, _echo)
+
+    assert client.post("/test", json={1: "int key"}) == {"1": "int key"}
+
+
+def test_orjson_does_not_encode_values_rejected_by_stdlib():
+    pytest.importorskip("orjson")
+    client = _client("orjson", _echo)
+
+    with pytest.raises(HubAPIError, match="not JSON serializable"):
+        client.post("/test", json={"date": datetime(2025, 1, 1)})
+
+
+def _post(codec_name, json_body):
+    """Return the response to the request, or the error raised."""
+    try:
+        return _client(codec_name, _echo).post("/test", json=json_body)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [float("nan"), float("inf"), datetime(2025, 1, 1), 2**64],
+    ids=["nan", "inf", "datetime", "int128"],
+)
+def test_request_body_values_are_encoded_like_stdlib(codec_name, value):
+    assert _post(codec_name, [value]) == _post("stdlib", [value])
+
+
+def test_response_with_large_integers_is_decoded_like_stdlib(codec_name):
+    body = b'{"small": 1, "large": 123456789012345678901, "negative": -99999999999999999999}'
+    client = _client(codec_name, lambda r: httpx.Response(200, content=body))
+
+    data = client.get("/test")
+
+    assert data == json.loads(body)
+    assert isinstance(data["large"], int)
+
+
+def test_plain_json_values():
+    assert is_plain_json(_PAYLOAD)
+    assert not is_plain_json({"a": [1, float("nan")]})
+    assert not is_plain_json({1: "int key"})
+    assert not is_plain_json(-(2**63) - 1)
+
+    circular = []
+    circular.append(circular)
+    assert not is_plain_json(circular)
+
+
+def test_empty_json_body_is_not_sent(codec_name):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    _client(codec_name, handler).post("/test", json=None)
+
+    assert requests[0].content == b""
+
+
+def test_async_client_uses_codec(codec_name):
+    client = AsyncClient(
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(_echo), base_url="https://hub"
+        ),
+        json_codec=codec_name,
+    )
+
+    assert asyncio.run(client.post("/test", json=_PAYLOAD)) == _PAYLOAD
+
+
+def test_resolve_json_codec(monkeypatch):
+    assert resolve_json_codec("stdlib") is None
+
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        resolve_json_codec("ujson")
+
+    monkeypatch.setattr("giskard_hub._json.importlib.util.find_spec", lambda n: None)
+    assert resolve_json_codec("auto") is None
+    with pytest.raises(ImportError, match="giskard-hub\\[orjson\\]"):
+        resolve_json_codec("orjson")
+
+
+def test_auto_json_codec_prefers_orjson(monkeypatch):
+    pytest.importorskip("orjson")
+
+    assert isinstance(resolve_json_codec("auto"), OrjsonCodec)
+
+    monkeypatch.setattr(
+        "giskard_hub._json.importlib.util.find_spec",
+        lambda name: None if name == "orjson" else object(),
+    )
+    pytest.importorskip("msgspec")
+    assert isinstance(resolve_json_codec("auto"), MsgspecCodec)
+
+
+def test_stdlib_codec_keeps_httpx_encoding():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    _client("stdlib", handler).post("/test", json=_PAYLOAD)
+
+    assert requests[0].content == _stdlib_body(_PAYLOAD)
@@ -1,17 +1,17 @@
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
 from giskard_hub.data.knowledge_base import Document, KnowledgeBase, Topic
 from giskard_hub.resources.knowledge_bases import KnowledgeBasesResource
+from tests._mocks import mock_hub_client
 
 
 @pytest.fixture
 def mock_client():
     """Mock client for testing."""
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     def handle_get_response(path, cast_to=None, **kwargs):
         response_data = mock_client.get.return_value
@@ -0,0 +1,262 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from giskard_hub._evaluation import MAX_CONSECUTIVE_MODEL_FAILURES, LocalModel
+from giskard_hub.client import AsyncHubClient, HubClient
+from giskard_hub.data.chat import ChatMessage
+from giskard_hub.data.evaluation import EvaluationRun
+from giskard_hub.data.model import ModelOutput
+from giskard_hub.errors import HubAPIError
+
+_RUN = {
+    "id": "run_123",
+    "name": "local",
+    "project_id": "proj_123",
+    "model": {"id": "model_123", "name": "my_model"},
+    "status": {"state": "finished", "current": 3, "total": 3},
+}
+
+
+def _entry(i):
+    return {
+        "id": f"entry_{i}",
+        "evaluation_id": "run_123",
+        "chat_test_case": {"messages": [{"role": "user", "content": f"Q{i}"}]},
+    }
+
+
+class FakeHub:
+    """Minimal in-memory Hub serving the local evaluation endpoints."""
+
+    def __init__(self, n_entries=3, fail_submit_for=()):
+        self.entries = [_entry(i) for i in range(n_entries)]
+        self.fail_submit_for = set(fail_submit_for)
+        self.submitted = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request):
+        path = request.url.path
+        if path.endswith("/_health"):
+            return httpx.Response(200, json={"status": "ok"})
+        if path.endswith("/evaluations/local"):
+            return httpx.Response(200, json=_RUN)
+        if path.endswith("/results"):
+            return httpx.Response(200, json={"items": self.entries})
+        if path.endswith("/submit-local"):
+            entry_id = path.split("/")[-2]
+            if entry_id in self.fail_submit_for:
+                return httpx.Response(500, json={"message": "boom"})
+            with self.lock:
+                self.submitted[entry_id] = json.loads(request.content)
+            return httpx.Response(200, json=_entry(0))
+        return httpx.Response(200, json=_RUN)
+
+    def client(self):
+        return HubClient(
+            hub_url="https://hub.example.com",
+            api_key="test-key",
+            http_client=httpx.Client(transport=httpx.MockTransport(self)),
+        )
+
+    def async_client(self):
+        return AsyncHubClient(
+            hub_url="https://hub.example.com",
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self)),
+        )
+
+
+def test_local_evaluation_submits_every_entry():
+    hub = FakeHub()
+
+    run = hub.client().evaluate(
+        dataset="ds_123", model=lambda messages: messages[-1].content.lower()
+    )
+
+    assert isinstance(run, EvaluationRun)
+    assert set(hub.submitted) == {"entry_0", "entry_1", "entry_2"}
+    assert hub.submitted["entry_1"]["output"]["response"] == {
+        "role": "assistant",
+        "content": "q1",
+    }
+
+
+def test_local_evaluation_runs_entries_concurrently():
+    hub = FakeHub(n_entries=8)
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def slow_model(messages):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return "ok"
+
+    hub.client().evaluate(dataset="ds_123", model=slow_model, concurrency=4)
+
+    assert len(hub.submitted) == 8
+    assert 1 < max_active <= 4
+
+
+def test_local_evaluation_isolates_model_errors():
+    hub = FakeHub()
+
+    def flaky_model(messages):
+        if messages[-1].content == "Q1":
+            raise RuntimeError("model crashed")
+        return "ok"
+
+    hub.client().evaluate(dataset="ds_123", model=flaky_model, concurrency=2)
+
+    assert set(hub.submitted) == {"entry_0", "entry_1", "entry_2"}
+    errored = hub.submitted["entry_1"]["output"]
+    assert errored["response"] is None
+    assert errored["error"]["message"] == "model crashed"
+    assert hub.submitted["entry_2"]["output"]["response"]["content"] == "ok"
+
+
+def test_local_evaluation_warns_on_submission_errors():
+    hub = FakeHub(fail_submit_for={"entry_0"})
+
+    with pytest.warns(UserWarning, match="Failed to submit 1 local evaluation"):
+        run = hub.client().evaluate(
+            dataset="ds_123", model=lambda m: "ok", concurrency=2
+        )
+
+    assert set(hub.submitted) == {"entry_1", "entry_2"}
+    assert list(run.submission_errors) == ["entry_0"]
+    assert isinstance(run.submission_errors["entry_0"], HubAPIError)
+
+    # The errors are kept when the run is refreshed
+    run.refresh()
+    assert list(run.submission_errors) == ["entry_0"]
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_local_evaluation_aborts_when_the_model_keeps_failing(concurrency):
+    hub = FakeHub(n_entries=20)
+    calls = []
+
+    def broken_model(messages):
+        calls.append(messages)
+        raise RuntimeError("missing API key")
+
+    with pytest.raises(RuntimeError, match="missing API key"):
+        hub.client().evaluate(
+            dataset="ds_123", model=broken_model, concurrency=concurrency
+        )
+
+    # Only the failures before the evaluation was aborted are submitted
+    assert len(hub.submitted) < MAX_CONSECUTIVE_MODEL_FAILURES
+    assert len(calls) < 20
+
+
+def test_async_client_local_evaluation_aborts_when_the_model_keeps_failing():
+    hub = FakeHub(n_entries=20)
+
+    async def broken_model(messages):
+        raise RuntimeError("missing API key")
+
+    with pytest.raises(RuntimeError, match="missing API key"):
+        asyncio.run(hub.async_client().evaluate(dataset="ds_123", model=broken_model))
+
+    assert len(hub.submitted) == MAX_CONSECUTIVE_MODEL_FAILURES - 1
+
+
+def test_local_evaluation_rejects_invalid_concurrency():
+    hub = FakeHub()
+
+    with pytest.raises(ValueError):
+        hub.client().evaluate(dataset="ds_123", model=lambda m: "ok", concurrency=0)
+
+
+class _ConcurrencyProbe:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, messages):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return f"async {messages[-1].content}"
+
+
+def test_local_evaluation_with_async_function():
+    hub = FakeHub(n_entries=10)
+    probe = _ConcurrencyProbe()
+
+    async def my_async_model(messages):
+        return await probe(messages)
+
+    hub.client().evaluate(dataset="ds_123", model=my_async_model, concurrency=5)
+
+    assert len(hub.submitted) == 10
+    assert hub.submitted["entry_3"]["output"]["response"]["content"] == "async Q3"
+    assert 1 < probe.max_active <= 5
+
+
+def test_local_evaluation_with_async_local_model_subclass():
+    hub = FakeHub()
+
+    class MyAgent(LocalModel):
+        async def __call__(self, messages, **kwargs):
+            if messages[-1].content == "Q2":
+                raise RuntimeError("agent failure")
+            return ModelOutput(
+                message=ChatMessage(role="assistant", content="agent"),
+                metadata={"source": "agent"},
+            )
+
+    agent = MyAgent(name="agent", description="An async agent")
+    assert agent.is_async
+
+    hub.client().evaluate(dataset="ds_123", model=agent, concurrency=3)
+
+    assert hub.submitted["entry_0"]["output"]["metadata"] == {"source": "agent"}
+    assert hub.submitted["entry_2"]["output"]["error"]["message"] == "agent failure"
+
+
+def test_local_evaluation_with_async_model_inside_running_loop():
+    hub = FakeHub()
+
+    async def my_async_model(messages):
+        return "ok"
+
+    async def _run():
+        # e.g. a Jupyter notebook, where an event loop is already running
+        return hub.client().evaluate(dataset="ds_123", model=my_async_model)
+
+    run = asyncio.run(_run())
+
+    assert isinstance(run, EvaluationRun)
+    assert len(hub.submitted) == 3
+
+
+def test_async_client_local_evaluation_with_async_model():
+    hub = FakeHub(n_entries=6)
+    probe = _ConcurrencyProbe()
+
+    async def my_async_model(messages):
+        return await probe(messages)
+
+    run = asyncio.run(
+        hub.async_client().evaluate(
+            dataset="ds_123", model=my_async_model, concurrency=3
+        )
+    )
+
+    assert isinstance(run, EvaluationRun)
+    assert len(hub.submitted) == 6
+    assert 1 < probe.max_active <= 3
@@ -0,0 +1,132 @@
+import pytest
+
+from giskard_hub._polling import AdaptivePoller
+from giskard_hub.data import _entity
+from giskard_hub.data.scan import ScanResult
+from giskard_hub.data.task import TaskProgress, TaskStatus
+from tests._mocks import mock_hub_client
+
+
+def _progress(current, total=100, status=TaskStatus.RUNNING):
+    return TaskProgress(status=status, current=current, total=total)
+
+
+def test_poller_backs_off_without_progress():
+    poller = AdaptivePoller(min_interval=0.5, max_interval=4, backoff_factor=2)
+
+    delays = [poller.next_delay(_progress(0), now=t) for t in range(6)]
+
+    assert delays == [0.5, 1, 2, 4, 4, 4]
+
+
+def test_poller_backs_off_without_progress_information():
+    poller = AdaptivePoller(min_interval=1, max_interval=10)
+
+    assert [poller.next_delay(None, now=t) for t in range(3)] == [1, 2, 4]
+
+
+def test_poller_predicts_completion_from_progress():
+    poller = AdaptivePoller(min_interval=0.5, max_interval=60)
+
+    assert poller.next_delay(_progress(0), now=0) == 0.5
+    # 10% done in 2 seconds: 18 seconds remaining
+    assert poller.next_delay(_progress(10), now=2) == pytest.approx(18)
+
+
+def test_poller_delay_is_bounded():
+    poller = AdaptivePoller(min_interval=0.5, max_interval=30)
+
+    poller.next_delay(_progress(0), now=0)
+    # 1% done in 10 seconds: prediction capped to the maximum interval
+    assert poller.next_delay(_progress(1), now=10) == 30
+    # Almost done: polled again after the minimum interval
+    assert poller.next_delay(_progress(99), now=40) == 0.5
+
+
+def test_poller_backs_off_from_prediction_when_late():
+    poller = AdaptivePoller(min_interval=0.5, max_interval=60, backoff_factor=2)
+
+    poller.next_delay(_progress(0), now=0)
+    assert poller.next_delay(_progress(50), now=5) == pytest.approx(5)
+    # Finalizing at 100%: back off from the predicted delay
+    assert poller.next_delay(_progress(100), now=10) == 0.5
+    assert poller.next_delay(_progress(100), now=10.5) == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_interval": 0},
+        {"min_interval": 2, "max_interval": 1},
+        {"backoff_factor": 0.5},
+    ],
+)
+def test_poller_validation(kwargs):
+    with pytest.raises(ValueError):
+        AdaptivePoller(**kwargs)
+
+
+def _scan(states):
+    """Return a running scan whose refreshes go through the given states."""
+    client = mock_hub_client()
+    responses = iter(states)
+
+    def retrieve(_, raw=None):
+        current, status = next(responses)
+        return ScanResult.from_dict(_scan_data(current, status), _client=client)
+
+    client.scans.retrieve.side_effect = retrieve
+    return ScanResult.from_dict(_scan_data(0, "running"), _client=client)
+
+
+def _scan_data(current, status):
+    return {
+        "id": "scan_1",
+        "model": {"id": "model_1", "name": "Model"},
+        "project_id": "proj_1",
+        "status": {"state": status, "current": current, "total": 100},
+    }
+
+
+def _record_sleeps(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr(_entity, "sleep", sleep)
+    monkeypatch.setattr(_entity.time, "perf_counter", lambda: clock[0])
+    return sleeps
+
+
+def test_wait_for_completion_polls_adaptively(monkeypatch):
+    sleeps = _record_sleeps(monkeypatch)
+    scan = _scan([(0, "running"), (0, "running"), (25, "running"), (100, "finished")])
+
+    assert scan.wait_for_completion() is scan
+
+    assert scan.is_finished()
+    # Backoff until some progress is made, then wait for the predicted end
+    assert sleeps[:2] == [0.5, 1.0]
+    assert sleeps[2] == pytest.approx(4.5)
+
+
+def test_wait_for_completion_with_fixed_interval(monkeypatch):
+    sleeps = _record_sleeps(monkeypatch)
+    scan = _scan([(0, "running"), (50, "running"), (100, "finished")])
+
+    scan.wait_for_completion(poll_interval=5)
+
+    assert sleeps == [5, 5]
+
+
+def test_wait_for_completion_does_not_sleep_past_timeout(monkeypatch):
+    sleeps = _record_sleeps(monkeypatch)
+    scan = _scan([(0, "running")] * 10)
+
+    with pytest.raises(TimeoutError):
+        scan.wait_for_completion(timeout=3, poll_interval=2)
+
+    assert sleeps == [2, 1]
@@ -1,11 +1,11 @@
 import uuid
-from unittest.mock import MagicMock
 
 import pytest
 
 from giskard_hub.data.scan import ProbeAttempt, ProbeResult, ReviewStatus, Severity
 from giskard_hub.data.task import TaskStatus
 from giskard_hub.resources.scans import ScansResource
+from tests._mocks import mock_hub_client
 
 _TEST_PROBE_ID = str(uuid.uuid4())
 _TEST_SCAN_ID = str(uuid.uuid4())
@@ -127,7 +127,7 @@ class TestProbeAttempt:
 def mock_client():
     """Mock client for testing data model."""
 
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
     mock_client.scans.list_attempts.return_value = [
         ProbeAttempt.from_dict(a)
         for a in [
@@ -252,7 +252,7 @@ class TestProbeResult:
 @pytest.fixture
 def mock_http_client():
     """Mock HTTP client for testing API resources."""
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     def handle_get_response(path, cast_to=None, **kwargs):
         response_data = mock_client.get.return_value
@@ -11,6 +11,7 @@ from giskard_hub.errors import (
     HubValidationError,
 )
 from giskard_hub.resources.projects import ProjectsResource
+from tests._mocks import mock_hub_client
 
 TEST_FAILURE_CATEGORY_DATA = {
     "identifier": "hallucination",
@@ -53,7 +54,7 @@ TEST_PROJECT_LIST_DATA = [
 @pytest.fixture
 def mock_client():
     """Create a mock client for testing."""
-    client = Mock()
+    client = mock_hub_client(Mock)
     return client
 
 
@@ -0,0 +1,152 @@
+import asyncio
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from giskard_hub.client import AsyncHubClient, HubClient
+from giskard_hub.data.evaluation import EvaluationEntry
+from giskard_hub.data.model import Model
+from giskard_hub.data.scan import ProbeAttempt, ProbeResult
+from giskard_hub.errors import HubAPIError
+from giskard_hub.resources.evaluations import EvaluationsResource
+from giskard_hub.resources.models import ModelsResource
+
+_MODEL = {"id": "model_1", "name": "Model", "project_id": "proj_1"}
+_ENTRY = {
+    "id": "entry_1",
+    "evaluation_id": "run_1",
+    "chat_test_case": {"messages": [{"role": "user", "content": "Hi"}]},
+    "results": [],
+    "status": "finished",
+}
+_ATTEMPT = {
+    "id": "attempt_1",
+    "probe_result_id": "probe_1",
+    "messages": [],
+    "metadata": {},
+    "severity": 0,
+    "review_status": "pending",
+    "reason": "",
+}
+
+_RESPONSES = {
+    "/_api/models/model_1": _MODEL,
+    "/_api/models": [_MODEL],
+    "/_api/evaluations/run_1/results": {"items": [_ENTRY]},
+    "/_api/probes/probe_1/attempts": {"items": [_ATTEMPT]},
+}
+
+
+def _handler(request):
+    if request.url.path.endswith("/_health"):
+        return httpx.Response(200, json={"status": "ok"})
+    if request.url.path in _RESPONSES:
+        return httpx.Response(200, json=_RESPONSES[request.url.path])
+    return httpx.Response(404, json={"message": "Not found"})
+
+
+def _hub(**kwargs):
+    return HubClient(
+        hub_url="https://hub.example.com",
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(_handler)),
+        **kwargs,
+    )
+
+
+def test_raw_calls_return_decoded_json():
+    hub = _hub()
+
+    assert hub.models.retrieve("model_1", raw=True) == _MODEL
+    assert hub.models.list("proj_1", raw=True) == [_MODEL]
+    assert hub.evaluations.list_entries("run_1", raw=True) == [_ENTRY]
+    assert hub.scans.list_attempts("probe_1", raw=True) == [_ATTEMPT]
+
+
+def test_entities_are_returned_by_default():
+    hub = _hub()
+
+    assert isinstance(hub.models.retrieve("model_1"), Model)
+    assert isinstance(hub.evaluations.list_entries("run_1")[0], EvaluationEntry)
+    assert isinstance(hub.scans.list_attempts("probe_1")[0], ProbeAttempt)
+
+
+def test_client_raw_responses_can_be_overridden_per_call():
+    hub = _hub(raw_responses=True)
+
+    assert hub.models.retrieve("model_1") == _MODEL
+    assert hub.evaluations.list_entries("run_1") == [_ENTRY]
+    assert isinstance(hub.models.retrieve("model_1", raw=False), Model)
+
+
+def test_raw_calls_raise_api_errors():
+    hub = _hub()
+
+    with pytest.raises(HubAPIError, match="Not found"):
+        hub.models.retrieve("unknown", raw=True)
+
+
+def test_raw_calls_skip_casting_with_mock_client():
+    client = Mock()
+    client.get.return_value = {"items": [_ENTRY]}
+
+    assert EvaluationsResource(client).list_entries("run_1", raw=True) == [_ENTRY]
+    ModelsResource(client).retrieve("model_1", raw=True)
+    client.get.assert_called_with("/models/model_1", cast_to=None)
+
+
+def test_async_raw_calls_return_decoded_json():
+    async def run():
+        async with AsyncHubClient(
+            hub_url="https://hub.example.com",
+            api_key="test-key",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+            raw_responses=True,
+        ) as hub:
+            return (
+                await hub.models.retrieve("model_1"),
+                await hub.scans.list_attempts("probe_1"),
+                await hub.models.retrieve("model_1", raw=False),
+            )
+
+    model, attempts, entity = asyncio.run(run())
+
+    assert model == _MODEL
+    assert attempts == [_ATTEMPT]
+    assert isinstance(entity, Model)
+
+
+def test_entities_refresh_and_wait_with_raw_responses():
+    states = iter(["running", "running", "finished"])
+
+    def handler(request):
+        if request.url.path.endswith("/_health"):
+            return httpx.Response(200, json={"status": "ok"})
+        if request.url.path == "/_api/datasets/ds_1":
+            status = {"state": next(states, "finished"), "current": 1, "total": 2}
+            return httpx.Response(
+                200, json={"id": "ds_1", "name": "D", "status": status}
+            )
+        return _handler(request)
+
+    hub = HubClient(
+        hub_url="https://hub.example.com",
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        raw_responses=True,
+    )
+
+    dataset = hub.datasets.retrieve("ds_1", raw=False)
+    assert dataset.is_running()
+
+    assert dataset.refresh() is dataset
+    assert dataset.wait_for_completion(poll_interval=0) is dataset
+    assert dataset.is_finished()
+
+    # Calls made by the entities keep returning entities
+    probe = ProbeResult.from_dict(
+        {"id": "probe_1", "status": {"state": "finished", "current": 1, "total": 1}},
+        _client=hub,
+    )
+    assert isinstance(probe.attempts[0], ProbeAttempt)
@@ -0,0 +1,196 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from giskard_hub._base_client import AsyncClient, SyncClient
+from giskard_hub._retry import RetryPolicy, parse_retry_after
+from giskard_hub.errors import HubAPIError
+
+_NO_WAIT = RetryPolicy(backoff_base=0, jitter=0)
+
+
+class _Sequence:
+    """Transport handler returning the given responses (or raising errors) in order."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self, request):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _sync_client(handler, retry_policy=_NO_WAIT):
+    return SyncClient(
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(handler), base_url="https://hub"
+        ),
+        retry_policy=retry_policy,
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr("giskard_hub._base_client.time.sleep", delays.append)
+    return delays
+
+
+def test_retries_transient_status_codes(sleeps):
+    handler = _Sequence(
+        httpx.Response(502), httpx.Response(504), httpx.Response(200, json={"a": 1})
+    )
+    client = _sync_client(handler)
+
+    assert client.get("/test") == {"a": 1}
+    assert handler.calls == 3
+    assert client.retry_stats.retries == 2
+    assert client.retry_stats.retried_requests == 1
+    assert client.retry_stats.reasons == {"502": 1, "504": 1}
+
+
+def test_retries_transport_errors(sleeps):
+    request = httpx.Request("GET", "https://hub/test")
+    handler = _Sequence(
+        httpx.ReadError("connection reset", request=request),
+        httpx.Response(200, json=[]),
+    )
+    client = _sync_client(handler)
+
+    assert client.get("/test") == []
+    assert client.retry_stats.reasons == {"ReadError": 1}
+
+
+def test_gives_up_after_max_attempts(sleeps):
+    handler = _Sequence(httpx.Response(503, json={"message": "Unavailable"}))
+    client = _sync_client(handler, RetryPolicy(max_attempts=4, jitter=0))
+
+    with pytest.raises(HubAPIError) as exc_info:
+        client.get("/test")
+
+    assert exc_info.value.status_code == 503
+    assert handler.calls == 4
+    assert sleeps == [0.5, 1.0, 2.0]
+    assert client.retry_stats.exhausted == 1
+
+
+def test_does_not_retry_non_idempotent_methods(sleeps):
+    handler = _Sequence(httpx.Response(502), httpx.Response(200, json={}))
+    client = _sync_client(handler)
+
+    with pytest.raises(HubAPIError):
+        client.post("/test", json={})
+
+    assert handler.calls == 1
+    assert client.retry_stats.retries == 0
+
+
+def test_retries_connection_errors_for_all_methods(sleeps):
+    request = httpx.Request("POST", "https://hub/test")
+    handler = _Sequence(
+        httpx.ConnectError("refused", request=request), httpx.Response(200, json={})
+    )
+    client = _sync_client(handler)
+
+    assert client.post("/test", json={}) == {}
+    assert handler.calls == 2
+
+
+def test_retry_methods_can_be_extended(sleeps):
+    handler = _Sequence(httpx.Response(502), httpx.Response(200, json={}))
+    policy = RetryPolicy(backoff_base=0, retry_methods=frozenset({"PATCH"}))
+    client = _sync_client(handler, policy)
+
+    assert client.patch("/test", json={}) == {}
+    assert handler.calls == 2
+
+
+def test_honors_retry_after_header(sleeps):
+    handler = _Sequence(
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200, json={}),
+    )
+    client = _sync_client(handler)
+
+    client.get("/test")
+
+    assert sleeps == [7.0]
+
+
+def test_does_not_wait_beyond_max_retry_after(sleeps):
+    handler = _Sequence(httpx.Response(429, headers={"Retry-After": "3600"}))
+    client = _sync_client(handler)
+
+    with pytest.raises(HubAPIError):
+        client.get("/test")
+
+    assert handler.calls == 1
+    assert sleeps == []
+
+
+def test_non_retryable_errors_are_raised_immediately(sleeps):
+    handler = _Sequence(httpx.Response(404, json={"message": "Not found"}))
+    client = _sync_client(handler)
+
+    with pytest.raises(HubAPIError):
+        client.get("/test")
+
+    assert handler.calls == 1
+
+
+def test_retry_can_be_disabled(sleeps):
+    handler = _Sequence(httpx.Response(502))
+    client = _sync_client(handler, RetryPolicy(max_attempts=1))
+
+    with pytest.raises(HubAPIError):
+        client.get("/test")
+
+    assert handler.calls == 1
+
+
+def test_backoff_is_capped_and_jittered():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=0.5)
+
+    for attempt, upper in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+        delay = policy.backoff_delay(attempt)
+        assert upper * 0.5 <= delay <= upper
+
+
+def test_invalid_policies():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("invalid") is None
+
+    in_a_minute = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 50 < parse_retry_after(format_datetime(in_a_minute, usegmt=True)) <= 60
+
+
+def test_async_client_retries(monkeypatch):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr("giskard_hub._base_client.asyncio.sleep", no_sleep)
+    handler = _Sequence(httpx.Response(503), httpx.Response(200, json={"ok": True}))
+    client = AsyncClient(
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="https://hub"
+        ),
+        retry_policy=_NO_WAIT,
+    )
+
+    assert asyncio.run(client.get("/test")) == {"ok": True}
+    assert client.retry_stats.retries == 1
@@ -1,11 +1,24 @@
+import asyncio
+import threading
 import uuid
-from unittest.mock import MagicMock
 
+import httpx
 import pytest
 
-from giskard_hub.data.scan import ProbeResult, ScanGrade, ScanResult
+from giskard_hub.client import AsyncHubClient, HubClient
+from giskard_hub.data.scan import (
+    AttemptStats,
+    ProbeAttempt,
+    ProbeResult,
+    ProbeSummary,
+    ScanCategory,
+    ScanGrade,
+    ScanResult,
+    Severity,
+)
 from giskard_hub.data.task import TaskStatus
-from giskard_hub.resources.scans import ScansResource
+from giskard_hub.resources.scans import AsyncScansResource, ScansResource
+from tests._mocks import mock_hub_client
 
 _TEST_PROBE_ID = str(uuid.uuid4())
 _TEST_SCAN_ID = str(uuid.uuid4())
@@ -59,7 +72,7 @@ _test_probe = {
 @pytest.fixture
 def mock_client():
     """Mock client for testing."""
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     # GET /scans/{scan_id}/probes to get probe results for a scan
     mock_client.scans.list_probes.return_value = [
@@ -237,7 +250,7 @@ class TestScanResultDataModel:
 @pytest.fixture
 def mock_http_client():
     """Mock HTTP client for testing API resources."""
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     def handle_get_response(path, cast_to=None, **kwargs):
         response_data = mock_client.get.return_value
@@ -348,3 +361,293 @@ class TestScanResultResource:
         probe = probes[0]
         assert probe.id == _TEST_PROBE_ID
         assert probe.scan_result_id == _TEST_SCAN_ID
+
+
+def test_scan_result_print_metrics_fetches_attempts_concurrently(capsys):
+    probes = [
+        {**_test_probe, "id": f"probe_{i}", "probe_name": f"Probe {i} Probe"}
+        for i in range(4)
+    ]
+    running_probe = {
+        **_test_probe,
+        "id": "probe_running",
+        "probe_name": "Running",
+        "status": {"state": "running", "total": 100, "current": 10},
+    }
+
+    client = mock_hub_client()
+    client.scans.list_categories.return_value = [
+        ScanCategory(id="Category A", title="Prompt injection", description="")
+    ]
+    client.scans.list_probes.return_value = [
+        ProbeResult.from_dict(p, _client=client) for p in probes + [running_probe]
+    ]
+
+    # Every request waits until all of them are in flight
+    barrier = threading.Barrier(len(probes), timeout=5)
+
+    def list_attempts(probe_result_id, raw=None):
+        assert raw is True
+        barrier.wait()
+        severities = [Severity.MAJOR, Severity.SAFE, Severity.MINOR]
+        return [{"probe_result_id": probe_result_id, "severity": s} for s in severities]
+
+    client.scans.list_attempts.side_effect = list_attempts
+
+    scan = ScanResult.from_dict(_test_scan, _client=client)
+    scan.print_metrics(max_workers=len(probes))
+
+    output = capsys.readouterr().out
+    assert client.scans.list_attempts.call_count == len(probes)
+    assert output.count("Prompt injection") == len(probes) + 1
+    assert output.count("2 issues / 3 attacks") == len(probes)
+    assert "RUNNING" in output
+
+
+def _summary_client(probes):
+    client = mock_hub_client()
+    client.scans.list_categories.return_value = []
+    client.scans.list_probes.return_value = [
+        ProbeResult.from_dict(p, _client=client) for p in probes
+    ]
+    client.scans.list_attempts.return_value = [
+        {"severity": Severity.CRITICAL.value},
+        {"severity": Severity.SAFE.value},
+    ]
+    return client
+
+
+def test_scan_result_summary_uses_probe_metrics():
+    with_metrics = {
+        **_test_probe,
+        "id": "with_metrics",
+        "probe_name": "With metrics",
+        "metrics": [
+            {"severity": Severity.SAFE.value, "count": 7},
+            {"severity": Severity.MINOR.value, "count": 2},
+            {"severity": Severity.MAJOR.value, "count": 1},
+            {"severity": Severity.CRITICAL.value, "count": 0},
+        ],
+    }
+    without_metrics = {**_test_probe, "id": "without_metrics", "probe_name": "B"}
+    client = _summary_client([with_metrics, without_metrics])
+
+    scan = ScanResult.from_dict(_test_scan, _client=client)
+    summaries = {s.probe_name: s for s in scan.summary()}
+
+    # Attempts are only fetched for the probe without metrics
+    client.scans.list_attempts.assert_called_once_with("without_metrics", raw=True)
+    assert summaries["With metrics"] == ProbeSummary(
+        category="Category A",
+        probe_name="With metrics",
+        severity=Severity.MAJOR,
+        num_issues=3,
+        num_attacks=10,
+    )
+    assert summaries["B"].severity == Severity.CRITICAL
+    assert summaries["B"].num_issues == 1
+    assert summaries["B"].num_attacks == 2
+
+
+def test_scan_result_summary_without_fast_path_fetches_attempts():
+    probe = {
+        **_test_probe,
+        "metrics": [{"severity": Severity.SAFE.value, "count": 5}],
+    }
+    client = _summary_client([probe])
+
+    scan = ScanResult.from_dict(_test_scan, _client=client)
+    (summary,) = scan.summary(fast=False)
+
+    client.scans.list_attempts.assert_called_once()
+    assert summary.num_attacks == 2
+
+
+def test_scan_result_print_metrics_fast(capsys):
+    probe = {
+        **_test_probe,
+        "metrics": [{"severity": Severity.MAJOR.value, "count": 4}],
+    }
+    client = _summary_client([probe])
+
+    scan = ScanResult.from_dict(_test_scan, _client=client)
+    scan.print_metrics(fast=True)
+
+    client.scans.list_attempts.assert_not_called()
+    assert "4 issues / 4 attacks" in capsys.readouterr().out
+
+
+def _attempts_http_client(num_probes, severities):
+    probes = [
+        {**_test_probe, "id": f"probe_{i}", "probe_category": f"Category {i % 2}"}
+        for i in range(num_probes)
+    ]
+    requested = []
+
+    def get(path, **kwargs):
+        if path.endswith("/probes"):
+            return {"items": probes}
+        probe_id = path.split("/")[-2]
+        requested.append(probe_id)
+        return {
+            "items": [
+                {
+                    "id": f"{probe_id}_{j}",
+                    "probe_result_id": probe_id,
+                    "messages": [],
+                    "metadata": {},
+                    "severity": severity.value,
+                    "review_status": "pending",
+                    "reason": "",
+                }
+                for j, severity in enumerate(severities)
+            ]
+        }
+
+    client = mock_hub_client()
+    client.raw_responses = False
+    client.get.side_effect = get
+    return client, requested
+
+
+def test_scan_resource_iter_attempts_filters_and_counts():
+    severities = [Severity.SAFE, Severity.MINOR, Severity.CRITICAL]
+    client, _ = _attempts_http_client(3, severities)
+
+    stats = AttemptStats()
+    results = list(
+        ScansResource(client).iter_attempts(
+            _TEST_SCAN_ID, min_severity=Severity.MINOR, stats=stats
+        )
+    )
+
+    assert [a.id for a in results] == [
+        f"probe_{i}_{j}" for i in range(3) for j in (1, 2)
+    ]
+    assert all(isinstance(a, ProbeAttempt) for a in results)
+    # Attempts filtered out are still counted
+    assert stats.total == 9
+    assert stats.by_category == {"Category 0": 6, "Category 1": 3}
+    assert stats.by_severity == {s: 3 for s in severities}
+    assert stats.counts["Category 1"] == {s: 1 for s in severities}
+
+
+def test_scan_resource_iter_attempts_reads_ahead():
+    client, requested = _attempts_http_client(10, [Severity.MAJOR])
+
+    stats = AttemptStats()
+    attempts = ScansResource(client).iter_attempts(
+        _TEST_SCAN_ID, stats=stats, prefetch=2, raw=True
+    )
+    first = next(attempts)
+    assert first["probe_result_id"] == "probe_0"
+
+    # The current probe and the next two ones are requested, and no further
+    for _ in range(100):
+        if len(requested) >= 4:
+            break
+        threading.Event().wait(0.01)
+    assert sorted(requested) == ["probe_0", "probe_1", "probe_2", "probe_3"]
+
+    rest = list(attempts)
+    assert [a["probe_result_id"] for a in rest] == [f"probe_{i}" for i in range(1, 10)]
+    assert stats.total == 10
+
+
+def test_scan_resource_iter_attempts_without_prefetch():
+    client, requested = _attempts_http_client(3, [Severity.SAFE])
+
+    stats = AttemptStats()
+    attempts = ScansResource(client).iter_attempts(
+        _TEST_SCAN_ID, stats=stats, prefetch=0
+    )
+    next(attempts)
+    assert requested == ["probe_0"]
+
+    attempts.close()
+    assert requested == ["probe_0"]
+    assert stats.total == 1
+
+    with pytest.raises(ValueError):
+        next(ScansResource(client).iter_attempts(_TEST_SCAN_ID, prefetch=-1))
+
+
+def test_async_scan_resource_iter_attempts():
+    client, requested = _attempts_http_client(4, [Severity.SAFE, Severity.MAJOR])
+    get = client.get.side_effect
+
+    async def async_get(path, **kwargs):
+        return get(path, **kwargs)
+
+    client.get = async_get
+
+    stats = AttemptStats()
+
+    async def _run():
+        attempts = AsyncScansResource(client).iter_attempts(
+            _TEST_SCAN_ID, min_severity=Severity.MAJOR, stats=stats
+        )
+        return [a async for a in attempts]
+
+    results = asyncio.run(_run())
+
+    assert [a.probe_result_id for a in results] == [f"probe_{i}" for i in range(4)]
+    assert all(a.severity == Severity.MAJOR for a in results)
+    assert sorted(requested) == [f"probe_{i}" for i in range(4)]
+    assert stats.by_severity == {Severity.SAFE: 4, Severity.MAJOR: 4}
+
+
+def _scan_hub_handler(probes, requested):
+    def handler(request):
+        path = request.url.path
+        if path.endswith("/_health"):
+            return httpx.Response(200, json={"status": "ok"})
+        requested.append(path)
+        if path.endswith("/categories"):
+            categories = [{"id": "Category A", "title": "Jailbreak", "description": ""}]
+            return httpx.Response(200, json={"items": categories})
+        if path.endswith("/probes"):
+            return httpx.Response(200, json={"items": probes})
+        return httpx.Response(
+            200,
+            json={"items": [{"severity": Severity.MAJOR.value}, {"severity": 0}]},
+        )
+
+    return handler
+
+
+@pytest.mark.parametrize("is_async", [False, True], ids=["sync", "async"])
+def test_scan_result_summary_and_print_metrics_with_any_client(is_async, capsys):
+    probes = [
+        {**_test_probe, "id": f"probe_{i}", "probe_name": f"Probe {i}"}
+        for i in range(3)
+    ]
+    requested = []
+    transport = httpx.MockTransport(_scan_hub_handler(probes, requested))
+    options = {"hub_url": "https://hub.example.com", "api_key": "test-key"}
+
+    if is_async:
+        client = AsyncHubClient(
+            http_client=httpx.AsyncClient(transport=transport), **options
+        )
+        scan = ScanResult.from_dict(_test_scan, _client=client)
+
+        async def _run():
+            summaries = await scan.summary(fast=False, max_workers=2)
+            await scan.print_metrics(max_workers=2)
+            return summaries
+
+        summaries = asyncio.run(_run())
+    else:
+        client = HubClient(http_client=httpx.Client(transport=transport), **options)
+        scan = ScanResult.from_dict(_test_scan, _client=client)
+        summaries = scan.summary(fast=False, max_workers=2)
+        scan.print_metrics(max_workers=2)
+
+    assert [s.probe_name for s in summaries] == ["Probe 0", "Probe 1", "Probe 2"]
+    assert all(s.category == "Jailbreak" for s in summaries)
+    assert all((s.num_issues, s.num_attacks) == (1, 2) for s in summaries)
+    assert capsys.readouterr().out.count("1 issue / 2 attacks") == 3
+    # The categories are cached by the resource
+    assert requested.count("/_api/scans/categories") == 1
+    assert requested.count("/_api/probes/probe_0/attempts") == 2
@@ -1,5 +1,4 @@
 from datetime import datetime
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -11,12 +10,13 @@ from giskard_hub.data.scheduled_evaluation import (
 )
 from giskard_hub.errors import HubValidationError
 from giskard_hub.resources.scheduled_evaluations import ScheduledEvaluationsResource
+from tests._mocks import mock_hub_client
 
 
 @pytest.fixture
 def mock_client():
     """Mock client for testing."""
-    mock_client = MagicMock()
+    mock_client = mock_hub_client()
 
     def handle_get_response(path, cast_to=None, **kwargs):
         response_data = mock_client.get.return_value
@@ -0,0 +1,186 @@
+import httpx
+import pytest
+
+from giskard_hub import _waiting
+from giskard_hub.client import HubClient
+from giskard_hub.data.evaluation import EvaluationRun
+
+_MODEL = {"id": "model_1", "name": "Model", "project_id": "proj_1"}
+
+
+def _run(run_id, current, total=10, project_id="proj_1"):
+    state = "finished" if current >= total else "running"
+    return {
+        "id": run_id,
+        "name": run_id,
+        "project_id": project_id,
+        "model": _MODEL,
+        "datasets": [],
+        "metrics": [],
+        "status": {"state": state, "current": current, "total": total},
+    }
+
+
+class _Hub:
+    """Fake Hub where each run progresses by `speed` at each request."""
+
+    def __init__(self, speeds, project_ids=None):
+        self.speeds = speeds
+        self.project_ids = project_ids or {}
+        self.steps = dict.fromkeys(speeds, 0)
+        self.requests = []
+
+    def run(self, run_id):
+        return _run(
+            run_id,
+            min(10, self.steps[run_id] * self.speeds[run_id]),
+            project_id=self.project_ids.get(run_id, "proj_1"),
+        )
+
+    def __call__(self, request):
+        path = request.url.path
+        if path.endswith("/_health"):
+            return httpx.Response(200, json={"status": "ok"})
+
+        self.requests.append(path)
+        if path == "/_api/evaluations":
+            project_id = request.url.params["project_id"]
+            runs = [r for r in self.steps if self.run(r)["project_id"] == project_id]
+            for run_id in runs:
+                self.steps[run_id] += 1
+            return httpx.Response(200, json=[self.run(r) for r in runs])
+
+        run_id = path.rsplit("/", 1)[-1]
+        self.steps[run_id] += 1
+        return httpx.Response(200, json=self.run(run_id))
+
+    def client(self):
+        return HubClient(
+            hub_url="https://hub.example.com",
+            api_key="test-key",
+            http_client=httpx.Client(transport=httpx.MockTransport(self)),
+        )
+
+
+@pytest.fixture(autouse=True)
+def _fake_clock(monkeypatch):
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(delay):
+        sleeps.append(delay)
+        clock[0] += delay
+
+    monkeypatch.setattr(_waiting.time, "sleep", sleep)
+    monkeypatch.setattr(_waiting.time, "perf_counter", lambda: clock[0])
+    return sleeps
+
+
+def _runs(hub, client):
+    return [EvaluationRun.from_dict(hub.run(r), _client=client) for r in hub.steps]
+
+
+def test_as_completed_yields_entities_as_they_finish():
+    hub = _Hub({"slow": 2, "fast": 10, "medium": 5})
+    client = hub.client()
+
+    completed = [run.id for run in client.as_completed(_runs(hub, client))]
+
+    assert completed == ["fast", "medium", "slow"]
+
+
+def test_wait_all_refreshes_a_project_with_list_requests(monkeypatch):
+    monkeypatch.setattr(_waiting, "LIST_REFRESH_MIN_PENDING", 2)
+    hub = _Hub({"a": 2, "b": 5, "c": 10})
+    client = hub.client()
+
+    runs = client.wait_all(_runs(hub, client))
+
+    assert [run.id for run in runs] == ["a", "b", "c"]
+    assert all(run.is_finished() for run in runs)
+    # The last pending run is retrieved on its own
+    assert hub.requests == ["/_api/evaluations"] * 2 + ["/_api/evaluations/a"] * 3
+
+
+def test_few_pending_entities_of_a_project_are_retrieved():
+    hub = _Hub({"a": 2, "b": 5, "c": 10})
+    client = hub.client()
+
+    client.wait_all(_runs(hub, client))
+
+    assert "/_api/evaluations" not in hub.requests
+
+
+def test_large_project_is_listed_once(monkeypatch):
+    monkeypatch.setattr(_waiting, "LIST_REFRESH_MIN_PENDING", 2)
+    hub = _Hub({"a": 2, "b": 5, "c": 5})
+    client = hub.client()
+    runs = _runs(hub, client)
+    # Finished runs of the project, listed along with the pending ones
+    hub.speeds.update({f"old_{i}": 10 for i in range(20)})
+    hub.steps.update({f"old_{i}": 1 for i in range(20)})
+
+    client.wait_all(runs)
+
+    assert hub.requests.count("/_api/evaluations") == 1
+    assert hub.requests[0] == "/_api/evaluations"
+
+
+def test_single_pending_entity_is_retrieved():
+    hub = _Hub({"a": 5, "b": 5}, project_ids={"b": "proj_2"})
+    client = hub.client()
+
+    client.wait_all(_runs(hub, client))
+
+    assert set(hub.requests) == {"/_api/evaluations/a", "/_api/evaluations/b"}
+
+
+def test_completed_entities_are_not_refreshed():
+    hub = _Hub({"done": 10})
+    hub.steps["done"] = 1
+    client = hub.client()
+
+    assert client.wait_all(_runs(hub, client))[0].is_finished()
+    assert not hub.requests
+
+
+def test_wait_all_polls_on_a_single_schedule(_fake_clock):
+    hub = _Hub({"a": 1, "b": 2})
+    client = hub.client()
+
+    client.wait_all(_runs(hub, client), poll_interval=3)
+
+    assert _fake_clock == [3] * 9
+
+
+def test_wait_all_times_out():
+    hub = _Hub({"stuck": 0, "done": 10})
+    client = hub.client()
+
+    with pytest.raises(TimeoutError, match="'stuck'"):
+        client.wait_all(_runs(hub, client), timeout=10)
+
+
+def test_adaptive_polling_follows_the_fastest_entity(_fake_clock):
+    # Progress of each run per second of the fake clock
+    rates = {"fast": 2, "slow": 0.01}
+
+    def handler(request):
+        if request.url.path.endswith("/_health"):
+            return httpx.Response(200, json={"status": "ok"})
+        run_id = request.url.path.rsplit("/", 1)[-1]
+        elapsed = sum(_fake_clock)
+        return httpx.Response(200, json=_run(run_id, int(rates[run_id] * elapsed)))
+
+    client = HubClient(
+        hub_url="https://hub.example.com",
+        api_key="test-key",
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    runs = [EvaluationRun.from_dict(_run(r, 0), _client=client) for r in rates]
+
+    completed = client.as_completed(runs, timeout=3600)
+
+    assert next(completed).id == "fast"
+    # The fast run finishes after 5 seconds, and is noticed shortly after
+    assert sum(_fake_clock) < 8